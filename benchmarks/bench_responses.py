@@ -0,0 +1,253 @@
+"""Benchmarks for constructing the response objects of :mod:`mcc_api.event` from the bytes of a response's body.
+
+Measures, for each response type and size of input:
+
+- the time taken to construct a response (the minimum and median of several runs, with garbage collection enabled),
+- the peak memory allocated while constructing it, and the memory still held by it once constructed,
+- and the number of memory blocks still held by it once constructed (not the number of allocations made while
+  constructing it).
+
+Inputs range from the saved responses in ``tests/event/mock_data`` up to large rundowns and participant lists
+generated using :mod:`mcc_api.event.server`. Run from the root of the repository (with mcc_api installed, or with
+``PYTHONPATH=.``) using:
+
+.. code-block:: shell
+
+   python benchmarks/bench_responses.py --save baseline.json
+   # ... make changes to mcc_api/event/responses.py ...
+   python benchmarks/bench_responses.py --compare baseline.json
+
+When comparing, the change in each measurement is shown, and the script exits with status 1 if any case's median time
+or peak memory grew by more than ``--threshold`` (10% by default), so it can be used to check that an optimisation
+helped and that nothing else regressed. Baselines are only comparable when taken on the same machine, Python version,
+and JSON codec.
+"""
+
+from mcc_api.event import codec
+from mcc_api.event.enums import Game
+from mcc_api.event.responses import BaseResponse, HallOfFameResponse, ParticipantsResponse, RundownResponse
+from mcc_api.event.server import synthetic_participants, synthetic_rundown
+from dataclasses import asdict, dataclass
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+import tracemalloc
+import typing as t
+
+_MOCK_DATA: t.Final[str] = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "event", "mock_data")
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """A single response type and input to benchmark."""
+
+    name: str
+    """Name of the case, such as ``"rundown/large"``."""
+    construct: t.Callable[[bytes], BaseResponse]
+    """Function that constructs the response from its body."""
+    body: bytes
+    """Bytes of the response's body."""
+
+
+@dataclass(slots=True)
+class Result:
+    """Measurements of a single case."""
+
+    input_bytes: int
+    """Size of the response's body."""
+    time_min: float
+    """Shortest time taken to construct the response, in seconds."""
+    time_median: float
+    """Median time taken to construct the response, in seconds."""
+    peak_bytes: int
+    """Peak memory allocated while constructing the response, not including its body."""
+    retained_bytes: int
+    """Memory still allocated once the response has been constructed."""
+    retained_blocks: int
+    """Number of memory blocks still allocated once the response has been constructed."""
+
+
+def _fixture(name: str) -> bytes:
+    with open(os.path.join(_MOCK_DATA, f"200_{name}.json"), "rb") as f:
+        f: t.BinaryIO
+        return f.read()
+
+
+def _encode(data: t.Any) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
+def _synthetic_hall_of_fame(records: int, seed: int = 0) -> dict[str, t.Any]:
+    """Return generated JSON data in the form returned by the `/halloffame` endpoint, with `records` records for every
+    game."""
+    rng: random.Random = random.Random(seed)
+    return {
+        "code": 200,
+        "data": {
+            str(game): {
+                f"RECORD NAME {number}": {
+                    "placement": number - 1,
+                    "player": f"Player{rng.randrange(1000)}",
+                    "value": rng.randrange(100_000) if number % 2 else f"{rng.random():.2f} seconds",
+                    "changedHands": rng.random() < 0.1
+                } for number in range(1, records + 1)
+            } for game in Game
+        }
+    }
+
+
+def cases() -> list[Case]:
+    """Return every case to benchmark, from the smallest input to the largest for each response type."""
+    lazy_rundown: t.Callable[[bytes], RundownResponse] = functools.partial(RundownResponse, lazy=True)
+    rundowns: list[tuple[str, bytes]] = [
+        ("fixture", _fixture("rundown")),
+        ("small", _encode(synthetic_rundown(games=8, players_per_team=4, seed=0))),
+        ("medium", _encode(synthetic_rundown(games=40, players_per_team=8, seed=0))),
+        ("large", _encode(synthetic_rundown(games=200, players_per_team=16, seed=0))),
+        ("xlarge", _encode(synthetic_rundown(games=1000, players_per_team=16, seed=0)))
+    ]
+    return [
+        *(Case(f"rundown/{size}", RundownResponse, body) for size, body in rundowns),
+        *(Case(f"rundown-lazy/{size}", lazy_rundown, body) for size, body in rundowns),
+        Case("participants/fixture", ParticipantsResponse, _fixture("participants")),
+        *(Case(f"participants/{players}-per-team", ParticipantsResponse,
+               _encode(synthetic_participants(players_per_team=players, seed=0))) for players in (4, 32, 256)),
+        Case("halloffame/fixture", HallOfFameResponse, _fixture("halloffame")),
+        *(Case(f"halloffame/{records}-records", HallOfFameResponse, _encode(_synthetic_hall_of_fame(records)))
+          for records in (10, 100, 1000))
+    ]
+
+
+def measure(case: Case, repeat: int) -> Result:
+    """Measure the time and memory taken to construct the case's response."""
+    timer: timeit.Timer = timeit.Timer(lambda: case.construct(case.body), setup="gc.enable()", globals={"gc": gc})
+    number: int = timer.autorange()[0]
+    times: list[float] = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        before_snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        response: BaseResponse = case.construct(case.body)
+        current: int
+        peak: int
+        current, peak = tracemalloc.get_traced_memory()
+        after_snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        del response
+    finally:
+        tracemalloc.stop()
+
+    blocks: int = sum(stat.count_diff for stat in after_snapshot.compare_to(before_snapshot, "filename"))
+    return Result(
+        input_bytes=len(case.body),
+        time_min=min(times),
+        time_median=statistics.median(times),
+        peak_bytes=peak - before,
+        retained_bytes=current - before,
+        retained_blocks=blocks
+    )
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _format_bytes(size: float) -> str:
+    for unit, scale in (("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if size >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size:.0f} B"
+
+
+def _column(text: str, value: float, baseline: t.Optional[float], width: int) -> str:
+    """Return a column of the results table, followed by the change from the baseline if there is one."""
+    if baseline:
+        text += f" ({(value - baseline) / baseline:+.1%})"
+    return f"{text:>{width}}"
+
+
+def main(args: t.Optional[list[str]] = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", "--filter", default="", help="only run cases whose name contains this string")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timing runs per case (default: %(default)s)")
+    parser.add_argument("--stdlib-json", action="store_true", help="decode using the json module instead of the "
+                                                                   "fastest codec installed")
+    parser.add_argument("--save", metavar="PATH", help="save the results as a baseline to compare later runs against")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="proportion by which a case may be slower or use more memory than the baseline before "
+                             "it counts as a regression (default: %(default)s)")
+    options: argparse.Namespace = parser.parse_args(args)
+
+    if options.stdlib_json:
+        codec.set_json_codec()
+    environment: dict[str, str] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "codec": codec.get_json_codec()[0].__module__
+    }
+
+    baseline: dict[str, dict[str, float]] = {}
+    if options.compare:
+        with open(options.compare) as f:
+            f: t.TextIO
+            saved: dict[str, t.Any] = json.load(f)
+        baseline = saved["results"]
+        if saved["environment"] != environment:
+            print(f"Warning: baseline was taken with {saved['environment']}, not {environment}", file=sys.stderr)
+
+    print(f"Python {environment['python']} ({environment['implementation']}, {environment['machine']}), "
+          f"decoding using {environment['codec']}")
+    print(f"{'case':<28} {'input':>10} {'median time':>22} {'peak memory':>22} {'retained memory':>22} {'retained blocks':>16}")
+
+    results: dict[str, Result] = {}
+    regressions: list[str] = []
+    for case in cases():
+        if options.filter not in case.name:
+            continue
+        result: Result = measure(case, options.repeat)
+        results[case.name] = result
+        previous: dict[str, float] = baseline.get(case.name, {})
+        print(" ".join([
+            f"{case.name:<28}",
+            f"{_format_bytes(result.input_bytes):>10}",
+            _column(_format_time(result.time_median), result.time_median, previous.get("time_median"), 22),
+            _column(_format_bytes(result.peak_bytes), result.peak_bytes, previous.get("peak_bytes"), 22),
+            _column(_format_bytes(result.retained_bytes), result.retained_bytes, previous.get("retained_bytes"), 22),
+            _column(str(result.retained_blocks), result.retained_blocks, previous.get("retained_blocks"), 16)
+        ]))
+
+        for measurement in ("time_median", "peak_bytes"):
+            if previous.get(measurement) and \
+                    getattr(result, measurement) > previous[measurement] * (1 + options.threshold):
+                regressions.append(f"{case.name} {measurement}")
+
+    if options.save:
+        with open(options.save, "w") as f:
+            f: t.TextIO
+            json.dump({"environment": environment, "results": {name: asdict(result)
+                                                                for name, result in results.items()}}, f, indent=4)
+        print(f"Saved results to {options.save}")
+
+    if regressions:
+        print(f"Regressed by more than {options.threshold:.0%} compared to the baseline: {', '.join(regressions)}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
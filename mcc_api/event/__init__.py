@@ -1,9 +1,16 @@
-from .. import __user_agent
+from ..instrumentation import Hook
+from .archive import RundownArchive
+from .cache import ErrorCache, ResponseCache
+from .client import EventClient
+from .codec import get_json_codec, set_json_codec
 from .enums import (
     Game,
     Team
 )
+from .exceptions import InvalidEventError, InvalidParticipantError
+from .limiter import TokenBucket
 from .responses import (
+    Creator,
     EventInformationResponse,
     EventsResponse,
     HallOfFameGameResponse,
@@ -13,70 +20,218 @@ from .responses import (
     ParticipantsTeamResponse,
     RundownResponse
 )
-import ratelimit
-import requests
+from .retry import RetryPolicy
 import typing as t
 import warnings
 
 __all__ = [
+    "add_request_hook",
+    "archive_rundowns",
+    "configure_session",
+    "get_default_client",
+    "get_error_cache",
     "get_event",
     "get_events",
     "get_hall_of_fame",
-    "get_rundown",
+    "get_json_codec",
     "get_participant",
     "get_participants",
+    "get_participants_by_uuid",
+    "get_rate_limiter",
+    "get_response_cache",
+    "get_retry_policy",
+    "get_rundown",
+    "get_rundown_archive",
+    "get_rundowns",
+    "iter_rundowns",
+    "remove_request_hook",
+    "set_default_client",
+    "set_error_cache",
+    "set_json_codec",
+    "set_rate_limiter",
+    "set_response_cache",
+    "set_retry_policy",
+    "set_rundown_archive",
 
+    # aio and columnar are left out, so that importing * does not require their optional dependencies
+    "archive",
+    "cache",
+    "client",
+    "codec",
+    "diff",
     "enums",
     "exceptions",
-    "responses"
+    "limiter",
+    "responses",
+    "retry",
+    "server",
+    "singleflight",
+    "uuids",
+    "watcher"
 ]
 
-__base_url: t.Final[str] = "https://api.mcchampionship.com/v1"
+__client: EventClient = EventClient()
 
 
-@ratelimit.sleep_and_retry
-@ratelimit.limits(calls=200, period=60)
-def __request(endpoint: str, timeout: int) -> requests.Response:
-    """Make and return a request to the given endpoint of the MCC API.
-    
-    Limited to 200 calls per minute, and will sleep until the rate limit resets if exceeded.
-    Timeout parameter is passed to requests module directly."""
-    return requests.get(
-        f"{__base_url.rstrip('/')}/{endpoint}",
-        headers={"User-Agent": __user_agent},
-        timeout=timeout
-    )
+def get_default_client() -> EventClient:
+    """Return the client that the functions in this module delegate to."""
+    return __client
+
+
+def set_default_client(client: EventClient) -> None:
+    """Replace the client that the functions in this module delegate to, such as to point them at a different base URL.
+
+    Also used by :mod:`mcc_api.event.aio`, whose requests are made using the client's settings, caches, and rundown
+    archive. The previous client is not closed."""
+    global __client
+    __client = client
+
+
+def configure_session(*, pool_size: int = 10, max_retries: int = 2, keep_alive: bool = True) -> None:
+    """Replace the HTTP session shared by all requests made to the MCC Event API by the default client.
+
+    - `pool_size` is the maximum number of connections kept open at once, and should be at least the number of
+      threads making requests concurrently. Defaults to 10.
+    - `max_retries` is the number of times a request will be retried if a connection to the API could not be made.
+      Defaults to 2.
+    - `keep_alive` controls whether connections are reused between requests. Defaults to True.
+
+    Any connections held by the previous session are closed.
+    """
+    __client.configure_session(pool_size=pool_size, max_retries=max_retries, keep_alive=keep_alive)
+
+
+def get_rate_limiter() -> TokenBucket:
+    """Return the rate limiter shared by all requests made to the MCC Event API.
+
+    The limiter can be used to check how long the next request would wait for (using
+    :meth:`~mcc_api.event.limiter.TokenBucket.wait_time`), or to reserve capacity ahead of making requests."""
+    return __client.limiter
+
+
+def set_rate_limiter(limiter: TokenBucket) -> None:
+    """Replace the rate limiter shared by all requests made to the MCC Event API, including those made by
+    :mod:`mcc_api.event.aio`.
+
+    By default, requests are limited to 200 calls per minute using a :class:`~mcc_api.event.limiter.TokenBucket`,
+    which only limits requests made by the current process. To share one limit between multiple processes on the same
+    host, use a :class:`~mcc_api.event.limiter.FileTokenBucket` instead."""
+    __client.limiter = limiter
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the policy used to retry failed requests to the MCC Event API, unless overridden for a single call."""
+    return __client.retry
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """Set the policy used to retry failed requests to the MCC Event API, including those made by
+    :mod:`mcc_api.event.aio`, unless overridden for a single call using the `retry` parameter.
+
+    By default, requests that time out, fail to connect, or are responded to with a 429 or 5xx status code are made up
+    to 3 times, as described by :class:`~mcc_api.event.retry.RetryPolicy`. To disable retries, set a policy with
+    `attempts` set to 1. If a 5xx (or any other unexpected) status code is still returned once the attempts have run
+    out, an :class:`mcc_api.exceptions.UnexpectedStatusError` is raised."""
+    __client.retry = policy
+
+
+def add_request_hook(hook: Hook) -> None:
+    """Add a function to be called with the measurements of each call made to the MCC Event API by the default client,
+    including those made by :mod:`mcc_api.event.aio`, once it has finished.
+
+    The function is passed a :class:`~mcc_api.instrumentation.RequestMetrics` object describing the call, including the
+    time spent waiting for the rate limiter, waiting for the API, and parsing the response. Exceptions raised by the
+    function are logged rather than raised. See :mod:`mcc_api.instrumentation` for hooks that aggregate measurements
+    or record them as OpenTelemetry spans."""
+    __client.add_request_hook(hook)
+
+
+def remove_request_hook(hook: Hook) -> None:
+    """Remove a function added using :func:`add_request_hook`.
+
+    - May raise :class:`ValueError` if the function has not been added."""
+    __client.remove_request_hook(hook)
+
+
+def get_response_cache() -> t.Optional[ResponseCache]:
+    """Return the cache used for responses from the MCC Event API, or None if caching is disabled."""
+    return __client.cache
 
 
-def get_event(*, timeout: int = 5) -> EventInformationResponse:
+def set_response_cache(cache: t.Optional[ResponseCache]) -> None:
+    """Set the cache used for responses from the MCC Event API, or disable caching by passing None.
+
+    Caching is disabled by default. When enabled, the `get_*` functions return a cached
+    :class:`~mcc_api.event.responses.BaseResponse` for as long as the response from that endpoint is valid, as
+    configured by the :class:`~mcc_api.event.cache.ResponseCache`, without making a request."""
+    __client.cache = cache
+
+
+def get_error_cache() -> t.Optional[ErrorCache]:
+    """Return the cache used for exceptions raised for endpoints that returned a 404 status code, or None if negative
+    caching is disabled."""
+    return __client.error_cache
+
+
+def set_error_cache(cache: t.Optional[ErrorCache]) -> None:
+    """Set the cache used for exceptions raised for endpoints that returned a 404 status code, or disable negative
+    caching by passing None.
+
+    Negative caching is disabled by default. When enabled, the `get_*` functions raise the same type of exception
+    again without making a request for as long as the exception is cached, as configured by the
+    :class:`~mcc_api.event.cache.ErrorCache`."""
+    __client.error_cache = cache
+
+
+def get_rundown_archive() -> t.Optional[RundownArchive]:
+    """Return the archive of finished events' rundowns, or None if archiving is disabled."""
+    return __client.archive
+
+
+def set_rundown_archive(archive: t.Optional[RundownArchive]) -> None:
+    """Set the archive of finished events' rundowns, or disable archiving by passing None.
+
+    Archiving is disabled by default. When enabled, :func:`get_rundown` returns the archived rundown for an event
+    without making a request if there is one, and archives the rundowns of finished events that it requests."""
+    __client.archive = archive
+
+
+def get_event(*, timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None) -> EventInformationResponse:
     """Get event data for the current event cycle.
     
     - Calls the `/event <https://api.mcchampionship.com/docs/#/v1/AppController_getEventInformation>`_ endpoint.
     - Returns an :class:`mcc_api.EventInformationResponse` representing the current event cycle's event.
     - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out specified by the
-      `timeout` parameter and defaulting to 5.
+      `timeout` parameter and defaulting to the timeout of the default client.
+    - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+      :func:`set_retry_policy`.
     """
-    return EventInformationResponse(__request("event", timeout))
+    return __client.get_event(timeout=timeout, retry=retry)
 
 
-def get_events(*, timeout: int = 5) -> EventsResponse:
+def get_events(*, timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None) -> EventsResponse:
     """Get all event keys currently made available by the API.
 
     - Calls the `/events <https://api.mcchampionship.com/docs/#/v1/AppController_getEventKeys>_ endpoint.
     - Returns an :class:`mcc_api.EventsResponse` containing all available event keys.
     - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out specified by the
-    `timeout` parameter and defaulting to 5.
+    `timeout` parameter and defaulting to the timeout of the default client.
+    - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+      :func:`set_retry_policy`.
     """
-    return EventsResponse(__request("events", timeout))
+    return __client.get_events(timeout=timeout, retry=retry)
 
 
 @t.overload
-def get_hall_of_fame(*, timeout: int = 5) -> HallOfFameResponse: ...
+def get_hall_of_fame(*, timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None) -> HallOfFameResponse: ...
 @t.overload
-def get_hall_of_fame(game: Game, *, timeout: int = 5) -> HallOfFameGameResponse: ...
+def get_hall_of_fame(game: Game, *, timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None) -> HallOfFameGameResponse: ...
 
 
-def get_hall_of_fame(game: t.Optional[Game] = None, *, timeout: int = 5):
+def get_hall_of_fame(game: t.Optional[Game] = None, *, timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None):
     """Get hall of fame data, optionally restricted to a single game.
     
     When called with no `game` parameter:
@@ -93,7 +248,9 @@ def get_hall_of_fame(game: t.Optional[Game] = None, *, timeout: int = 5):
 
     In either case:
         - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out specified by the
-          `timeout` parameter and defaulting to 5.
+          `timeout` parameter and defaulting to the timeout of the default client.
+        - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+          :func:`set_retry_policy`.
 
     .. warning::
        The /halloffame endpoint is deprecated and will be removed in a future release of the API.
@@ -102,13 +259,11 @@ def get_hall_of_fame(game: t.Optional[Game] = None, *, timeout: int = 5):
     warnings.warn("The /halloffame endpoint is deprecated and will be removed in a future release of the API. "
                   "See https://github.com/Noxcrew/mcchampionship-api/releases/tag/v1.3.0",
                   DeprecationWarning, stacklevel=2)
-    if game:
-        return HallOfFameGameResponse(__request(f"halloffame/{game}", timeout))
-    else:
-        return HallOfFameResponse(__request("halloffame", timeout))
+    return __client._get_hall_of_fame(game, timeout, retry)
 
 
-def get_rundown(event: t.Optional[str] = None, *, timeout: int = 5) -> RundownResponse:
+def get_rundown(event: t.Optional[str] = None, *, lazy: bool = False, timeout: t.Optional[int] = None,
+                retry: t.Optional[RetryPolicy] = None) -> RundownResponse:
     """Get an event's rundown data.
 
     When called with no `event` parameter:
@@ -120,38 +275,106 @@ def get_rundown(event: t.Optional[str] = None, *, timeout: int = 5) -> RundownRe
           endpoint.
         - Returns a :class:`mcc_api.RundownResponse` representing the given event.
         - May raise an :class:`mcc_api.exceptions.InvalidEventError` exception.
+        - If a rundown archive has been set using :func:`set_rundown_archive`, returns the archived rundown without
+          calling the endpoint if there is one.
 
     In either case:
+        - If `lazy` is True, the games in the event's history are only built when they are accessed (see
+          :class:`mcc_api.responses.LazyHistory`).
         - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out specified by the
-          `timeout` parameter and defaulting to 5.
+          `timeout` parameter and defaulting to the timeout of the default client.
+        - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+          :func:`set_retry_policy`.
     """
-    if event:
-        return RundownResponse(__request(f"rundown/{event}", timeout))
-    else:
-        return RundownResponse(__request("rundown", timeout))
+    return __client.get_rundown(event, lazy=lazy, timeout=timeout, retry=retry)
+
 
+def get_rundowns(events: t.Iterable[str], *, max_workers: int = 8, lazy: bool = False, timeout: t.Optional[int] = None,
+                 retry: t.Optional[RetryPolicy] = None) -> dict[str, RundownResponse | InvalidEventError]:
+    """Get the rundown data of multiple events concurrently.
 
-def get_participant(uuid: str, *, timeout: int = 5) -> ParticipantResponse:
+    - Calls :func:`get_rundown` for each of the given event keys, using a pool of up to `max_workers` threads
+      (defaulting to 8). Requests still count towards the shared rate limit, and so are spaced out by it if needed.
+    - Returns a dictionary mapping each event key to its :class:`mcc_api.RundownResponse`, in the order that the keys
+      were given (with any duplicates removed).
+    - If an event does not exist, its key is mapped to the :class:`mcc_api.exceptions.InvalidEventError` exception that
+      :func:`get_rundown` raised, rather than the exception being raised.
+    - If any other exception is raised while getting a rundown, any requests that have not yet started are cancelled,
+      and the exception for the first such event key (in the order given) is raised.
+    - `lazy`, `timeout`, and `retry` are passed to :func:`get_rundown` for each event.
+    """
+    return __client.get_rundowns(events, max_workers=max_workers, lazy=lazy, timeout=timeout, retry=retry)
+
+
+def iter_rundowns(events: t.Optional[t.Iterable[str]] = None, *, prefetch: int = 0, lazy: bool = False,
+                  timeout: t.Optional[int] = None,
+                  retry: t.Optional[RetryPolicy] = None) -> t.Iterator[tuple[str, RundownResponse | InvalidEventError]]:
+    """Iterate over the rundown data of multiple events, getting each rundown only as it is needed.
+
+    - Yields a tuple of each event key and its :class:`mcc_api.RundownResponse` for each of the given event keys, or
+      for every event key returned by :func:`get_events` if none are given, in order.
+    - No references to a rundown are kept once the next has been yielded, so iterating over every event uses a
+      constant amount of memory (unless a response cache has been set, which will keep its own references).
+    - If `prefetch` is greater than zero, up to that many of the following rundowns are requested in the background
+      while the current one is being used. Requests still count towards the shared rate limit.
+    - If an event does not exist, its key is yielded with the :class:`mcc_api.exceptions.InvalidEventError` exception
+      that :func:`get_rundown` raised, rather than the exception being raised.
+    - `lazy`, `timeout`, and `retry` are passed to :func:`get_rundown` for each event.
+    """
+    return __client.iter_rundowns(events, prefetch=prefetch, lazy=lazy, timeout=timeout, retry=retry)
+
+
+def archive_rundowns(events: t.Optional[t.Iterable[str]] = None, *, timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None) -> list[str]:
+    """Add the rundowns of finished events to the archive set using :func:`set_rundown_archive`.
+
+    - Archives the rundown of each of the given event keys, or of every event key returned by :func:`get_events` if
+      none are given, skipping any that are already archived.
+    - The current event cycle's event (as returned by :func:`get_event`) is never archived, as it may still change.
+      Nor is any other event that has not finished (see :meth:`mcc_api.event.archive.RundownArchive.is_complete`).
+    - Event keys that do not exist are skipped, rather than an :class:`mcc_api.exceptions.InvalidEventError` exception
+      being raised.
+    - Returns a list of the event keys whose rundowns were added to the archive.
+    - May raise a :class:`ValueError` exception if no archive has been set.
+    - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out each request
+      specified by the `timeout` parameter and defaulting to the timeout of the default client.
+    - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+      :func:`set_retry_policy`.
+    """
+    return __client.archive_rundowns(events, timeout=timeout, retry=retry)
+
+
+def get_participant(uuid: str, *, timeout: t.Optional[int] = None,
+                    retry: t.Optional[RetryPolicy] = None) -> ParticipantResponse:
     """Get an individual participant in the current event cycle by their Minecraft UUID.
 
     - Accepts both dashed (e.g. 3e7a89ee-c4e2-4392-a317-444b861b0794) and un-dashed
-      (e.g. 3e7a89eec4e24392a317444b861b0794) UUIDs
+      (e.g. 3e7a89eec4e24392a317444b861b0794) UUIDs, in either case
     - Calls the `/participant <https://api.mcchampionship.com/docs/#/v1/AppController_getParticipant>`_ endpoint.
     - Returns an :class:`mcc_api.ParticipantResponse` representing the individual participant in the current event
       cycle's event.
+    - May raise an :class:`mcc_api.exceptions.InvalidParticipantError` exception.
+    - May raise an :class:`mcc_api.exceptions.InvalidUUIDError` exception (a subclass of both
+      :class:`mcc_api.exceptions.InvalidParticipantError` and :class:`ValueError`) if the UUID is malformed, without
+      calling the endpoint.
     - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out specified by the
-      `timeout` parameter and defaulting to 5.
+      `timeout` parameter and defaulting to the timeout of the default client.
+    - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+      :func:`set_retry_policy`.
     """
-    return ParticipantResponse(__request(f"participant/{uuid}", timeout))
+    return __client.get_participant(uuid, timeout=timeout, retry=retry)
 
 
 @t.overload
-def get_participants(*, timeout: int = 5) -> ParticipantsResponse: ...
+def get_participants(*, timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None) -> ParticipantsResponse: ...
 @t.overload
-def get_participants(team: Team, *, timeout: int = 5) -> ParticipantsTeamResponse: ...
+def get_participants(team: Team, *, timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None) -> ParticipantsTeamResponse: ...
 
 
-def get_participants(team: t.Optional[Team] = None, *, timeout: int = 5):
+def get_participants(team: t.Optional[Team] = None, *, timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None):
     """Get the participants in the current event cycle.
     
     When called with no `team` parameter:
@@ -169,9 +392,30 @@ def get_participants(team: t.Optional[Team] = None, *, timeout: int = 5):
 
     In either case:
         - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out specified by the
-          `timeout` parameter and defaulting to 5.
+          `timeout` parameter and defaulting to the timeout of the default client.
+        - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+          :func:`set_retry_policy`.
+    """
+    return __client.get_participants(team, timeout=timeout, retry=retry)
+
+
+def get_participants_by_uuid(uuids: t.Iterable[str], *, max_age: float = 10, timeout: t.Optional[int] = None,
+                             retry: t.Optional[RetryPolicy] = None) -> dict[str, Creator | InvalidParticipantError]:
+    """Get multiple participants in the current event cycle by their Minecraft UUIDs, using as few requests as possible.
+
+    - Calls the `/participants <https://api.mcchampionship.com/docs/#/v1/AppController_getParticipants>`_ endpoint
+      once, and looks up each UUID in its response. The response is reused by later calls for up to `max_age` seconds
+      (defaulting to 10).
+    - Calls the `/participant <https://api.mcchampionship.com/docs/#/v1/AppController_getParticipant>`_ endpoint only
+      for UUIDs that were not found in the response from the `/participants` endpoint.
+    - Returns a dictionary mapping each of the given UUIDs (in the order that they were given, and in the form that
+      they were given) to its :class:`mcc_api.responses.Creator`.
+    - If a participant does not exist, or their UUID is malformed, their UUID is mapped to the
+      :class:`mcc_api.exceptions.InvalidParticipantError` exception that :func:`get_participant` raised, rather than the
+      exception being raised. Malformed UUIDs do not cause any requests to be made.
+    - May raise a :class:`requests.Timeout` exception, with the number of seconds before timing out each request
+      specified by the `timeout` parameter and defaulting to the timeout of the default client.
+    - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+      :func:`set_retry_policy`.
     """
-    if team:
-        return ParticipantsTeamResponse(__request(f"participants/{team}", timeout))
-    else:
-        return ParticipantsResponse(__request("participants", timeout))
+    return __client.get_participants_by_uuid(uuids, max_age=max_age, timeout=timeout, retry=retry)
@@ -0,0 +1,474 @@
+"""Awaitable equivalents of the functions in :mod:`mcc_api.event`, for use within an asyncio event loop.
+
+Requires the optional `aiohttp <https://docs.aiohttp.org>`_ dependency, which can be installed using
+``pip install mcc-api[aio]``.
+
+Requests are made by an :class:`AsyncEventClient`, using the settings of an :class:`~mcc_api.event.client.EventClient`:
+its base URL, rate limiter, retry policy, response and error caches, rundown archive, and hooks. The functions in this
+module delegate to a default async client, which uses the default client of :mod:`mcc_api.event` (see
+:func:`mcc_api.event.set_default_client`), so their requests count towards the same rate limit and share the same
+caches as the requests it makes. They return the same response objects as their synchronous counterparts, and
+concurrent calls for the same endpoint share a single request, and return the same response object.
+"""
+
+from .. import __user_agent
+from ..instrumentation import _emit, RequestMetrics
+from . import get_default_client
+from .archive import RundownArchive
+from .cache import ErrorCache, ResponseCache
+from .client import _lazy_rundown_response, EventClient
+from .enums import Game, Team
+from .exceptions import InvalidEventError
+from .responses import (
+    BaseResponse,
+    EventInformationResponse,
+    EventsResponse,
+    HallOfFameGameResponse,
+    HallOfFameResponse,
+    ParticipantResponse,
+    ParticipantsResponse,
+    ParticipantsTeamResponse,
+    RundownResponse
+)
+from .retry import _next_delay, _retry_after, RetryPolicy
+from .singleflight import SingleFlight
+from .uuids import canonical_uuid
+import asyncio
+import time
+import typing as t
+import warnings
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError("mcc_api.event.aio requires aiohttp, which can be installed using "
+                      "\"pip install mcc-api[aio]\"") from e
+
+__all__ = [
+    "AsyncEventClient",
+    "close",
+    "get_event",
+    "get_events",
+    "get_hall_of_fame",
+    "get_rundown",
+    "get_rundowns",
+    "get_participant",
+    "get_participants"
+]
+
+_R = t.TypeVar("_R", bound=BaseResponse)
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """Create a :class:`aiohttp.ClientSession` for the running event loop."""
+    return aiohttp.ClientSession(headers={"User-Agent": __user_agent})
+
+
+async def _read(response: aiohttp.ClientResponse, metrics: t.Optional[RequestMetrics]) -> bytes:
+    """Return the body of the given response, recording the time taken to download it in `metrics` if given."""
+    if metrics is None:
+        return await response.read()
+
+    read_started: float = time.perf_counter()
+    body: bytes = await response.read()
+    metrics.download_time += time.perf_counter() - read_started
+    metrics.bytes += len(body)
+    return body
+
+
+class AsyncEventClient:
+    """Asynchronous client for the MCC Event API, owning its own :class:`aiohttp.ClientSession`, and making requests
+    using the settings and caches of an :class:`~mcc_api.event.client.EventClient`:
+
+    .. code-block:: python
+
+       client = mcc_api.event.aio.AsyncEventClient(mcc_api.event.client.EventClient("http://127.0.0.1:8080/v1"))
+       rundown = await client.get_rundown("MCC25")
+       await client.close()
+
+    Each method behaves as the function of the same name in :mod:`mcc_api.event.aio`, except that `timeout` defaults to
+    the timeout of :attr:`client`.
+
+    The session is created when the first request is made, and is replaced (closing the previous session) if a request
+    is made within a different event loop. :meth:`close` should still be awaited before each event loop is closed, as
+    connections opened within a loop can no longer be closed cleanly once it has been closed.
+    """
+
+    _client: t.Optional[EventClient]
+    _session: t.Optional[aiohttp.ClientSession]
+    _session_loop: t.Optional[asyncio.AbstractEventLoop]
+    _in_flight: SingleFlight[BaseResponse]
+
+    def __init__(self: "AsyncEventClient", client: t.Optional[EventClient] = None) -> None:
+        self._client = client
+        self._session = None
+        self._session_loop = None
+        self._in_flight = SingleFlight()
+
+    @property
+    def client(self: "AsyncEventClient") -> EventClient:
+        """Client whose settings and caches are used to make requests.
+
+        If no client was given, this is the default client of :mod:`mcc_api.event` at the time each request is made."""
+        return self._client if self._client is not None else get_default_client()
+
+    async def _get_session(self: "AsyncEventClient") -> aiohttp.ClientSession:
+        """Return the client's session, creating a new one if there is none for the running event loop."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is loop:
+            return self._session
+
+        previous_session: t.Optional[aiohttp.ClientSession] = self._session
+        self._session = _create_session()
+        self._session_loop = loop
+        if previous_session is not None and not previous_session.closed:
+            await previous_session.close()
+        return self._session
+
+    async def close(self: "AsyncEventClient") -> None:
+        """Close the client's session and any connections it holds open.
+
+        A new session will be created if any further requests are made."""
+        session: t.Optional[aiohttp.ClientSession] = self._session
+        self._session = None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __request(self: "AsyncEventClient", client: EventClient, endpoint: str, timeout: int,
+                        headers: t.Optional[dict[str, str]] = None, retry: t.Optional[RetryPolicy] = None,
+                        metrics: t.Optional[RequestMetrics] = None) -> tuple[aiohttp.ClientResponse, bytes]:
+        """Make a request to the given endpoint of the MCC API, and return the response and its body.
+
+        Limited by the rate limiter of `client` (200 calls per minute by default), and will wait (without blocking the
+        event loop) until a call can be made if exceeded. Timeout parameter is the total number of seconds that the
+        request may take.
+
+        Requests that fail are retried according to `retry`, or the retry policy of `client` if not given, in the same
+        way as requests made by :class:`~mcc_api.event.client.EventClient`. If `metrics` is given, the time spent on
+        each phase of each attempt is added to it."""
+        policy: RetryPolicy = retry or client.retry
+        started: float = time.monotonic()
+        attempt: int = 0
+        while True:
+            attempt += 1
+            acquire_started: float = time.perf_counter()
+            await client.limiter.acquire_async()
+            get_started: float = time.perf_counter()
+            if metrics is not None:
+                metrics.attempts = attempt
+                metrics.limiter_wait += get_started - acquire_started
+            delay: t.Optional[float]
+            try:
+                session: aiohttp.ClientSession = await self._get_session()
+                async with session.get(
+                    f"{client.base_url.rstrip('/')}/{endpoint}",
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    if metrics is not None:
+                        metrics.server_time += time.perf_counter() - get_started
+                        metrics.status = response.status
+                    if response.status not in policy.statuses:
+                        return response, await _read(response, metrics)
+
+                    retry_after: t.Optional[float] = _retry_after(policy, response.headers.get("Retry-After"))
+                    if response.status == 429:
+                        client.limiter.backoff(retry_after if retry_after is not None else policy.backoff)
+                    delay = _next_delay(policy, endpoint, attempt, started, response.status, retry_after)
+                    if delay is None:
+                        return response, await _read(response, metrics)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = _next_delay(policy, endpoint, attempt, started, e)
+                if delay is None:
+                    raise
+
+            if metrics is not None:
+                metrics.retry_wait += delay
+            await asyncio.sleep(delay)
+
+    async def __get(self: "AsyncEventClient", endpoint: str, response_type: t.Callable[[bytes], _R],
+                    timeout: t.Optional[int], retry: t.Optional[RetryPolicy] = None) -> _R:
+        """Request the given endpoint of the MCC API, and return its data as an instance of `response_type`.
+
+        Uses the response cache, error cache, and conditional requests of :attr:`client` in the same way as it does
+        itself. Concurrent calls for the same endpoint and response type within the running event loop share a single
+        request, and return the same response object (or raise the same exception).
+
+        If any hooks have been added to :attr:`client`, they are called with the measurements of the call once it has
+        finished."""
+        client: EventClient = self.client
+        if not client.hooks:
+            return await self.__get_response(client, endpoint, response_type, timeout, retry, None)
+
+        metrics: RequestMetrics = RequestMetrics("event", endpoint)
+        started: float = time.perf_counter()
+        try:
+            return await self.__get_response(client, endpoint, response_type, timeout, retry, metrics)
+        except BaseException as e:
+            metrics.error = e
+            raise
+        finally:
+            metrics.total_time = time.perf_counter() - started
+            metrics.coalesced = not metrics.cache_hit and metrics.attempts == 0
+            _emit(client.hooks, metrics)
+
+    async def __get_response(self: "AsyncEventClient", client: EventClient, endpoint: str,
+                             response_type: t.Callable[[bytes], _R], timeout: t.Optional[int],
+                             retry: t.Optional[RetryPolicy], metrics: t.Optional[RequestMetrics]) -> _R:
+        """Return the data of the given endpoint of the MCC API from the caches of `client`, or from a request shared
+        with any concurrent calls, recording the call's measurements in `metrics` if given."""
+        cache: t.Optional[ResponseCache] = client.cache
+        error_cache: t.Optional[ErrorCache] = client.error_cache
+        if (cached_response := client._cached(endpoint, response_type, cache, error_cache, metrics)) is not None:
+            return t.cast(_R, cached_response)
+
+        request_timeout: int = timeout if timeout is not None else client.timeout
+        return t.cast(_R, await self._in_flight.do_async(
+            (endpoint, response_type),
+            lambda: self.__fetch(client, endpoint, response_type, request_timeout, retry, cache, error_cache, metrics)
+        ))
+
+    async def __fetch(self: "AsyncEventClient", client: EventClient, endpoint: str,
+                      response_type: t.Callable[[bytes], _R], timeout: int, retry: t.Optional[RetryPolicy],
+                      cache: t.Optional[ResponseCache], error_cache: t.Optional[ErrorCache],
+                      metrics: t.Optional[RequestMetrics]) -> _R:
+        """Make a request to the given endpoint of the MCC API, and return its data as an instance of `response_type`.
+
+        The request is made conditionally if an earlier response to the same endpoint is still in use, as described by
+        :meth:`mcc_api.event.client.EventClient._previous`."""
+        # Held until the request has finished, so that it can still be returned if the data has not been modified
+        validators: t.Optional[dict[str, str]]
+        previous: t.Optional[BaseResponse]
+        validators, previous = client._previous(endpoint, response_type)
+
+        response: aiohttp.ClientResponse
+        body: bytes
+        response, body = await self.__request(client, endpoint, timeout, validators, retry, metrics)
+        if response.status == 304 and previous is not None:
+            return t.cast(_R, client._not_modified(endpoint, previous, cache))
+        return client._build(endpoint, response_type, body, response.status, response.reason, response.headers,
+                             cache, error_cache, metrics)
+
+    async def get_event(self: "AsyncEventClient", *, timeout: t.Optional[int] = None,
+                        retry: t.Optional[RetryPolicy] = None) -> EventInformationResponse:
+        """Get event data for the current event cycle.
+
+        Behaves as :func:`mcc_api.event.aio.get_event`."""
+        return await self.__get("event", EventInformationResponse, timeout, retry)
+
+    async def get_events(self: "AsyncEventClient", *, timeout: t.Optional[int] = None,
+                         retry: t.Optional[RetryPolicy] = None) -> EventsResponse:
+        """Get all event keys currently made available by the API.
+
+        Behaves as :func:`mcc_api.event.aio.get_events`."""
+        return await self.__get("events", EventsResponse, timeout, retry)
+
+    @t.overload
+    async def get_hall_of_fame(self: "AsyncEventClient", *, timeout: t.Optional[int] = None,
+                               retry: t.Optional[RetryPolicy] = None) -> HallOfFameResponse: ...
+    @t.overload
+    async def get_hall_of_fame(self: "AsyncEventClient", game: Game, *, timeout: t.Optional[int] = None,
+                               retry: t.Optional[RetryPolicy] = None) -> HallOfFameGameResponse: ...
+
+    async def get_hall_of_fame(self: "AsyncEventClient", game: t.Optional[Game] = None, *,
+                               timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None):
+        """Get hall of fame data, optionally restricted to a single game.
+
+        Behaves as :func:`mcc_api.event.aio.get_hall_of_fame`.
+
+        .. warning::
+           The /halloffame endpoint is deprecated and will be removed in a future release of the API.
+           See https://github.com/Noxcrew/mcchampionship-api/releases/tag/v1.3.0
+        """
+        warnings.warn("The /halloffame endpoint is deprecated and will be removed in a future release of the API. "
+                      "See https://github.com/Noxcrew/mcchampionship-api/releases/tag/v1.3.0",
+                      DeprecationWarning, stacklevel=2)
+        return await self._get_hall_of_fame(game, timeout, retry)
+
+    async def _get_hall_of_fame(self: "AsyncEventClient", game: t.Optional[Game], timeout: t.Optional[int],
+                                retry: t.Optional[RetryPolicy]) -> HallOfFameResponse | HallOfFameGameResponse:
+        """Get hall of fame data without warning that the endpoint is deprecated, so that :mod:`mcc_api.event.aio` can
+        warn on behalf of its caller instead."""
+        if game:
+            return await self.__get(f"halloffame/{game}", HallOfFameGameResponse, timeout, retry)
+        else:
+            return await self.__get("halloffame", HallOfFameResponse, timeout, retry)
+
+    async def get_rundown(self: "AsyncEventClient", event: t.Optional[str] = None, *, lazy: bool = False,
+                          timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None) -> RundownResponse:
+        """Get an event's rundown data.
+
+        Behaves as :func:`mcc_api.event.aio.get_rundown`, using the rundown archive of :attr:`client` if it has one."""
+        response_type: t.Callable[[bytes], RundownResponse] = _lazy_rundown_response if lazy else RundownResponse
+        if event:
+            client: EventClient = self.client
+            archive: t.Optional[RundownArchive] = client.archive
+            if archive is not None and (archived := client._get_archived(archive, event, lazy)) is not None:
+                return archived
+
+            response: RundownResponse = await self.__get(f"rundown/{event}", response_type, timeout, retry)
+            if archive is not None and archive.is_complete(response):
+                archive.put(event, response)
+            return response
+        else:
+            return await self.__get("rundown", response_type, timeout, retry)
+
+    async def get_rundowns(self: "AsyncEventClient", events: t.Iterable[str], *, max_concurrency: int = 8,
+                           lazy: bool = False, timeout: t.Optional[int] = None,
+                           retry: t.Optional[RetryPolicy] = None) -> dict[str, RundownResponse | InvalidEventError]:
+        """Get the rundown data of multiple events concurrently.
+
+        Behaves as :func:`mcc_api.event.aio.get_rundowns`."""
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_rundown_or_error(event: str) -> RundownResponse | InvalidEventError:
+            async with semaphore:
+                try:
+                    return await self.get_rundown(event, lazy=lazy, timeout=timeout, retry=retry)
+                except InvalidEventError as e:
+                    return e
+
+        unique_events: list[str] = list(dict.fromkeys(events))
+        tasks: list[asyncio.Task[RundownResponse | InvalidEventError]] = [
+            asyncio.ensure_future(get_rundown_or_error(event)) for event in unique_events
+        ]
+        try:
+            return dict(zip(unique_events, await asyncio.gather(*tasks)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def get_participant(self: "AsyncEventClient", uuid: str, *, timeout: t.Optional[int] = None,
+                              retry: t.Optional[RetryPolicy] = None) -> ParticipantResponse:
+        """Get an individual participant in the current event cycle by their Minecraft UUID.
+
+        Behaves as :func:`mcc_api.event.aio.get_participant`."""
+        return await self.__get(f"participant/{canonical_uuid(uuid)}", ParticipantResponse, timeout, retry)
+
+    @t.overload
+    async def get_participants(self: "AsyncEventClient", *, timeout: t.Optional[int] = None,
+                               retry: t.Optional[RetryPolicy] = None) -> ParticipantsResponse: ...
+    @t.overload
+    async def get_participants(self: "AsyncEventClient", team: Team, *, timeout: t.Optional[int] = None,
+                               retry: t.Optional[RetryPolicy] = None) -> ParticipantsTeamResponse: ...
+
+    async def get_participants(self: "AsyncEventClient", team: t.Optional[Team] = None, *,
+                               timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None):
+        """Get the participants in the current event cycle.
+
+        Behaves as :func:`mcc_api.event.aio.get_participants`."""
+        if team:
+            return await self.__get(f"participants/{team}", ParticipantsTeamResponse, timeout, retry)
+        else:
+            return await self.__get("participants", ParticipantsResponse, timeout, retry)
+
+
+__client: AsyncEventClient = AsyncEventClient()
+
+
+async def close() -> None:
+    """Close the session shared by the functions in this module, and any connections it holds open.
+
+    A new session will be created if any further requests are made."""
+    await __client.close()
+
+
+async def get_event(*, timeout: t.Optional[int] = None,
+                    retry: t.Optional[RetryPolicy] = None) -> EventInformationResponse:
+    """Get event data for the current event cycle.
+
+    - Calls the `/event <https://api.mcchampionship.com/docs/#/v1/AppController_getEventInformation>`_ endpoint.
+    - Returns an :class:`mcc_api.EventInformationResponse` representing the current event cycle's event.
+    - May raise an :class:`asyncio.TimeoutError` exception, with the number of seconds before timing out specified by
+      the `timeout` parameter and defaulting to the timeout of the default client.
+    - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+      :func:`mcc_api.event.set_retry_policy`.
+    """
+    return await __client.get_event(timeout=timeout, retry=retry)
+
+
+async def get_events(*, timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None) -> EventsResponse:
+    """Get all event keys currently made available by the API.
+
+    - Calls the `/events <https://api.mcchampionship.com/docs/#/v1/AppController_getEventKeys>_ endpoint.
+    - Returns an :class:`mcc_api.EventsResponse` containing all available event keys.
+    - May raise an :class:`asyncio.TimeoutError` exception, with the number of seconds before timing out specified by
+      the `timeout` parameter and defaulting to the timeout of the default client.
+    - Requests that fail are retried according to the `retry` parameter, defaulting to the policy set using
+      :func:`mcc_api.event.set_retry_policy`.
+    """
+    return await __client.get_events(timeout=timeout, retry=retry)
+
+
+@t.overload
+async def get_hall_of_fame(*, timeout: t.Optional[int] = None,
+                           retry: t.Optional[RetryPolicy] = None) -> HallOfFameResponse: ...
+@t.overload
+async def get_hall_of_fame(game: Game, *, timeout: t.Optional[int] = None,
+                           retry: t.Optional[RetryPolicy] = None) -> HallOfFameGameResponse: ...
+
+
+async def get_hall_of_fame(game: t.Optional[Game] = None, *, timeout: t.Optional[int] = None,
+                           retry: t.Optional[RetryPolicy] = None):
+    """Get hall of fame data, optionally restricted to a single game.
+
+    Behaves as :func:`mcc_api.event.get_hall_of_fame`, except that a timeout raises an :class:`asyncio.TimeoutError`.
+
+    .. warning::
+       The /halloffame endpoint is deprecated and will be removed in a future release of the API.
+       See https://github.com/Noxcrew/mcchampionship-api/releases/tag/v1.3.0
+    """
+    warnings.warn("The /halloffame endpoint is deprecated and will be removed in a future release of the API. "
+                  "See https://github.com/Noxcrew/mcchampionship-api/releases/tag/v1.3.0",
+                  DeprecationWarning, stacklevel=2)
+    return await __client._get_hall_of_fame(game, timeout, retry)
+
+
+async def get_rundown(event: t.Optional[str] = None, *, lazy: bool = False, timeout: t.Optional[int] = None,
+                      retry: t.Optional[RetryPolicy] = None) -> RundownResponse:
+    """Get an event's rundown data.
+
+    Behaves as :func:`mcc_api.event.get_rundown`, except that a timeout raises an :class:`asyncio.TimeoutError`.
+    """
+    return await __client.get_rundown(event, lazy=lazy, timeout=timeout, retry=retry)
+
+
+async def get_rundowns(events: t.Iterable[str], *, max_concurrency: int = 8, lazy: bool = False,
+                       timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None
+                       ) -> dict[str, RundownResponse | InvalidEventError]:
+    """Get the rundown data of multiple events concurrently.
+
+    Behaves as :func:`mcc_api.event.get_rundowns`, except that up to `max_concurrency` requests are made at once
+    within the event loop rather than using a pool of threads, and that if any exception other than an
+    :class:`mcc_api.exceptions.InvalidEventError` is raised, the remaining requests are cancelled.
+    """
+    return await __client.get_rundowns(events, max_concurrency=max_concurrency, lazy=lazy, timeout=timeout,
+                                       retry=retry)
+
+
+async def get_participant(uuid: str, *, timeout: t.Optional[int] = None,
+                          retry: t.Optional[RetryPolicy] = None) -> ParticipantResponse:
+    """Get an individual participant in the current event cycle by their Minecraft UUID.
+
+    Behaves as :func:`mcc_api.event.get_participant`, except that a timeout raises an :class:`asyncio.TimeoutError`.
+    """
+    return await __client.get_participant(uuid, timeout=timeout, retry=retry)
+
+
+@t.overload
+async def get_participants(*, timeout: t.Optional[int] = None,
+                           retry: t.Optional[RetryPolicy] = None) -> ParticipantsResponse: ...
+@t.overload
+async def get_participants(team: Team, *, timeout: t.Optional[int] = None,
+                           retry: t.Optional[RetryPolicy] = None) -> ParticipantsTeamResponse: ...
+
+
+async def get_participants(team: t.Optional[Team] = None, *, timeout: t.Optional[int] = None,
+                           retry: t.Optional[RetryPolicy] = None):
+    """Get the participants in the current event cycle.
+
+    Behaves as :func:`mcc_api.event.get_participants`, except that a timeout raises an :class:`asyncio.TimeoutError`.
+    """
+    return await __client.get_participants(team, timeout=timeout, retry=retry)
@@ -0,0 +1,71 @@
+from .responses import RundownResponse
+import os
+import sqlite3
+import threading
+import typing as t
+
+
+class RundownArchive:
+    """Durable store of rundowns for events that have finished, kept in an SQLite database at `path`.
+
+    The rundowns of finished events never change, so once archived they can be read back without spending any of the
+    rate limit. The archive is consulted by :func:`mcc_api.event.get_rundown` when enabled using
+    :func:`mcc_api.event.set_rundown_archive`, and can be pre-populated using :func:`mcc_api.event.archive_rundowns`:
+
+    .. code-block:: python
+
+       mcc_api.event.set_rundown_archive(mcc_api.event.archive.RundownArchive("rundowns.sqlite3"))
+       mcc_api.event.archive_rundowns()
+    """
+
+    path: str
+    """Path of the SQLite database used to store the archive."""
+
+    _connection: sqlite3.Connection
+    _lock: threading.Lock
+
+    def __init__(self: "RundownArchive", path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS rundowns (event TEXT PRIMARY KEY, data BLOB NOT NULL)")
+
+    @staticmethod
+    def is_complete(response: RundownResponse) -> bool:
+        """Return whether the rundown is of an event that has finished, and so will not change.
+
+        An event is considered to have finished once Dodgebolt has been played."""
+        return bool(response.data.dodgeboltData)
+
+    def get(self: "RundownArchive", event: str, *, lazy: bool = False) -> t.Optional[RundownResponse]:
+        """Return the archived rundown for the given event key, or None if it has not been archived.
+
+        `lazy` is passed to the :class:`~mcc_api.event.responses.RundownResponse` constructor."""
+        with self._lock:
+            row: t.Optional[tuple[bytes]] = self._connection.execute(
+                "SELECT data FROM rundowns WHERE event = ?", (event,)
+            ).fetchone()
+        return RundownResponse(row[0], lazy=lazy) if row else None
+
+    def put(self: "RundownArchive", event: str, response: RundownResponse) -> None:
+        """Archive the rundown for the given event key, replacing any rundown already archived for it."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO rundowns (event, data) VALUES (?, ?)", (event, response.raw)
+            )
+
+    def events(self: "RundownArchive") -> set[str]:
+        """Return the keys of all events with an archived rundown."""
+        with self._lock:
+            return {row[0] for row in self._connection.execute("SELECT event FROM rundowns")}
+
+    def __contains__(self: "RundownArchive", event: str) -> bool:
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM rundowns WHERE event = ?", (event,)).fetchone() is not None
+
+    def close(self: "RundownArchive") -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,169 @@
+from .exceptions import MCCAPIError
+from .responses import BaseResponse
+from collections import OrderedDict
+import threading
+import time
+import typing as t
+
+_V = t.TypeVar("_V")
+
+
+class _ExpiringCache(t.Generic[_V]):
+    """Size-bounded cache whose entries expire, evicting the least recently used entries once full."""
+
+    max_size: int
+    """Maximum number of entries to keep in the cache."""
+    hits: int
+    """Number of lookups that returned a cached entry."""
+    misses: int
+    """Number of lookups that did not return a cached entry."""
+
+    _entries: OrderedDict[str, tuple[float, _V]]
+    _lock: threading.Lock
+
+    def __init__(self: "_ExpiringCache[_V]", max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self: "_ExpiringCache[_V]", endpoint: str) -> t.Optional[_V]:
+        with self._lock:
+            entry: t.Optional[tuple[float, _V]] = self._entries.get(endpoint)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[endpoint]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(endpoint)
+            self.hits += 1
+            return entry[1]
+
+    def _set(self: "_ExpiringCache[_V]", endpoint: str, value: _V, ttl: float) -> None:
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[endpoint] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(endpoint)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self: "_ExpiringCache[_V]", endpoint: t.Optional[str] = None) -> None:
+        """Remove the cached entry for the given endpoint, or all cached entries if no endpoint is given."""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(endpoint, None)
+
+    def __len__(self: "_ExpiringCache[_V]") -> int:
+        return len(self._entries)
+
+
+class ResponseCache(_ExpiringCache[BaseResponse]):
+    """In-memory cache of response objects returned by the MCC Event API, keyed by endpoint.
+
+    Each response is kept for a length of time that depends on the endpoint it was returned by, as set in `ttls`, and
+    the least recently used responses are evicted once more than `max_size` are cached. Cached responses are returned
+    as-is, so a cache hit neither spends any of the rate limit nor parses any data.
+
+    Caching is disabled by default, and can be enabled using :func:`mcc_api.event.set_response_cache`:
+
+    .. code-block:: python
+
+       mcc_api.event.set_response_cache(mcc_api.event.cache.ResponseCache(ttls={"rundown": 10}))
+    """
+
+    default_ttls: t.ClassVar[dict[str, float]] = {
+        "event": 60,
+        "events": 3600,
+        "halloffame": 3600,
+        "halloffame/{game}": 3600,
+        "rundown": 30,
+        "rundown/{event}": 30,
+        "participant/{uuid}": 60,
+        "participants": 60,
+        "participants/{team}": 60
+    }
+    """Default number of seconds for which responses from each endpoint are cached.
+
+    Keys are the endpoints as documented by the API, with their parameters in braces. Rundowns of past events are cached
+    for as short a time as the current rundown, since the event given may be the one in progress; completed rundowns can
+    be kept indefinitely using a :class:`mcc_api.event.archive.RundownArchive` instead."""
+
+    ttls: dict[str, float]
+    """Number of seconds for which responses from each endpoint are cached.
+
+    Responses from endpoints with a TTL of zero, or that are missing from this dictionary, are not cached."""
+
+    __parameters: t.ClassVar[dict[str, str]] = {
+        "halloffame": "game",
+        "rundown": "event",
+        "participant": "uuid",
+        "participants": "team"
+    }
+
+    def __init__(self: "ResponseCache", max_size: int = 256, ttls: t.Optional[t.Mapping[str, float]] = None) -> None:
+        super().__init__(max_size)
+        self.ttls = {**self.default_ttls, **(ttls or {})}
+
+    def ttl(self: "ResponseCache", endpoint: str) -> float:
+        """Return the number of seconds for which a response from the given endpoint (e.g. ``"rundown/MCC25"``) is
+        cached."""
+        name: str
+        parameter: str
+        name, _, parameter = endpoint.partition("/")
+        if parameter:
+            name = f"{name}/{{{self.__parameters.get(name, '')}}}"
+        return self.ttls.get(name, 0)
+
+    def get(self: "ResponseCache", endpoint: str) -> t.Optional[BaseResponse]:
+        """Return the cached response for the given endpoint, or None if there is no unexpired cached response."""
+        return self._get(endpoint)
+
+    def set(self: "ResponseCache", endpoint: str, response: BaseResponse) -> None:
+        """Cache a response returned by the given endpoint, evicting the least recently used responses if needed."""
+        self._set(endpoint, response, self.ttl(endpoint))
+
+
+class ErrorCache(_ExpiringCache[MCCAPIError]):
+    """In-memory cache of the exceptions raised for endpoints of the MCC Event API that returned a 404 status code,
+    keyed by endpoint.
+
+    While an exception is cached for an endpoint, requesting that endpoint raises the same type of exception again
+    without making a request, so repeatedly requesting an event, game, participant, or team that does not exist does
+    not spend any of the rate limit. Exceptions are kept for `ttl` seconds, and the least recently used exceptions are
+    evicted once more than `max_size` are cached.
+
+    Negative caching is disabled by default, and can be enabled using :func:`mcc_api.event.set_error_cache`:
+
+    .. code-block:: python
+
+       mcc_api.event.set_error_cache(mcc_api.event.cache.ErrorCache(ttl=30))
+    """
+
+    ttl: float
+    """Number of seconds for which exceptions are cached."""
+
+    def __init__(self: "ErrorCache", max_size: int = 1024, ttl: float = 30) -> None:
+        super().__init__(max_size)
+        self.ttl = ttl
+
+    def get(self: "ErrorCache", endpoint: str) -> t.Optional[MCCAPIError]:
+        """Return a new exception of the same type, code, and reason as the cached exception for the given endpoint,
+        or None if there is no unexpired cached exception."""
+        error: t.Optional[MCCAPIError] = self._get(endpoint)
+        return type(error)(error.code, error.reason) if error is not None else None
+
+    def set(self: "ErrorCache", endpoint: str, error: MCCAPIError) -> None:
+        """Cache an exception raised for the given endpoint, evicting the least recently used exceptions if needed.
+
+        Only exceptions with a code of 404 are cached."""
+        if error.code == 404:
+            self._set(endpoint, error, self.ttl)
@@ -0,0 +1,625 @@
+from .. import __user_agent
+from ..instrumentation import _emit, Hook, RequestMetrics
+from .archive import RundownArchive
+from .cache import ErrorCache, ResponseCache
+from .enums import Game, Team
+from .exceptions import InvalidEventError, InvalidParticipantError, MCCAPIError, UnexpectedStatusError
+from .limiter import TokenBucket
+from .responses import (
+    BaseResponse,
+    Creator,
+    EventInformationResponse,
+    EventsResponse,
+    HallOfFameGameResponse,
+    HallOfFameResponse,
+    ParticipantResponse,
+    ParticipantsResponse,
+    LazyHistory,
+    ParticipantsTeamResponse,
+    RundownResponse
+)
+from .retry import _next_delay, _retry_after, RetryPolicy
+from .singleflight import SingleFlight
+from .uuids import canonical_uuid
+from collections import deque, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib3.util import Retry
+import functools
+import requests
+import requests.adapters
+import threading
+import time
+import typing as t
+import warnings
+import weakref
+
+_R = t.TypeVar("_R", bound=BaseResponse)
+
+DEFAULT_BASE_URL: t.Final[str] = "https://api.mcchampionship.com/v1"
+"""Base URL of version 1 of the MCC Event API."""
+
+# Kept as a single object, so that concurrent lazy requests for a rundown are recognised as identical
+_lazy_rundown_response: t.Final[t.Callable[[requests.Response], RundownResponse]] = \
+    functools.partial(RundownResponse, lazy=True)
+
+
+def _satisfies(response: BaseResponse, response_type: t.Callable[..., BaseResponse]) -> bool:
+    """Return whether a response built previously can be returned to a caller that asked for `response_type`.
+
+    A rundown built lazily is never returned to a caller that asked for one built eagerly, although the reverse is
+    allowed."""
+    return not (response_type is RundownResponse and isinstance(response, RundownResponse)
+                and isinstance(response.data.history, LazyHistory))
+
+
+def _check_status(status: int, reason: t.Optional[str]) -> None:
+    """Raise an :class:`mcc_api.exceptions.UnexpectedStatusError` if a response's status code is not one that its
+    response object can be built from.
+
+    Responses with a 404 or 429 status code are left for the response objects to raise the appropriate exception."""
+    if not 200 <= status < 300 and status not in (304, 404, 429):
+        raise UnexpectedStatusError(status, reason)
+
+
+def _create_session(pool_size: int, max_retries: int, keep_alive: bool) -> requests.Session:
+    """Create a :class:`requests.Session` with a connection pool mounted for both HTTP and HTTPS.
+
+    Retries are only made here for failures to connect, as those requests will never have reached the API. Any other
+    failures are retried by the retry policy."""
+    session: requests.Session = requests.Session()
+    session.headers["User-Agent"] = __user_agent
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    adapter: requests.adapters.HTTPAdapter = requests.adapters.HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        # Retry-After is handled by the retry policy in EventClient.__request, rather than by urllib3
+        # Read errors are not retried by urllib3 at all, so that a read timeout is raised as requests.Timeout
+        max_retries=Retry(total=max_retries, connect=max_retries, read=False, status=0, other=0, backoff_factor=0.25,
+                          respect_retry_after_header=False, raise_on_status=False)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class EventClient:
+    """Client for the MCC Event API, owning its own HTTP session, rate limiter, retry policy, and caches.
+
+    The functions in :mod:`mcc_api.event` delegate to a default client, which can be replaced using
+    :func:`mcc_api.event.set_default_client`. Separate clients can be created to make requests with different settings
+    at the same time, such as a low-priority client for backfilling alongside a high-priority client for live polling,
+    or a client pointed at a local stand-in server:
+
+    .. code-block:: python
+
+       backfill = mcc_api.event.client.EventClient(limiter=mcc_api.event.limiter.TokenBucket(calls=20, period=60))
+       backfill.get_rundown("MCC25")
+
+    Each method behaves as the function of the same name in :mod:`mcc_api.event`, except that `timeout` defaults to
+    the client's :attr:`timeout`. Clients do not share rate limits unless given the same limiter.
+    """
+
+    base_url: str
+    """Base URL that endpoints are requested relative to."""
+    limiter: TokenBucket
+    """Rate limiter that limits requests made by this client."""
+    retry: RetryPolicy
+    """Policy used to retry failed requests, unless overridden for a single call."""
+    cache: t.Optional[ResponseCache]
+    """Cache used for responses, or None if caching is disabled."""
+    error_cache: t.Optional[ErrorCache]
+    """Cache used for exceptions raised for endpoints that returned a 404 status code, or None if negative caching is
+    disabled."""
+    archive: t.Optional[RundownArchive]
+    """Archive of finished events' rundowns, or None if archiving is disabled."""
+    timeout: int
+    """Number of seconds before each request times out, unless overridden for a single call."""
+    hooks: list[Hook]
+    """Functions called with the measurements of each call made using the client, once it has finished. See
+    :mod:`mcc_api.instrumentation`."""
+
+    _max_validators: t.ClassVar[int] = 256
+
+    _session: requests.Session
+    _validators: OrderedDict[str, tuple[dict[str, str], weakref.ref[BaseResponse]]]
+    _validators_lock: threading.Lock
+    _in_flight: SingleFlight[BaseResponse]
+    _participants_snapshot: t.Optional[tuple[float, ParticipantsResponse]]
+    _participants_snapshot_lock: threading.Lock
+
+    def __init__(self: "EventClient", base_url: str = DEFAULT_BASE_URL, *, limiter: t.Optional[TokenBucket] = None,
+                 retry: t.Optional[RetryPolicy] = None, cache: t.Optional[ResponseCache] = None,
+                 error_cache: t.Optional[ErrorCache] = None, archive: t.Optional[RundownArchive] = None,
+                 timeout: int = 5, pool_size: int = 10, max_retries: int = 2, keep_alive: bool = True,
+                 hooks: t.Optional[t.Iterable[Hook]] = None) -> None:
+        self.base_url = base_url
+        self.limiter = limiter if limiter is not None else TokenBucket(calls=200, period=60)
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.cache = cache
+        self.error_cache = error_cache
+        self.archive = archive
+        self.timeout = timeout
+        self.hooks = list(hooks) if hooks is not None else []
+
+        self._session = _create_session(pool_size, max_retries, keep_alive)
+        self._validators = OrderedDict()
+        self._validators_lock = threading.Lock()
+        self._in_flight = SingleFlight()
+        self._participants_snapshot = None
+        self._participants_snapshot_lock = threading.Lock()
+
+    def configure_session(self: "EventClient", *, pool_size: int = 10, max_retries: int = 2,
+                          keep_alive: bool = True) -> None:
+        """Replace the client's HTTP session, closing any connections held by the previous session.
+
+        See :func:`mcc_api.event.configure_session` for a description of the parameters."""
+        previous_session: requests.Session = self._session
+        self._session = _create_session(pool_size, max_retries, keep_alive)
+        previous_session.close()
+
+    def close(self: "EventClient") -> None:
+        """Close any connections held by the client's HTTP session.
+
+        The client can still be used afterwards, in which case new connections are opened."""
+        self._session.close()
+
+    def add_request_hook(self: "EventClient", hook: Hook) -> None:
+        """Add a function to be called with the measurements of each call made using the client, once it has finished.
+
+        See :mod:`mcc_api.instrumentation` for a description of the measurements."""
+        self.hooks.append(hook)
+
+    def remove_request_hook(self: "EventClient", hook: Hook) -> None:
+        """Remove a function added using :meth:`add_request_hook`.
+
+        - May raise :class:`ValueError` if the function has not been added."""
+        self.hooks.remove(hook)
+
+    def __request(self: "EventClient", endpoint: str, timeout: int, headers: t.Optional[dict[str, str]] = None,
+                  retry: t.Optional[RetryPolicy] = None,
+                  metrics: t.Optional[RequestMetrics] = None) -> requests.Response:
+        """Make and return a request to the given endpoint of the MCC API.
+
+        Limited by the client's rate limiter (200 calls per minute by default), and will sleep until a call can be made
+        if exceeded. Requests are made using the client's session, so connections to the API are reused between calls.
+        Timeout parameter is passed to requests module directly.
+
+        Requests that fail are retried according to `retry`, or the client's retry policy if not given, with each
+        attempt counting towards the rate limit. If the API responds with a 429 status code, the rate limiter is emptied
+        for as long as the API asks (or the policy's backoff if it does not say), so that other callers also slow down.
+
+        If `metrics` is given, the time spent on each phase of each attempt is added to it.
+        """
+        policy: RetryPolicy = retry or self.retry
+        started: float = time.monotonic()
+        attempt: int = 0
+        while True:
+            attempt += 1
+            acquire_started: float = time.perf_counter()
+            self.limiter.acquire()
+            get_started: float = time.perf_counter()
+            delay: t.Optional[float]
+            try:
+                response: requests.Response = self._session.get(
+                    f"{self.base_url.rstrip('/')}/{endpoint}", headers=headers, timeout=timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if metrics is not None:
+                    metrics.attempts = attempt
+                    metrics.limiter_wait += get_started - acquire_started
+                    metrics.server_time += time.perf_counter() - get_started
+                delay = _next_delay(policy, endpoint, attempt, started, e)
+                if delay is None:
+                    raise
+            else:
+                if metrics is not None:
+                    # Response.elapsed covers sending the request until its headers were parsed, and the body has
+                    # already been downloaded by the time get() returns
+                    get_time: float = time.perf_counter() - get_started
+                    server_time: float = min(get_time, response.elapsed.total_seconds())
+                    metrics.attempts = attempt
+                    metrics.limiter_wait += get_started - acquire_started
+                    metrics.server_time += server_time
+                    metrics.download_time += get_time - server_time
+                    metrics.status = response.status_code
+                    metrics.bytes += len(response.content)
+
+                if response.status_code not in policy.statuses:
+                    return response
+
+                retry_after: t.Optional[float] = _retry_after(policy, response.headers.get("Retry-After"))
+                if response.status_code == 429:
+                    self.limiter.backoff(retry_after if retry_after is not None else policy.backoff)
+                delay = _next_delay(policy, endpoint, attempt, started, response.status_code, retry_after)
+                if delay is None:
+                    return response
+                response.close()
+
+            if metrics is not None:
+                metrics.retry_wait += delay
+            time.sleep(delay)
+
+    def __get(self: "EventClient", endpoint: str, response_type: t.Callable[[requests.Response], _R],
+              timeout: t.Optional[int], retry: t.Optional[RetryPolicy] = None) -> _R:
+        """Request the given endpoint of the MCC API, and return its data as an instance of `response_type`.
+
+        If a response cache has been set, the cached response is returned instead of making a request, if there is one.
+        Likewise, if an error cache has been set, the cached exception is raised again if there is one.
+
+        Concurrent calls for the same endpoint and response type share a single request, and return the same response
+        object (or raise the same exception). Callers that join a request already in flight wait for as long as it
+        takes, rather than for their own `timeout`.
+
+        If any hooks have been added, they are called with the measurements of the call once it has finished."""
+        if not self.hooks:
+            return self.__get_response(endpoint, response_type, timeout, retry, None)
+
+        metrics: RequestMetrics = RequestMetrics("event", endpoint)
+        started: float = time.perf_counter()
+        try:
+            return self.__get_response(endpoint, response_type, timeout, retry, metrics)
+        except BaseException as e:
+            metrics.error = e
+            raise
+        finally:
+            metrics.total_time = time.perf_counter() - started
+            metrics.coalesced = not metrics.cache_hit and metrics.attempts == 0
+            _emit(self.hooks, metrics)
+
+    def __get_response(self: "EventClient", endpoint: str, response_type: t.Callable[[requests.Response], _R],
+                       timeout: t.Optional[int], retry: t.Optional[RetryPolicy],
+                       metrics: t.Optional[RequestMetrics]) -> _R:
+        """Return the data of the given endpoint of the MCC API from the client's caches, or from a request shared with
+        any concurrent calls, recording the call's measurements in `metrics` if given."""
+        cache: t.Optional[ResponseCache] = self.cache
+        error_cache: t.Optional[ErrorCache] = self.error_cache
+        if (cached_response := self._cached(endpoint, response_type, cache, error_cache, metrics)) is not None:
+            return t.cast(_R, cached_response)
+
+        request_timeout: int = timeout if timeout is not None else self.timeout
+        return t.cast(_R, self._in_flight.do(
+            (endpoint, response_type),
+            lambda: self.__fetch(endpoint, response_type, request_timeout, retry, cache, error_cache, metrics)
+        ))
+
+    def __fetch(self: "EventClient", endpoint: str, response_type: t.Callable[[requests.Response], _R], timeout: int,
+                retry: t.Optional[RetryPolicy], cache: t.Optional[ResponseCache],
+                error_cache: t.Optional[ErrorCache], metrics: t.Optional[RequestMetrics] = None) -> _R:
+        """Make a request to the given endpoint of the MCC API, and return its data as an instance of `response_type`.
+
+        The request is made conditionally if an earlier response to the same endpoint is still in use, as described by
+        :meth:`_previous`."""
+        # Held until the request has finished, so that it can still be returned if the data has not been modified
+        validators: t.Optional[dict[str, str]]
+        previous: t.Optional[BaseResponse]
+        validators, previous = self._previous(endpoint, response_type)
+
+        response: requests.Response = self.__request(endpoint, timeout, validators, retry, metrics)
+        if response.status_code == 304 and previous is not None:
+            return t.cast(_R, self._not_modified(endpoint, previous, cache))
+        return self._build(endpoint, response_type, response, response.status_code, response.reason, response.headers,
+                           cache, error_cache, metrics)
+
+    # The methods below are shared with mcc_api.event.aio, which makes its requests using the client's settings
+
+    def _cached(self: "EventClient", endpoint: str, response_type: t.Callable[..., BaseResponse],
+                cache: t.Optional[ResponseCache], error_cache: t.Optional[ErrorCache],
+                metrics: t.Optional[RequestMetrics]) -> t.Optional[BaseResponse]:
+        """Return the response cached for the given endpoint, or None if there is no cached response that can be
+        returned to a caller that asked for `response_type`.
+
+        - May raise the exception cached for the given endpoint, if there is one."""
+        if error_cache is not None and (cached_error := error_cache.get(endpoint)) is not None:
+            if metrics is not None:
+                metrics.cache_hit = True
+            raise cached_error
+
+        if cache is not None and (cached_response := cache.get(endpoint)) is not None \
+                and _satisfies(cached_response, response_type):
+            if metrics is not None:
+                metrics.cache_hit = True
+            return cached_response
+        return None
+
+    def _previous(self: "EventClient", endpoint: str, response_type: t.Callable[..., BaseResponse]
+                  ) -> tuple[t.Optional[dict[str, str]], t.Optional[BaseResponse]]:
+        """Return the headers with which to request the given endpoint conditionally, and the response object that was
+        built from the previous response to it, or a tuple of Nones if the request should not be conditional.
+
+        The ETag and Last-Modified validators of the most recent responses are remembered, and sent with the next
+        request to the same endpoint. If the API reports that the data has not been modified since, the response object
+        that was built previously is returned, without downloading or parsing the data again (unless it was a rundown
+        built lazily, and an eager one was asked for).
+
+        Only a weak reference to each response object is kept alongside its validators, so that responses are freed
+        once nothing else refers to them. If the previous response object has already been freed, the request is made
+        without validators."""
+        with self._validators_lock:
+            entry: t.Optional[tuple[dict[str, str], weakref.ref[BaseResponse]]] = self._validators.get(endpoint)
+        previous: t.Optional[BaseResponse] = entry[1]() if entry is not None else None
+        if previous is None or not _satisfies(previous, response_type):
+            return None, None
+        return entry[0], previous
+
+    def _not_modified(self: "EventClient", endpoint: str, previous: BaseResponse,
+                      cache: t.Optional[ResponseCache]) -> BaseResponse:
+        """Return the response object returned by :meth:`_previous`, once the API has reported that the data of the
+        given endpoint has not been modified since."""
+        with self._validators_lock:
+            if endpoint in self._validators:
+                self._validators.move_to_end(endpoint)
+        if cache is not None:
+            cache.set(endpoint, previous)
+        return previous
+
+    def _build(self: "EventClient", endpoint: str, response_type: t.Callable[[t.Any], _R], body: t.Any, status: int,
+               reason: t.Optional[str], headers: t.Mapping[str, str], cache: t.Optional[ResponseCache],
+               error_cache: t.Optional[ErrorCache], metrics: t.Optional[RequestMetrics]) -> _R:
+        """Build an instance of `response_type` from the response to a request to the given endpoint, remembering its
+        validators and adding it to the client's caches.
+
+        - May raise an :class:`mcc_api.exceptions.UnexpectedStatusError` exception, or whichever exception
+          `response_type` raises."""
+        _check_status(status, reason)
+        build_started: float = time.perf_counter()
+        try:
+            result: _R = response_type(body)
+        except MCCAPIError as e:
+            if error_cache is not None:
+                error_cache.set(endpoint, e)
+            raise
+        finally:
+            if metrics is not None:
+                metrics.build_time = time.perf_counter() - build_started
+        if metrics is not None:
+            metrics.decode_time = min(metrics.build_time, result._decode_time)
+            metrics.build_time -= metrics.decode_time
+
+        validators: dict[str, str] = {}
+        if etag := headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+
+        with self._validators_lock:
+            if validators:
+                self._validators[endpoint] = (validators, weakref.ref(result))
+                self._validators.move_to_end(endpoint)
+                while len(self._validators) > self._max_validators:
+                    self._validators.popitem(last=False)
+            else:
+                self._validators.pop(endpoint, None)
+        if cache is not None:
+            cache.set(endpoint, result)
+        return result
+
+    def _get_archived(self: "EventClient", archive: RundownArchive, event: str,
+                      lazy: bool) -> t.Optional[RundownResponse]:
+        """Return the archived rundown for the given event key, or None if it has not been archived.
+
+        If any hooks have been added, they are called with the measurements of the call if the rundown was archived, as
+        a cache hit."""
+        if not self.hooks:
+            return archive.get(event, lazy=lazy)
+
+        metrics: RequestMetrics = RequestMetrics("event", f"rundown/{event}", cache_hit=True)
+        started: float = time.perf_counter()
+        archived: t.Optional[RundownResponse] = archive.get(event, lazy=lazy)
+        if archived is not None:
+            metrics.total_time = time.perf_counter() - started
+            metrics.decode_time = min(metrics.total_time, archived._decode_time)
+            metrics.build_time = metrics.total_time - metrics.decode_time
+            _emit(self.hooks, metrics)
+        return archived
+
+    def get_event(self: "EventClient", *, timeout: t.Optional[int] = None,
+                  retry: t.Optional[RetryPolicy] = None) -> EventInformationResponse:
+        """Get event data for the current event cycle.
+
+        Behaves as :func:`mcc_api.event.get_event`."""
+        return self.__get("event", EventInformationResponse, timeout, retry)
+
+    def get_events(self: "EventClient", *, timeout: t.Optional[int] = None,
+                   retry: t.Optional[RetryPolicy] = None) -> EventsResponse:
+        """Get all event keys currently made available by the API.
+
+        Behaves as :func:`mcc_api.event.get_events`."""
+        return self.__get("events", EventsResponse, timeout, retry)
+
+    @t.overload
+    def get_hall_of_fame(self: "EventClient", *, timeout: t.Optional[int] = None,
+                         retry: t.Optional[RetryPolicy] = None) -> HallOfFameResponse: ...
+    @t.overload
+    def get_hall_of_fame(self: "EventClient", game: Game, *, timeout: t.Optional[int] = None,
+                         retry: t.Optional[RetryPolicy] = None) -> HallOfFameGameResponse: ...
+
+    def get_hall_of_fame(self: "EventClient", game: t.Optional[Game] = None, *, timeout: t.Optional[int] = None,
+                         retry: t.Optional[RetryPolicy] = None):
+        """Get hall of fame data, optionally restricted to a single game.
+
+        Behaves as :func:`mcc_api.event.get_hall_of_fame`.
+
+        .. warning::
+           The /halloffame endpoint is deprecated and will be removed in a future release of the API.
+           See https://github.com/Noxcrew/mcchampionship-api/releases/tag/v1.3.0
+        """
+        warnings.warn("The /halloffame endpoint is deprecated and will be removed in a future release of the API. "
+                      "See https://github.com/Noxcrew/mcchampionship-api/releases/tag/v1.3.0",
+                      DeprecationWarning, stacklevel=2)
+        return self._get_hall_of_fame(game, timeout, retry)
+
+    def _get_hall_of_fame(self: "EventClient", game: t.Optional[Game], timeout: t.Optional[int],
+                          retry: t.Optional[RetryPolicy]) -> HallOfFameResponse | HallOfFameGameResponse:
+        """Get hall of fame data without warning that the endpoint is deprecated, so that :mod:`mcc_api.event` can warn
+        on behalf of its caller instead."""
+        if game:
+            return self.__get(f"halloffame/{game}", HallOfFameGameResponse, timeout, retry)
+        else:
+            return self.__get("halloffame", HallOfFameResponse, timeout, retry)
+
+    def get_rundown(self: "EventClient", event: t.Optional[str] = None, *, lazy: bool = False,
+                    timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None) -> RundownResponse:
+        """Get an event's rundown data.
+
+        Behaves as :func:`mcc_api.event.get_rundown`, using the client's rundown archive if it has one."""
+        response_type: t.Callable[[requests.Response], RundownResponse] = \
+            _lazy_rundown_response if lazy else RundownResponse
+        if event:
+            archive: t.Optional[RundownArchive] = self.archive
+            if archive is not None and (archived := self._get_archived(archive, event, lazy)) is not None:
+                return archived
+
+            response: RundownResponse = self.__get(f"rundown/{event}", response_type, timeout, retry)
+            if archive is not None and archive.is_complete(response):
+                archive.put(event, response)
+            return response
+        else:
+            return self.__get("rundown", response_type, timeout, retry)
+
+    def get_rundowns(self: "EventClient", events: t.Iterable[str], *, max_workers: int = 8, lazy: bool = False,
+                     timeout: t.Optional[int] = None,
+                     retry: t.Optional[RetryPolicy] = None) -> dict[str, RundownResponse | InvalidEventError]:
+        """Get the rundown data of multiple events concurrently.
+
+        Behaves as :func:`mcc_api.event.get_rundowns`."""
+        results: dict[str, RundownResponse | InvalidEventError] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: dict[str, Future[RundownResponse]] = {
+                event: executor.submit(self.get_rundown, event, lazy=lazy, timeout=timeout, retry=retry)
+                for event in dict.fromkeys(events)
+            }
+
+            try:
+                for event, future in futures.items():
+                    try:
+                        results[event] = future.result()
+                    except InvalidEventError as e:
+                        results[event] = e
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        return results
+
+    def iter_rundowns(self: "EventClient", events: t.Optional[t.Iterable[str]] = None, *, prefetch: int = 0,
+                      lazy: bool = False, timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None
+                      ) -> t.Iterator[tuple[str, RundownResponse | InvalidEventError]]:
+        """Iterate over the rundown data of multiple events, getting each rundown only as it is needed.
+
+        Behaves as :func:`mcc_api.event.iter_rundowns`."""
+        def get_rundown_or_error(event: str) -> RundownResponse | InvalidEventError:
+            try:
+                return self.get_rundown(event, lazy=lazy, timeout=timeout, retry=retry)
+            except InvalidEventError as e:
+                return e
+
+        event_keys: t.Iterator[str] = iter(
+            events if events is not None else self.get_events(timeout=timeout, retry=retry).data
+        )
+        if prefetch <= 0:
+            for event in event_keys:
+                yield event, get_rundown_or_error(event)
+            return
+
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=prefetch)
+        pending: deque[tuple[str, Future[RundownResponse | InvalidEventError]]] = deque()
+        try:
+            for event in event_keys:
+                pending.append((event, executor.submit(get_rundown_or_error, event)))
+                if len(pending) > prefetch:
+                    event, future = pending.popleft()
+                    yield event, future.result()
+
+            while pending:
+                event, future = pending.popleft()
+                yield event, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def archive_rundowns(self: "EventClient", events: t.Optional[t.Iterable[str]] = None, *,
+                         timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None) -> list[str]:
+        """Add the rundowns of finished events to the client's rundown archive.
+
+        Behaves as :func:`mcc_api.event.archive_rundowns`."""
+        archive: t.Optional[RundownArchive] = self.archive
+        if archive is None:
+            raise ValueError("No rundown archive has been set")
+
+        current_event: str = self.get_event(timeout=timeout, retry=retry).data.event
+        archived_events: set[str] = archive.events()
+
+        added: list[str] = []
+        for event in (events if events is not None else self.get_events(timeout=timeout, retry=retry).data):
+            if event == current_event or event in archived_events:
+                continue
+
+            try:
+                response: RundownResponse = self.__get(f"rundown/{event}", RundownResponse, timeout, retry)
+            except InvalidEventError:
+                continue
+            if not archive.is_complete(response):
+                continue
+
+            archive.put(event, response)
+            archived_events.add(event)
+            added.append(event)
+        return added
+
+    def get_participant(self: "EventClient", uuid: str, *, timeout: t.Optional[int] = None,
+                        retry: t.Optional[RetryPolicy] = None) -> ParticipantResponse:
+        """Get an individual participant in the current event cycle by their Minecraft UUID.
+
+        Behaves as :func:`mcc_api.event.get_participant`."""
+        return self.__get(f"participant/{canonical_uuid(uuid)}", ParticipantResponse, timeout, retry)
+
+    @t.overload
+    def get_participants(self: "EventClient", *, timeout: t.Optional[int] = None,
+                         retry: t.Optional[RetryPolicy] = None) -> ParticipantsResponse: ...
+    @t.overload
+    def get_participants(self: "EventClient", team: Team, *, timeout: t.Optional[int] = None,
+                         retry: t.Optional[RetryPolicy] = None) -> ParticipantsTeamResponse: ...
+
+    def get_participants(self: "EventClient", team: t.Optional[Team] = None, *, timeout: t.Optional[int] = None,
+                         retry: t.Optional[RetryPolicy] = None):
+        """Get the participants in the current event cycle.
+
+        Behaves as :func:`mcc_api.event.get_participants`."""
+        if team:
+            return self.__get(f"participants/{team}", ParticipantsTeamResponse, timeout, retry)
+        else:
+            return self.__get("participants", ParticipantsResponse, timeout, retry)
+
+    def get_participants_by_uuid(self: "EventClient", uuids: t.Iterable[str], *, max_age: float = 10,
+                                 timeout: t.Optional[int] = None, retry: t.Optional[RetryPolicy] = None
+                                 ) -> dict[str, Creator | InvalidParticipantError]:
+        """Get multiple participants in the current event cycle by their Minecraft UUIDs, using as few requests as
+        possible.
+
+        Behaves as :func:`mcc_api.event.get_participants_by_uuid`."""
+        with self._participants_snapshot_lock:
+            snapshot: t.Optional[tuple[float, ParticipantsResponse]] = self._participants_snapshot
+            if snapshot is None or time.monotonic() - snapshot[0] > max_age:
+                snapshot = self._participants_snapshot = (
+                    time.monotonic(), self.get_participants(timeout=timeout, retry=retry)
+                )
+        participants: ParticipantsResponse = snapshot[1]
+
+        results: dict[str, Creator | InvalidParticipantError] = {}
+        for uuid in dict.fromkeys(uuids):
+            try:
+                canonical_uuid(uuid)
+            except InvalidParticipantError as e:
+                results[uuid] = e
+                continue
+
+            creator: t.Optional[Creator] = participants.by_uuid(uuid)
+            if creator is not None:
+                results[uuid] = creator
+                continue
+
+            try:
+                results[uuid] = self.get_participant(uuid, timeout=timeout, retry=retry).data
+            except InvalidParticipantError as e:
+                results[uuid] = e
+        return results
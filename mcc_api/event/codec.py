@@ -0,0 +1,72 @@
+import json
+import typing as t
+
+Loads = t.Callable[[bytes], t.Any]
+"""Function that decodes bytes containing JSON into Python objects."""
+Dumps = t.Callable[[t.Any], str]
+"""Function that encodes Python objects into a JSON string."""
+
+
+def _stdlib_codec() -> tuple[Loads, Dumps]:
+    """Return the JSON codec provided by the :mod:`json` module."""
+    return json.loads, json.dumps
+
+
+def _default_codec() -> tuple[Loads, Dumps]:
+    """Return the fastest JSON codec available, preferring orjson, then msgspec, then the :mod:`json` module."""
+    try:
+        import orjson
+        return orjson.loads, lambda obj: orjson.dumps(obj).decode("utf-8")
+    except ImportError:
+        pass
+
+    try:
+        import msgspec.json
+        return msgspec.json.decode, lambda obj: msgspec.json.encode(obj).decode("utf-8")
+    except ImportError:
+        pass
+
+    return _stdlib_codec()
+
+
+__loads: Loads
+__dumps: Dumps
+__loads, __dumps = _default_codec()
+
+
+def loads(data: bytes) -> t.Any:
+    """Decode bytes containing JSON using the current codec."""
+    return __loads(data)
+
+
+def dumps(obj: t.Any) -> str:
+    """Encode Python objects into a JSON string using the current codec."""
+    return __dumps(obj)
+
+
+def get_json_codec() -> tuple[Loads, Dumps]:
+    """Return the functions currently used to decode and encode JSON for MCC Event API responses."""
+    return __loads, __dumps
+
+
+def set_json_codec(loads: t.Optional[Loads] = None, dumps: t.Optional[Dumps] = None) -> None:
+    """Set the functions used to decode and encode JSON for MCC Event API responses.
+
+    By default, `orjson <https://github.com/ijl/orjson>`_ is used if it is installed, followed by
+    `msgspec <https://jcristharif.com/msgspec/>`_, falling back to the :mod:`json` module if neither are. Calling this
+    function with no arguments resets to the :mod:`json` module.
+
+    `loads` must accept bytes, and `dumps` must return a string. For example, to use orjson explicitly:
+
+    .. code-block:: python
+
+       import orjson
+       mcc_api.event.set_json_codec(orjson.loads, lambda obj: orjson.dumps(obj).decode("utf-8"))
+    """
+    global __loads, __dumps
+    stdlib_loads: Loads
+    stdlib_dumps: Dumps
+    stdlib_loads, stdlib_dumps = _stdlib_codec()
+
+    __loads = loads or stdlib_loads
+    __dumps = dumps or stdlib_dumps
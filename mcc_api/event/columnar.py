@@ -0,0 +1,94 @@
+"""Columnar views of event data, for analysing many events at once.
+
+Requires the optional `NumPy <https://numpy.org>`_ dependency, which can be installed using
+``pip install mcc-api[numpy]``.
+"""
+
+from .enums import Game, Team
+from .responses import EventRundown, RundownHistoryGame
+from dataclasses import dataclass
+import typing as t
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("mcc_api.event.columnar requires numpy, which can be installed using "
+                      "\"pip install mcc-api[numpy]\"") from e
+
+
+@dataclass(frozen=True, slots=True)
+class RundownArrays:
+    """Dense arrays of an event's history, with games, teams, and players as axes.
+
+    Rows of each two-dimensional array correspond to :attr:`games` (in the order they were played), and columns to
+    :attr:`teams` or :attr:`players`. Values that are missing from the rundown are stored as NaN.
+    """
+
+    games: list[str]
+    """Game indices (keys of :attr:`EventRundown.history`), in the order the games were played."""
+    gameTypes: list[Game]
+    """The game that was played at each game index."""
+    teams: list[Team]
+    """Teams in the event, in the order of the :class:`mcc_api.Team` enum."""
+    players: list[str]
+    """Usernames of the players in the event."""
+    multipliers: np.ndarray
+    """Array of shape (games,) containing the multiplier applied to coins earned during each game."""
+    gameScores: np.ndarray
+    """Array of shape (games, teams) containing the coins each team earned during each game (multiplied)."""
+    eventScores: np.ndarray
+    """Array of shape (games, teams) containing each team's total coins after each game."""
+    gamePlacements: np.ndarray
+    """Array of shape (games, teams) containing each team's placement in each game (zero-indexed)."""
+    eventPlacements: np.ndarray
+    """Array of shape (games, teams) containing each team's placement in the event after each game (zero-indexed)."""
+    individualScores: np.ndarray
+    """Array of shape (players, games) containing each player's total coins after each game."""
+
+
+def rundown_arrays(rundown: EventRundown) -> RundownArrays:
+    """Build a :class:`RundownArrays` from an event's rundown.
+
+    This is also available as :meth:`mcc_api.responses.RundownResponse.to_arrays`."""
+    games: list[str] = sorted(rundown.history, key=int)
+    history: list[RundownHistoryGame] = [rundown.history[game_num] for game_num in games]
+
+    present_teams: set[Team] = set(rundown.eventScores)
+    players: dict[str, None] = dict.fromkeys(rundown.individualScores)
+    for game in history:
+        for team_scores in (game.gameScores, game.eventScores, game.gamePlacements, game.eventPlacements):
+            if team_scores:
+                present_teams.update(team_scores)
+        if game.individualScores:
+            players.update(dict.fromkeys(game.individualScores))
+
+    teams: list[Team] = [team for team in Team if team in present_teams]
+    team_columns: dict[Team, int] = {team: column for column, team in enumerate(teams)}
+    player_rows: dict[str, int] = {player: row for row, player in enumerate(players)}
+
+    def team_array(field: str) -> np.ndarray:
+        array: np.ndarray = np.full((len(games), len(teams)), np.nan)
+        for row, game in enumerate(history):
+            values: t.Optional[dict[Team, int]] = getattr(game, field)
+            if values:
+                array[row, [team_columns[team] for team in values]] = list(values.values())
+        return array
+
+    individual_scores: np.ndarray = np.full((len(players), len(games)), np.nan)
+    for column, game in enumerate(history):
+        if game.individualScores:
+            individual_scores[[player_rows[player] for player in game.individualScores], column] = \
+                list(game.individualScores.values())
+
+    return RundownArrays(
+        games=games,
+        gameTypes=[game.game for game in history],
+        teams=teams,
+        players=list(players),
+        multipliers=np.array([game.multiplier for game in history], dtype=float),
+        gameScores=team_array("gameScores"),
+        eventScores=team_array("eventScores"),
+        gamePlacements=team_array("gamePlacements"),
+        eventPlacements=team_array("eventPlacements"),
+        individualScores=individual_scores
+    )
@@ -0,0 +1,156 @@
+from .enums import Team
+from .responses import EventRundown, RundownHistoryGame
+from collections.abc import Mapping
+from dataclasses import dataclass
+import typing as t
+
+_K = t.TypeVar("_K")
+_V = t.TypeVar("_V")
+
+
+@dataclass(frozen=True, slots=True)
+class RundownDelta:
+    """Base class of the records returned by :func:`diff_rundowns`, each describing a single change between two
+    rundowns of an event."""
+
+
+@dataclass(frozen=True, slots=True)
+class GameAdded(RundownDelta):
+    """A game was added to the event's history."""
+
+    game_num: str
+    """The game's index in :attr:`mcc_api.event.responses.EventRundown.history`."""
+    game: RundownHistoryGame
+    """The game that was added."""
+
+
+@dataclass(frozen=True, slots=True)
+class GameChanged(RundownDelta):
+    """The most recent game in the event's history changed."""
+
+    game_num: str
+    """The game's index in :attr:`mcc_api.event.responses.EventRundown.history`."""
+    old: RundownHistoryGame
+    """The game as it was in the older rundown."""
+    new: RundownHistoryGame
+    """The game as it is in the newer rundown."""
+
+
+@dataclass(frozen=True, slots=True)
+class GameRemoved(RundownDelta):
+    """A game was removed from the event's history."""
+
+    game_num: str
+    """The game's index in :attr:`mcc_api.event.responses.EventRundown.history`."""
+    game: RundownHistoryGame
+    """The game that was removed."""
+
+
+@dataclass(frozen=True, slots=True)
+class DodgeboltScoreChanged(RundownDelta):
+    """The number of rounds of Dodgebolt that a team won changed."""
+
+    team: Team
+    """The team whose score changed."""
+    old: t.Optional[int]
+    """The team's score in the older rundown, or None if it had no score."""
+    new: t.Optional[int]
+    """The team's score in the newer rundown, or None if it has no score."""
+
+
+@dataclass(frozen=True, slots=True)
+class EventScoreChanged(RundownDelta):
+    """A team's coins total changed."""
+
+    team: Team
+    """The team whose coins total changed."""
+    old: t.Optional[int]
+    """The team's coins total in the older rundown, or None if it had no coins total."""
+    new: t.Optional[int]
+    """The team's coins total in the newer rundown, or None if it has no coins total."""
+
+
+@dataclass(frozen=True, slots=True)
+class EventPlacementChanged(RundownDelta):
+    """A team's placement in the event changed."""
+
+    team: Team
+    """The team whose placement changed."""
+    old: t.Optional[int]
+    """The team's placement (zero-indexed) in the older rundown, or None if it had no placement."""
+    new: t.Optional[int]
+    """The team's placement (zero-indexed) in the newer rundown, or None if it has no placement."""
+
+
+@dataclass(frozen=True, slots=True)
+class IndividualScoreChanged(RundownDelta):
+    """A player's coins total changed, or a player was added to or removed from the individual scores."""
+
+    player: str
+    """The username of the player whose coins total changed."""
+    old: t.Optional[int]
+    """The player's coins total in the older rundown, or None if they had no coins total."""
+    new: t.Optional[int]
+    """The player's coins total in the newer rundown, or None if they have no coins total."""
+
+
+@dataclass(frozen=True, slots=True)
+class CreatorsChanged(RundownDelta):
+    """The players in a team changed."""
+
+    team: Team
+    """The team whose players changed."""
+    old: t.Optional[list[str]]
+    """The usernames of the team's players in the older rundown, or None if the team was not present."""
+    new: t.Optional[list[str]]
+    """The usernames of the team's players in the newer rundown, or None if the team is not present."""
+
+
+def _diff_mapping(old: Mapping[_K, _V], new: Mapping[_K, _V],
+                  delta: t.Callable[[_K, t.Optional[_V], t.Optional[_V]], RundownDelta]) -> list[RundownDelta]:
+    """Return a delta for each key whose value differs between the two mappings, in the order the keys appear."""
+    if old == new:
+        return []
+    return [delta(key, old.get(key), new.get(key)) for key in {**old, **new} if old.get(key) != new.get(key)]
+
+
+def diff_rundowns(old: EventRundown, new: EventRundown) -> list[RundownDelta]:
+    """Return the changes between two rundowns of the same event, from `old` to `new`.
+
+    Changes to the event's history are returned first (games removed, then a change to the most recent game, then games
+    added, in the order they were played), followed by changes to the Dodgebolt scores, coins totals, placements,
+    individual coins totals, and teams' players.
+
+    Games in the history are assumed not to change once a later game has been played, so only the most recent game in
+    `old` is compared with its counterpart in `new`, and only games that were added are otherwise read. This keeps the
+    cost proportional to the change rather than to the length of the event, and means that if either rundown was
+    constructed with `lazy` set to True, only those games are built.
+
+    This is also available as :meth:`mcc_api.event.responses.RundownResponse.diff`. For example:
+
+    .. code-block:: python
+
+       for delta in mcc_api.event.diff.diff_rundowns(previous.data, rundown.data):
+           if isinstance(delta, mcc_api.event.diff.GameAdded):
+               print(f"{delta.game.game} finished")
+    """
+    deltas: list[RundownDelta] = []
+
+    old_games: list[str] = [game_num for game_num in old.history if game_num not in new.history]
+    new_games: list[str] = [game_num for game_num in new.history if game_num not in old.history]
+    deltas.extend(GameRemoved(game_num, old.history[game_num]) for game_num in sorted(old_games, key=int))
+
+    latest: t.Optional[str] = max((game_num for game_num in old.history if game_num in new.history), key=int,
+                                  default=None)
+    if latest is not None and old.history[latest] != new.history[latest]:
+        deltas.append(GameChanged(latest, old.history[latest], new.history[latest]))
+
+    deltas.extend(GameAdded(game_num, new.history[game_num]) for game_num in sorted(new_games, key=int))
+
+    deltas.extend(_diff_mapping(old.dodgeboltData, new.dodgeboltData, DodgeboltScoreChanged))
+    deltas.extend(_diff_mapping(old.eventScores, new.eventScores, EventScoreChanged))
+    deltas.extend(_diff_mapping(old.eventPlacements, new.eventPlacements, EventPlacementChanged))
+    deltas.extend(_diff_mapping(old.individualScores, new.individualScores, IndividualScoreChanged))
+    deltas.extend(_diff_mapping(old.creators, new.creators, CreatorsChanged))
+
+    return deltas
@@ -30,6 +30,14 @@ class InvalidParticipantError(MCCAPIError):
     """Exception raised when the requested participant does not exist."""
     pass
 
+
+class InvalidUUIDError(InvalidParticipantError, ValueError):
+    """Exception raised when the requested participant's UUID is malformed.
+
+    Raised before any request is made to the API, with a code of 400."""
+    pass
+
+
 class InvalidTeamError(MCCAPIError):
     """Exception raised when the requested team does not exist."""
     pass
@@ -38,3 +46,11 @@ class InvalidTeamError(MCCAPIError):
 class RateLimitError(MCCAPIError):
     """Exception raised when the MCC API returns a rate limit error."""
     pass
+
+
+class UnexpectedStatusError(MCCAPIError):
+    """Exception raised when the MCC API responds with a status code that is not otherwise handled, such as a server
+    error that was still being returned once the request's retries had run out.
+
+    The reason is the HTTP reason phrase of the status code, as the body of such responses may not be JSON data."""
+    pass
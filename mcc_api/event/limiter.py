@@ -0,0 +1,211 @@
+import asyncio
+import contextlib
+import os
+import struct
+import threading
+import time
+import typing as t
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by all requests made to the MCC Event API.
+
+    Tokens are added to the bucket at a steady rate, and each request consumes one token. Up to `burst` requests can be
+    made immediately (by default, one twentieth of `calls`, or at least 1), after which requests are spaced out evenly.
+    The refill rate is chosen so that no more than `calls` requests are ever made within any window of `period` seconds,
+    so the burst is taken out of the sustained rate: once the burst has been used, requests are made at
+    `calls - burst` per `period` seconds (or 1, if `burst` is the whole limit). For example, the default limit of 200
+    calls per minute has a burst of 10, and sustains 190 calls per minute.
+
+    Waiting callers reserve their token before they start waiting, so each waits for a different length of time and
+    they are released one by one, rather than all at once when the limit resets.
+    """
+
+    calls: int
+    """Maximum number of requests that may be made within any window of `period` seconds."""
+    period: float
+    """Length of the window, in seconds, over which `calls` requests may be made."""
+    burst: int
+    """Maximum number of requests that may be made at once, without waiting between them."""
+
+    _rate: float
+    _tokens: float
+    _updated: float
+    _lock: threading.Lock
+
+    def __init__(self: "TokenBucket", calls: int = 200, period: float = 60, *, burst: t.Optional[int] = None) -> None:
+        if burst is None:
+            burst = max(1, calls // 20)
+        if calls < 1 or period <= 0:
+            raise ValueError("calls and period must be greater than zero")
+        if not 0 < burst <= calls:
+            raise ValueError("burst must be greater than zero and no more than calls")
+
+        self.calls = calls
+        self.period = period
+        self.burst = burst
+
+        # A caller that empties the bucket has to wait for a whole token, so refilling one token per period still keeps
+        # within `calls` when `burst` is the whole limit, rather than never refilling at all
+        self._rate = max(calls - burst, 1) / period
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _locked(self: "TokenBucket") -> t.ContextManager[t.Any]:
+        """Return a context manager that holds exclusive access to the bucket's state while entered."""
+        return self._lock
+
+    def _load(self: "TokenBucket") -> tuple[float, float]:
+        """Return the number of tokens in the bucket, and the time at which it was last refilled."""
+        return self._tokens, self._updated
+
+    def _store(self: "TokenBucket", tokens: float, updated: float) -> None:
+        """Save the number of tokens in the bucket, and the time at which it was last refilled."""
+        self._tokens = tokens
+        self._updated = updated
+
+    def _now(self: "TokenBucket") -> float:
+        """Return the current time, in seconds, as used to refill the bucket."""
+        return time.monotonic()
+
+    def _refill(self: "TokenBucket") -> tuple[float, float]:
+        """Add the tokens accumulated since the last refill, and return the number now in the bucket along with the
+        time of the refill.
+
+        Must be called while holding exclusive access to the bucket's state."""
+        tokens: float
+        updated: float
+        tokens, updated = self._load()
+        now: float = self._now()
+
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self._rate)
+        self._store(tokens, now)
+        return tokens, now
+
+    def _reserve(self: "TokenBucket", timeout: t.Optional[float]) -> t.Optional[float]:
+        """Reserve a token, returning the number of seconds to wait before using it.
+
+        Returns None without reserving a token if the wait would be longer than `timeout`."""
+        with self._locked():
+            tokens: float
+            now: float
+            tokens, now = self._refill()
+            wait: float = max(0.0, (1 - tokens) / self._rate)
+            if timeout is not None and wait > timeout:
+                return None
+
+            self._store(tokens - 1, now)
+            return wait
+
+    def wait_time(self: "TokenBucket") -> float:
+        """Return the number of seconds that a call to :meth:`acquire` made now would wait for."""
+        with self._locked():
+            return max(0.0, (1 - self._refill()[0]) / self._rate)
+
+    def backoff(self: "TokenBucket", seconds: float) -> None:
+        """Empty the bucket, so that no calls can be made for at least `seconds` seconds before it refills as normal.
+
+        Called after the API responds with a 429 status code, so that the budget shrinks for every caller sharing the
+        limiter rather than only the one that was rate limited."""
+        with self._locked():
+            tokens: float
+            now: float
+            tokens, now = self._refill()
+            self._store(min(tokens, 0.0) - max(0.0, seconds) * self._rate, now)
+
+    def try_acquire(self: "TokenBucket") -> bool:
+        """Consume a token if one is available immediately, returning whether one was consumed."""
+        return self._reserve(0) is not None
+
+    def acquire(self: "TokenBucket", timeout: t.Optional[float] = None) -> bool:
+        """Consume a token, sleeping the current thread until it is available.
+
+        If `timeout` is given and the token would not be available within that many seconds, return False immediately
+        without consuming a token. Otherwise, return True once the token has been consumed."""
+        wait: t.Optional[float] = self._reserve(timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self: "TokenBucket", timeout: t.Optional[float] = None) -> bool:
+        """Consume a token, waiting without blocking the event loop until it is available.
+
+        Otherwise behaves as :meth:`acquire`."""
+        wait: t.Optional[float] = self._reserve(timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket rate limiter whose budget is shared between every process on the host that uses the same file.
+
+    The bucket's state is kept in the file at `path`, which is locked while it is read and updated, so any number of
+    worker processes can share a single rate limit. Every process sharing the file should be configured with the same
+    `calls`, `period`, and `burst`. For example, each process could call:
+
+    .. code-block:: python
+
+       mcc_api.event.set_rate_limiter(mcc_api.event.limiter.FileTokenBucket("/tmp/mcc_api.ratelimit"))
+
+    The file is created if it does not exist. As the state is timestamped using the system clock, the processes must
+    all be running on the same host.
+    """
+
+    path: str
+    """Path of the file used to store the bucket's state."""
+
+    _fd: t.Optional[int]
+    __state: t.ClassVar[struct.Struct] = struct.Struct("<dd")
+
+    def __init__(self: "FileTokenBucket", path: str | os.PathLike[str], calls: int = 200, period: float = 60, *,
+                 burst: t.Optional[int] = None) -> None:
+        super().__init__(calls, period, burst=burst)
+        self.path = os.fspath(path)
+        self._fd = None
+
+    @contextlib.contextmanager
+    def _locked(self: "FileTokenBucket") -> t.Iterator[None]:
+        # The file is reopened each time, as locks held on a file descriptor inherited across a fork would otherwise
+        # be shared with the parent process
+        with self._lock:
+            fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                if os.name == "nt":
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, self.__state.size)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+
+                self._fd = fd
+                yield
+            finally:
+                self._fd = None
+                if os.name == "nt":
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, self.__state.size)
+                os.close(fd)
+
+    def _load(self: "FileTokenBucket") -> tuple[float, float]:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        data: bytes = os.read(self._fd, self.__state.size)
+        if len(data) < self.__state.size:
+            # A new file starts with a full bucket
+            return self.burst, self._now()
+        return self.__state.unpack(data)
+
+    def _store(self: "FileTokenBucket", tokens: float, updated: float) -> None:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, self.__state.pack(tokens, updated))
+
+    def _now(self: "FileTokenBucket") -> float:
+        return time.time()
@@ -1,24 +1,39 @@
+from . import codec
 from .exceptions import InvalidEventError, InvalidGameError, InvalidParticipantError, InvalidTeamError, RateLimitError
 from .enums import Game, Team
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from datetime import datetime
-import json
 import requests
+import time
 import typing as t
 
+if t.TYPE_CHECKING:
+    from .columnar import RundownArrays
+    from .diff import RundownDelta
+
 
 class BaseResponse:
-    """The base response from which all other mcc_api responses inherit."""
+    """The base response from which all other mcc_api responses inherit.
+
+    Responses can be constructed from a :class:`requests.Response`, from the bytes of a response's body, or from the
+    already decoded JSON data of a response's body."""
 
     code: int
     """Response code of the request from the API."""
     reason: t.Optional[str]
     """Reason for the response code, if applicable."""
-    __json: str
+    __raw: t.Optional[bytes] = None
+    __data: t.Optional[dict[str, t.Any]] = None
+    __json: t.Optional[str] = None
+    # Number of seconds spent decoding the JSON data, reported by request hooks
+    _decode_time: float = 0
 
-    def __init__(self: "BaseResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "BaseResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = self._extract_json_data(request)
-        self.__json = json.dumps(data)
+        if self.__raw is None:
+            # Only kept so that the json property can be generated if it is used
+            self.__data = data
 
         self.code = data.get("code", data.get("status"))
         self.reason = data.get("reason")
@@ -26,14 +41,43 @@ class BaseResponse:
         if self.code == 429:
             raise RateLimitError(self.code, self.reason)
 
-    @staticmethod
-    def _extract_json_data(data: requests.Response | dict[str, t.Any]) -> dict[str, t.Any]:
-        """Return json data from a requests.Response object, or return the input unchanged"""
-        return data.json() if isinstance(data, requests.Response) else data
+    def _extract_json_data(self: "BaseResponse",
+                           data: requests.Response | bytes | dict[str, t.Any]) -> dict[str, t.Any]:
+        """Return json data decoded from a requests.Response object or bytes, or return the input unchanged.
+
+        Data is decoded using the codec set by :func:`mcc_api.event.set_json_codec`. The undecoded bytes are kept to
+        back the raw and json properties."""
+        if isinstance(data, requests.Response):
+            data = data.content
+        if isinstance(data, (bytes, bytearray)):
+            self.__raw = bytes(data)
+            started: float = time.perf_counter()
+            decoded: dict[str, t.Any] = codec.loads(self.__raw)
+            self._decode_time = time.perf_counter() - started
+            return decoded
+        return data
+
+    @property
+    def raw(self: "BaseResponse") -> bytes:
+        """Bytes of the JSON data returned by the API.
+
+        If the response was constructed from a :class:`requests.Response` or from bytes, these are the bytes that were
+        received, without being decoded and re-encoded."""
+        if self.__raw is None:
+            self.__raw = self.json.encode("utf-8")
+        return self.__raw
 
     @property
     def json(self: "BaseResponse") -> str:
-        """JSON string of the data returned by the API."""
+        """JSON string of the data returned by the API.
+
+        Generated when first accessed, rather than when the response is constructed."""
+        if self.__json is None:
+            if self.__raw is not None:
+                self.__json = self.__raw.decode("utf-8")
+            else:
+                self.__json = codec.dumps(self.__data)
+                self.__data = None
         return self.__json
 
 
@@ -58,7 +102,7 @@ class EventInformationResponse(BaseResponse):
     data: EventInformationData
     """Current event cycle's event data."""
 
-    def __init__(self: "EventInformationResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "EventInformationResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = self._extract_json_data(request)
         super().__init__(data)
 
@@ -75,7 +119,7 @@ class EventsResponse(BaseResponse):
     data: list[str]
     """List of all event keys currently made available by the API."""
 
-    def __init__(self: "EventsResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "EventsResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = self._extract_json_data(request)
         super().__init__(data)
 
@@ -143,7 +187,7 @@ class HallOfFameResponse(BaseResponse):
        }
     """
 
-    def __init__(self: "HallOfFameResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "HallOfFameResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = super()._extract_json_data(request)
         super().__init__(data)
 
@@ -184,7 +228,7 @@ class HallOfFameGameResponse(BaseResponse):
        }
     """
 
-    def __init__(self: "HallOfFameGameResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "HallOfFameGameResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = super()._extract_json_data(request)
         super().__init__(data)
 
@@ -222,6 +266,59 @@ class RundownHistoryGame:
     eventPlacements: t.Optional[dict[Team, int]]
     """Dictionary mapping teams to their placement in the event after this game (zero-indexed)."""
 
+    @staticmethod
+    def _from_json(game_data: dict[str, t.Any]) -> "RundownHistoryGame":
+        """Build a RundownHistoryGame from the JSON data of a single game in an event's history."""
+        return RundownHistoryGame(
+            index=game_data["index"],
+            game=Game[game_data["game"]],
+            multiplier=game_data["multiplier"],
+            individualScores=game_data.get("individualScores"),
+            gameScores={Team[team]: score for team, score in game_data["gameScores"].items()}
+            if "gameScores" in game_data else None,
+            eventScores={Team[team]: score for team, score in game_data["eventScores"].items()}
+            if "eventScores" in game_data else None,
+            gamePlacements={Team[team]: placement for team, placement in game_data["gamePlacements"].items()}
+            if "gamePlacements" in game_data else None,
+            eventPlacements={Team[team]: placement for team, placement in game_data["eventPlacements"].items()}
+            if "eventPlacements" in game_data else None
+        )
+
+
+class LazyHistory(Mapping[str, RundownHistoryGame]):
+    """Read-only mapping of game index to RundownHistoryGame object, which only builds each RundownHistoryGame (and its
+    dictionaries) when it is first accessed.
+
+    Used as :attr:`EventRundown.history` when a :class:`RundownResponse` is constructed with `lazy` set to True.
+    Otherwise behaves as the dictionary that would have been used instead."""
+
+    __slots__ = ("_data", "_games")
+
+    _data: dict[str, dict[str, t.Any]]
+    _games: dict[str, RundownHistoryGame]
+
+    def __init__(self: "LazyHistory", data: dict[str, dict[str, t.Any]]) -> None:
+        self._data = data
+        self._games = {}
+
+    def __getitem__(self: "LazyHistory", game_num: str) -> RundownHistoryGame:
+        game: t.Optional[RundownHistoryGame] = self._games.get(game_num)
+        if game is None:
+            game = self._games[game_num] = RundownHistoryGame._from_json(self._data[game_num])
+        return game
+
+    def __iter__(self: "LazyHistory") -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self: "LazyHistory") -> int:
+        return len(self._data)
+
+    def __contains__(self: "LazyHistory", game_num: object) -> bool:
+        return game_num in self._data
+
+    def __repr__(self: "LazyHistory") -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
 
 @dataclass(frozen=True, slots=True)
 class EventRundown:
@@ -235,8 +332,10 @@ class EventRundown:
     """Dictionary mapping teams to their final coins totals."""
     individualScores: dict[str, int]
     """Dictionary mapping player usernames to their final coins totals."""
-    history: dict[str, RundownHistoryGame]
+    history: Mapping[str, RundownHistoryGame]
     """Dictionary mapping game index to a RundownHistoryGame object (zero-indexed).
+
+    If the :class:`RundownResponse` was constructed with `lazy` set to True, this is a :class:`LazyHistory` instead.
     
     Dictionary keys are the number of the game being played as a string. For example:
     
@@ -260,12 +359,16 @@ class EventRundown:
 
 
 class RundownResponse(BaseResponse):
-    """Response object representing score, game, and participant data for a single event."""
+    """Response object representing score, game, and participant data for a single event.
+
+    If `lazy` is True, the games in the event's history are only built when they are accessed, which avoids the cost
+    of building them when only the event's totals are needed."""
 
     data: EventRundown
     """Object representing the event's data."""
 
-    def __init__(self: "RundownResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "RundownResponse", request: requests.Response | bytes | dict[str, t.Any], *,
+                 lazy: bool = False) -> None:
         data: dict[str, t.Any] = super()._extract_json_data(request)
         super().__init__(data)
 
@@ -284,28 +387,37 @@ class RundownResponse(BaseResponse):
 
             return True
 
+        history: dict[str, dict[str, t.Any]] = dict(filter(history_contains_game, data["data"]["history"].items()))
+
         self.data = EventRundown(
             dodgeboltData={Team[team]: score for team, score in data["data"]["dodgeboltData"].items()},
             eventPlacements={Team[team]: placement for team, placement in data["data"]["eventPlacements"].items()},
             eventScores={Team[team]: score for team, score in data["data"]["eventScores"].items()},
             individualScores=data["data"]["individualScores"],
-            history={game_num: RundownHistoryGame(
-                index=game_data["index"],
-                game=Game[game_data["game"]],
-                multiplier=game_data["multiplier"],
-                individualScores=game_data.get("individualScores"),
-                gameScores={Team[team]: score for team, score in game_data["gameScores"].items()}
-                if "gameScores" in game_data else None,
-                eventScores={Team[team]: score for team, score in game_data["eventScores"].items()}
-                if "eventScores" in game_data else None,
-                gamePlacements={Team[team]: placement for team, placement in game_data["gamePlacements"].items()}
-                if "gamePlacements" in game_data else None,
-                eventPlacements={Team[team]: placement for team, placement in game_data["eventPlacements"].items()}
-                if "eventPlacements" in game_data else None
-            ) for game_num, game_data in filter(history_contains_game, data["data"]["history"].items())},
+            history=LazyHistory(history) if lazy else {
+                game_num: RundownHistoryGame._from_json(game_data) for game_num, game_data in history.items()
+            },
             creators={Team[team]: creator for team, creator in data["data"]["creators"].items()}
         )
 
+    def to_arrays(self: "RundownResponse") -> "RundownArrays":
+        """Return the event's history as dense NumPy arrays, with games, teams, and players as axes.
+
+        Requires the optional NumPy dependency, which can be installed using ``pip install mcc-api[numpy]``. See
+        :class:`mcc_api.event.columnar.RundownArrays` for a description of the arrays returned."""
+        from .columnar import rundown_arrays
+        return rundown_arrays(self.data)
+
+    def diff(self: "RundownResponse", previous: "RundownResponse") -> list["RundownDelta"]:
+        """Return the changes to the event's rundown since `previous` was returned, as records from
+        :mod:`mcc_api.event.diff`.
+
+        See :func:`mcc_api.event.diff.diff_rundowns` for the changes that are returned."""
+        from .diff import diff_rundowns
+        if previous is self or previous.raw == self.raw:
+            return []
+        return diff_rundowns(previous.data, self.data)
+
 
 @dataclass(frozen=True, slots=True)
 class Creator:
@@ -325,12 +437,56 @@ class Creator:
     """The platform of the participant's stream."""
 
 
+class ParticipantLookups:
+    """Indexes over a response's participants, allowing them to be looked up without searching every team.
+
+    The indexes are built when the response is constructed."""
+
+    _by_uuid: dict[str, Creator]
+    _by_username: dict[str, Creator]
+    _by_platform: dict[str, list[Creator]]
+    _by_team: dict[Team, list[Creator]]
+
+    def _build_indexes(self: "ParticipantLookups", creators: t.Iterable[Creator]) -> None:
+        """Build the indexes used to look up the given participants."""
+        self._by_uuid = {}
+        self._by_username = {}
+        self._by_platform = {}
+        self._by_team = {}
+
+        for creator in creators:
+            self._by_uuid[creator.uuid.replace("-", "").lower()] = creator
+            self._by_username[creator.username.casefold()] = creator
+            self._by_platform.setdefault(creator.platform.casefold(), []).append(creator)
+            self._by_team.setdefault(creator.team, []).append(creator)
+
+    def by_uuid(self: "ParticipantLookups", uuid: str) -> t.Optional[Creator]:
+        """Return the participant with the given Minecraft UUID, or None if there is no such participant.
+
+        Accepts both dashed (e.g. 3e7a89ee-c4e2-4392-a317-444b861b0794) and un-dashed
+        (e.g. 3e7a89eec4e24392a317444b861b0794) UUIDs, in either case."""
+        return self._by_uuid.get(uuid.replace("-", "").lower())
+
+    def by_username(self: "ParticipantLookups", username: str) -> t.Optional[Creator]:
+        """Return the participant with the given Minecraft username (ignoring case), or None if there is no such
+        participant."""
+        return self._by_username.get(username.casefold())
+
+    def by_platform(self: "ParticipantLookups", platform: str) -> list[Creator]:
+        """Return a list of the participants streaming on the given platform (ignoring case)."""
+        return list(self._by_platform.get(platform.casefold(), []))
+
+    def by_team(self: "ParticipantLookups", team: Team) -> list[Creator]:
+        """Return a list of the participants in the given team."""
+        return list(self._by_team.get(team, []))
+
+
 class ParticipantResponse(BaseResponse):
     """Response object representing an individual participant in the current event cycle."""
 
     data: Creator
 
-    def __init__(self: "ParticipantResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "ParticipantResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = super()._extract_json_data(request)
         super().__init__(data)
 
@@ -347,13 +503,15 @@ class ParticipantResponse(BaseResponse):
         )
 
 
-class ParticipantsResponse(BaseResponse):
-    """Response object representing all teams and their participants in the current event cycle."""
+class ParticipantsResponse(BaseResponse, ParticipantLookups):
+    """Response object representing all teams and their participants in the current event cycle.
+
+    Participants can be looked up by UUID, username, platform, or team using the methods below."""
 
     data: dict[Team, list[Creator]]
     """Dictionary mapping from teams to lists of detailed participant data."""
 
-    def __init__(self: "ParticipantsResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "ParticipantsResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = super()._extract_json_data(request)
         super().__init__(data)
 
@@ -365,15 +523,18 @@ class ParticipantsResponse(BaseResponse):
             team=Team(creator["team"]),
             platform=creator["platform"]
         ) for creator in participants] for team, participants in data["data"].items()}
+        self._build_indexes(creator for participants in self.data.values() for creator in participants)
+
 
+class ParticipantsTeamResponse(BaseResponse, ParticipantLookups):
+    """Response object representing a single team and its participants in the current event cycle.
 
-class ParticipantsTeamResponse(BaseResponse):
-    """Response object representing a single team and its participants in the current event cycle."""
+    Participants can be looked up by UUID, username, platform, or team using the methods below."""
 
     data: list[Creator]
     """List of detailed participant data."""
 
-    def __init__(self: "ParticipantsTeamResponse", request: requests.Response | dict[str, t.Any]) -> None:
+    def __init__(self: "ParticipantsTeamResponse", request: requests.Response | bytes | dict[str, t.Any]) -> None:
         data: dict[str, t.Any] = super()._extract_json_data(request)
         super().__init__(data)
 
@@ -390,3 +551,4 @@ class ParticipantsTeamResponse(BaseResponse):
                 platform=creator["platform"]
             ) for creator in data["data"]
         ]
+        self._build_indexes(self.data)
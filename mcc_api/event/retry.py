@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import email.utils
+import logging
+import math
+import random
+import time
+import typing as t
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+OnRetry = t.Callable[[str, int, float, "int | BaseException"], None]
+"""Function called before a request is retried, with the endpoint, the number of the attempt that failed (starting at
+1), the number of seconds until the next attempt, and the status code returned or exception raised by the attempt."""
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Policy for retrying requests to the MCC Event API that failed for reasons that may be transient.
+
+    Requests are retried if the API responds with one of the status codes in `statuses`, or if the request fails to
+    connect or times out. Before each retry, the request waits for a random length of time of up to `backoff` seconds
+    for the first retry, doubling for each retry after that up to `max_delay` seconds, so that callers that failed at
+    the same time do not all retry at the same time. If the API responds with a Retry-After header, the request waits
+    for at least as long as it asks, up to `max_delay` seconds.
+
+    A request is made at most `attempts` times, and is not retried if the wait would end more than `deadline` seconds
+    after the first attempt was made. Once no more retries can be made, the last response or exception is handled as
+    if no policy had been set, so a 429 status code still raises a :class:`mcc_api.exceptions.RateLimitError`.
+
+    The default policy is set using :func:`mcc_api.event.set_retry_policy`, and can be overridden for a single call
+    using the `retry` parameter of the `get_*` functions. For example, to disable retries for a single call:
+
+    .. code-block:: python
+
+       mcc_api.event.get_rundown(retry=mcc_api.event.retry.RetryPolicy(attempts=1))
+    """
+
+    attempts: int = 3
+    """Maximum number of times a request is made, including the first attempt."""
+    backoff: float = 0.5
+    """Maximum number of seconds to wait before the first retry, doubling for each retry after that."""
+    max_delay: float = 10
+    """Maximum number of seconds to wait before any retry. Longer waits asked for by the API using Retry-After are
+    shortened to this, so that a single response cannot stall every caller sharing the rate limiter."""
+    deadline: t.Optional[float] = 30
+    """Maximum number of seconds after the first attempt by which retries must have been made, or None for no limit."""
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    """Status codes for which requests are retried."""
+    on_retry: t.Optional[OnRetry] = None
+    """Function called before each retry, which can be used to record retries."""
+
+    def delay(self: "RetryPolicy", attempt: int, retry_after: t.Optional[float] = None) -> float:
+        """Return the number of seconds to wait after the given attempt (starting at 1) failed, before retrying.
+
+        If `retry_after` is given, the wait is at least that many seconds."""
+        delay: float = random.uniform(0, min(self.max_delay, self.backoff * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            # Jitter is still added, so that callers told to retry after the same time do not all retry at once
+            delay = retry_after + random.uniform(0, self.backoff)
+        return delay
+
+
+def parse_retry_after(value: t.Optional[str]) -> t.Optional[float]:
+    """Return the number of seconds to wait given by the value of a Retry-After header, which may be either a number
+    of seconds or an HTTP date, or None if the value is missing or invalid (including infinite or NaN values)."""
+    if not value:
+        return None
+    try:
+        seconds: float = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+
+    try:
+        date: datetime = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+def _retry_after(policy: RetryPolicy, value: t.Optional[str]) -> t.Optional[float]:
+    """Return the number of seconds to wait given by the value of a Retry-After header, shortened to the policy's
+    `max_delay`, or None if the value is missing or invalid."""
+    retry_after: t.Optional[float] = parse_retry_after(value)
+    return min(retry_after, policy.max_delay) if retry_after is not None else None
+
+
+def _next_delay(policy: RetryPolicy, endpoint: str, attempt: int, started: float, cause: int | BaseException,
+                retry_after: t.Optional[float] = None) -> t.Optional[float]:
+    """Return the number of seconds to wait before retrying a request that failed on the given attempt, or None if it
+    should not be retried.
+
+    `started` is the :func:`time.monotonic` time of the first attempt. Calls the policy's `on_retry` function if the
+    request will be retried."""
+    if attempt >= policy.attempts:
+        return None
+
+    delay: float = policy.delay(attempt, retry_after)
+    if policy.deadline is not None and time.monotonic() + delay - started > policy.deadline:
+        return None
+
+    _logger.debug("Retrying %s in %.2f seconds after attempt %d failed: %r", endpoint, delay, attempt, cause)
+    if policy.on_retry is not None:
+        policy.on_retry(endpoint, attempt, delay, cause)
+    return delay
@@ -0,0 +1,487 @@
+"""Local stand-in for the MCC Event API, for exercising clients over real HTTP without making requests to the API.
+
+:class:`FakeEventServer` serves every ``/v1`` endpoint from saved responses (such as those in the repository's
+``tests/event/mock_data`` directory) or from generated data, and can be made slower or less reliable using a
+:class:`FaultProfile`. For example, to check how a client copes with a busy API:
+
+.. code-block:: python
+
+   faults = mcc_api.event.server.FaultProfile(latency=0.05, jitter=0.05, error_rate=0.1, rate_limit=40)
+   with mcc_api.event.server.FakeEventServer(faults=faults) as server:
+       client = mcc_api.event.client.EventClient(server.url)
+       client.get_rundown("MCC25")
+       print(server.stats)
+
+The server can also be run from the command line using ``python -m mcc_api.event.server``, which accepts the same
+options (run with ``--help`` for details).
+"""
+
+from .enums import Game, Team
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+import typing as t
+
+# Teams that play in events, in the order used when generating data
+_TEAMS: t.Final[tuple[Team, ...]] = tuple(team for team in Team if team not in (Team.SPECTATORS, Team.NONE))
+# Games that make up an event's history, with Dodgebolt instead being recorded as the event's final
+_GAMES: t.Final[tuple[Game, ...]] = tuple(
+    game for game in Game if game.name.startswith("MG_") and game is not Game.MG_DODGEBOLT
+)
+_MULTIPLIERS: t.Final[tuple[float, ...]] = (1, 1.5, 2, 2.5, 3)
+
+
+def _username(team: Team, number: int) -> str:
+    """Return the username of a generated participant, such as ``"Red1"``."""
+    return f"{team.name.title()}{number}"
+
+
+def _placements(scores: dict[str, int]) -> dict[str, int]:
+    """Return the zero-indexed placement of each team, with the highest score placed first."""
+    return {team: placement for placement, team in enumerate(sorted(scores, key=scores.__getitem__, reverse=True))}
+
+
+def synthetic_participants(*, players_per_team: int = 4, spectators: int = 2,
+                           seed: t.Optional[int] = None) -> dict[str, t.Any]:
+    """Return generated JSON data in the form returned by the `/participants` endpoint.
+
+    Each team has `players_per_team` participants, named after their team (e.g. ``"Red1"``), with random UUIDs that
+    are the same for the same `seed`."""
+    rng: random.Random = random.Random(seed)
+
+    def creator(team: Team, number: int) -> dict[str, str]:
+        username: str = _username(team, number)
+        return {
+            "username": username,
+            "uuid": f"{rng.getrandbits(128):032x}",
+            "stream": f"https://twitch.tv/{username}",
+            "icon": f"https://static-cdn.jtvnw.net/jtv_user_pictures/{username.lower()}-profile_image-50x50.png",
+            "team": str(team),
+            "platform": "twitch"
+        }
+
+    data: dict[str, list[dict[str, str]]] = {
+        str(team): [creator(team, number) for number in range(1, players_per_team + 1)] for team in _TEAMS
+    }
+    data[str(Team.SPECTATORS)] = [creator(Team.SPECTATORS, number) for number in range(1, spectators + 1)]
+    data[str(Team.NONE)] = []
+    return {"code": 200, "data": data}
+
+
+def synthetic_rundown(*, games: int = 8, teams: int = 10, players_per_team: int = 4,
+                      seed: t.Optional[int] = None) -> dict[str, t.Any]:
+    """Return generated JSON data in the form returned by the `/rundown` endpoint.
+
+    The event is played by `teams` teams (up to 10) of `players_per_team` participants, named as by
+    :func:`synthetic_participants`, and has `games` games in its history. Games are chosen from every game that has
+    been played at MCC, and are repeated if `games` is larger than that. Scores are random, but are the same for the
+    same `seed`, so the size of the rundown can be scaled up without changing its shape, such as for benchmarks."""
+    if not 2 <= teams <= len(_TEAMS):
+        raise ValueError(f"teams must be between 2 and {len(_TEAMS)}")
+    rng: random.Random = random.Random(seed)
+
+    players: dict[str, list[str]] = {
+        str(team): [_username(team, number) for number in range(1, players_per_team + 1)] for team in _TEAMS[:teams]
+    }
+    event_scores: dict[str, int] = dict.fromkeys(players, 0)
+    individual_scores: dict[str, int] = {player: 0 for team_players in players.values() for player in team_players}
+    order: list[Game] = rng.sample(_GAMES, len(_GAMES))
+
+    history: dict[str, dict[str, t.Any]] = {}
+    for index in range(games):
+        multiplier: float = _MULTIPLIERS[index * len(_MULTIPLIERS) // games]
+        game_individual_scores: dict[str, int] = {
+            player: int(rng.randint(0, 400) * multiplier) for player in individual_scores
+        }
+        game_scores: dict[str, int] = {
+            team: sum(game_individual_scores[player] for player in team_players)
+            for team, team_players in players.items()
+        }
+        for team, score in game_scores.items():
+            event_scores[team] += score
+        for player, score in game_individual_scores.items():
+            individual_scores[player] += score
+
+        history[str(index)] = {
+            "gameScores": game_scores,
+            "multiplier": multiplier,
+            "gamePlacements": _placements(game_scores),
+            "index": index,
+            "game": str(order[index % len(order)]),
+            "eventScores": dict(event_scores),
+            "individualScores": dict(individual_scores),
+            "eventPlacements": _placements(event_scores)
+        }
+
+    # The two highest scoring teams play Dodgebolt, and its winner is placed first
+    event_placements: dict[str, int] = _placements(event_scores)
+    finalists: list[str] = sorted(event_placements, key=event_placements.__getitem__)[:2]
+    winner: str = rng.choice(finalists)
+    loser: str = finalists[0] if winner == finalists[1] else finalists[1]
+    event_placements[winner], event_placements[loser] = 0, 1
+
+    return {
+        "code": 200,
+        "data": {
+            "dodgeboltData": {winner: 3, loser: rng.randint(0, 2)},
+            "eventPlacements": event_placements,
+            "eventScores": event_scores,
+            "individualScores": individual_scores,
+            "history": history,
+            "creators": {**players, str(Team.NONE): []}
+        }
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class FaultProfile:
+    """Description of how slow and unreliable a :class:`FakeEventServer` should be.
+
+    Faults are chosen at random for each request, in the order they are listed here, so a request that is rate limited
+    is never also responded to with an error."""
+
+    latency: float = 0
+    """Number of seconds to wait before responding to each request."""
+    jitter: float = 0
+    """Maximum number of seconds to wait before responding to each request, in addition to `latency`, chosen at random
+    for each request."""
+    rate_limit: t.Optional[int] = None
+    """Number of requests that each client address may make within each window of `rate_limit_period` seconds before
+    being responded to with a 429 status code, or None for no limit."""
+    rate_limit_period: float = 60
+    """Length of the window, in seconds, over which `rate_limit` requests may be made."""
+    retry_after: bool = True
+    """Whether responses with a 429 status code include a Retry-After header, giving the number of seconds until the
+    client's window ends (or 1 second, for responses chosen using `throttle_rate`)."""
+    throttle_rate: float = 0
+    """Proportion of requests that are responded to with a 429 status code, regardless of `rate_limit`."""
+    disconnect_rate: float = 0
+    """Proportion of requests whose connection is closed without a response being sent."""
+    error_rate: float = 0
+    """Proportion of requests that are responded to with one of `error_statuses`."""
+    error_statuses: tuple[int, ...] = (500, 502, 503, 504)
+    """Status codes used for responses chosen using `error_rate`."""
+
+
+@dataclass(slots=True)
+class ServerStats:
+    """Counts of the requests handled by a :class:`FakeEventServer`."""
+
+    requests: int = 0
+    """Number of requests received."""
+    connections: int = 0
+    """Number of connections accepted, which is lower than `requests` if connections are being reused."""
+    not_modified: int = 0
+    """Number of requests responded to with a 304 status code, as their If-None-Match header matched."""
+    rate_limited: int = 0
+    """Number of requests responded to with a 429 status code."""
+    errors: int = 0
+    """Number of requests responded to with a status code chosen using :attr:`FaultProfile.error_rate`."""
+    disconnects: int = 0
+    """Number of requests whose connection was closed without a response."""
+    endpoints: dict[str, int] = field(default_factory=dict)
+    """Number of requests received for each endpoint, such as ``"rundown/MCC25"``."""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler for the requests made to a :class:`FakeEventServer`."""
+
+    # HTTP/1.1 keeps connections open between requests, so that connection pooling can be measured
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer"
+
+    def setup(self: "_Handler") -> None:
+        super().setup()
+        self.server.api._count("connections")
+
+    def do_GET(self: "_Handler") -> None:
+        self.server.api._handle(self)
+
+    def log_message(self: "_Handler", format: str, *args: t.Any) -> None:
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    api: "FakeEventServer"
+
+
+class FakeEventServer:
+    """Local HTTP server that stands in for the MCC Event API, serving every endpoint of version 1 of the API.
+
+    If `fixtures` is given, it is the path of a directory of saved responses named as in the repository's
+    ``tests/event/mock_data`` directory (``200_event.json``, ``200_events.json``, ``200_halloffame.json``,
+    ``200_participants.json``, and ``200_rundown.json``), which are served instead of generated data where they exist.
+    The saved rundown is served for every event. Otherwise, data is generated using :func:`synthetic_participants` and
+    :func:`synthetic_rundown`, with `events` events. Endpoints for a single team, game, or participant are served from
+    the same data, and unknown teams, games, participants, and events are responded to with a 404 status code, as the
+    API would.
+
+    Responses include an ETag header, and requests whose If-None-Match header matches it are responded to with a 304
+    status code. Connections are kept open between requests. The server listens on `host` and `port` (by default, a
+    free port on the loopback interface), and handles each connection in its own thread once started using
+    :meth:`start`, or when used as a context manager.
+    """
+
+    faults: FaultProfile
+    """Faults injected into responses, which can be replaced while the server is running."""
+    stats: ServerStats
+    """Counts of the requests handled since the server was created or :meth:`reset_stats` was last called."""
+
+    _httpd: _HTTPServer
+    _thread: t.Optional[threading.Thread]
+    _responses: dict[str, tuple[bytes, str]]
+    _random: random.Random
+    _lock: threading.Lock
+    _windows: dict[str, tuple[float, int]]
+
+    def __init__(self: "FakeEventServer", fixtures: t.Optional[str | os.PathLike[str]] = None, *,
+                 faults: t.Optional[FaultProfile] = None, host: str = "127.0.0.1", port: int = 0, events: int = 40,
+                 seed: t.Optional[int] = None) -> None:
+        self.faults = faults if faults is not None else FaultProfile()
+        self.stats = ServerStats()
+
+        self._thread = None
+        self._responses = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._windows = {}
+        self.__load(fixtures, events, seed)
+
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.api = self
+
+    @property
+    def url(self: "FakeEventServer") -> str:
+        """Base URL of the server's version 1 endpoints, to be used as the base URL of an
+        :class:`~mcc_api.event.client.EventClient`."""
+        host: str
+        port: int
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __load(self: "FakeEventServer", fixtures: t.Optional[str | os.PathLike[str]], events: int,
+               seed: t.Optional[int]) -> None:
+        """Encode the response for every endpoint that the server can respond to with a 200 status code."""
+        def fixture(name: str) -> t.Optional[t.Any]:
+            if fixtures is None or not os.path.exists(path := os.path.join(fixtures, f"200_{name}.json")):
+                return None
+            with open(path, "rb") as f:
+                f: t.BinaryIO
+                return json.loads(f.read())["data"]
+
+        event_keys: list[str] = fixture("events") or [f"MCC{number}" for number in range(1, events + 1)]
+        event: dict[str, t.Any] = fixture("event") or {
+            "date": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "event": event_keys[-1],
+            "updateVideo": None
+        }
+        hall_of_fame: dict[str, t.Any] = fixture("halloffame") or {
+            str(game): {
+                "RECORD NAME 1": {"placement": 0, "player": "Red1", "value": "String value", "changedHands": False},
+                "RECORD NAME 2": {"placement": 1, "player": "Blue1", "value": 0, "changedHands": True}
+            } for game in Game
+        }
+        participants: dict[str, list[dict[str, t.Any]]] = \
+            fixture("participants") or synthetic_participants(seed=seed)["data"]
+        rundown: t.Optional[dict[str, t.Any]] = fixture("rundown")
+        if rundown is not None:
+            self.__add("rundown", rundown)
+
+        self.__add("event", event)
+        self.__add("events", event_keys)
+        self.__add("halloffame", hall_of_fame)
+        for game in Game:
+            self.__add(f"halloffame/{game}", hall_of_fame.get(str(game), {}))
+        self.__add("participants", participants)
+        for team in Team:
+            self.__add(f"participants/{team}", participants.get(str(team), []))
+            for participant in participants.get(str(team), []):
+                self.__add(f"participant/{participant['uuid']}", participant)
+        for number, key in enumerate(event_keys):
+            if rundown is not None:
+                self._responses[f"rundown/{key}"] = self._responses["rundown"]
+            else:
+                self.__add(f"rundown/{key}", synthetic_rundown(seed=None if seed is None else seed + number)["data"])
+        if rundown is None:
+            self._responses["rundown"] = self._responses.get(f"rundown/{event['event']}",
+                                                             self._responses[f"rundown/{event_keys[-1]}"])
+
+    def __add(self: "FakeEventServer", endpoint: str, data: t.Any) -> None:
+        body: bytes = json.dumps({"code": 200, "data": data}).encode("utf-8")
+        self._responses[endpoint] = (body, f"\"{hashlib.blake2b(body, digest_size=8).hexdigest()}\"")
+
+    def start(self: "FakeEventServer") -> "FakeEventServer":
+        """Start handling requests in a background thread, returning the server."""
+        if self._thread is None:
+            # A short poll interval lets stop() return quickly, which matters when a server is started for each test
+            self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                            name="FakeEventServer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self: "FakeEventServer") -> None:
+        """Stop handling requests, and close the server's socket. The server cannot be started again."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self: "FakeEventServer") -> None:
+        """Handle requests in the current thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def __enter__(self: "FakeEventServer") -> "FakeEventServer":
+        return self.start()
+
+    def __exit__(self: "FakeEventServer", *args: t.Any) -> None:
+        self.stop()
+
+    def reset_stats(self: "FakeEventServer") -> None:
+        """Reset the counts of requests handled, and the rate limit windows of every client."""
+        with self._lock:
+            self.stats = ServerStats()
+            self._windows = {}
+
+    def _count(self: "FakeEventServer", name: str) -> None:
+        """Increment one of the counts in :attr:`stats`."""
+        with self._lock:
+            setattr(self.stats, name, getattr(self.stats, name) + 1)
+
+    def __rate_limit(self: "FakeEventServer", client: str, faults: FaultProfile) -> t.Optional[float]:
+        """Count a request made by the given client address against the rate limit, returning the number of seconds
+        until its window ends if it has been exceeded, or None if not."""
+        if faults.rate_limit is None:
+            return None
+
+        now: float = time.monotonic()
+        with self._lock:
+            started: float
+            count: int
+            started, count = self._windows.get(client, (now, 0))
+            if now - started >= faults.rate_limit_period:
+                started, count = now, 0
+            self._windows[client] = (started, count + 1)
+        return started + faults.rate_limit_period - now if count >= faults.rate_limit else None
+
+    def _handle(self: "FakeEventServer", request: _Handler) -> None:
+        """Respond to a single request, injecting faults as described by :attr:`faults`."""
+        faults: FaultProfile = self.faults
+        endpoint: str = request.path.partition("?")[0].strip("/").removeprefix("v1").strip("/")
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.endpoints[endpoint] = self.stats.endpoints.get(endpoint, 0) + 1
+
+        delay: float = faults.latency + self._random.uniform(0, faults.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        retry_after: t.Optional[float] = self.__rate_limit(request.client_address[0], faults)
+        if retry_after is None and self._random.random() < faults.throttle_rate:
+            retry_after = 1
+        if retry_after is not None:
+            self._count("rate_limited")
+            self.__send(request, 429, {"status": 429, "reason": "Too many requests"},
+                        {"Retry-After": str(math.ceil(retry_after))} if faults.retry_after else {})
+            return
+
+        if self._random.random() < faults.disconnect_rate:
+            self._count("disconnects")
+            request.close_connection = True
+            return
+
+        if faults.error_statuses and self._random.random() < faults.error_rate:
+            self._count("errors")
+            status: int = self._random.choice(faults.error_statuses)
+            self.__send(request, status, {"status": status, "reason": HTTPStatus(status).phrase})
+            return
+
+        response: t.Optional[tuple[bytes, str]] = self._responses.get(endpoint)
+        if response is None:
+            self.__send(request, 404, {"status": 404, "reason": self.__not_found(endpoint)})
+            return
+
+        body: bytes
+        etag: str
+        body, etag = response
+        if request.headers.get("If-None-Match") == etag:
+            self._count("not_modified")
+            request.send_response(304)
+            request.send_header("ETag", etag)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+        self.__send(request, 200, body, {"ETag": etag})
+
+    @staticmethod
+    def __not_found(endpoint: str) -> str:
+        """Return the reason given by the API when the resource requested from the given endpoint does not exist."""
+        match endpoint.partition("/")[0]:
+            case "rundown": return "Not Found - Event not found"
+            case "halloffame": return "Not Found - Game not found"
+            case "participants": return "Not Found - Team not found"
+            case "participant": return "Not Found - Participant not found"
+            case _: return "Not Found"
+
+    @staticmethod
+    def __send(request: _Handler, status: int, body: bytes | dict[str, t.Any],
+               headers: t.Optional[dict[str, str]] = None) -> None:
+        """Send a response with the given status code, JSON body, and headers."""
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json; charset=utf-8")
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def main(args: t.Optional[list[str]] = None) -> None:
+    """Run a :class:`FakeEventServer` from the command line until interrupted."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m mcc_api.event.server", description="Run a local stand-in for the MCC Event API."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: %(default)s)")
+    parser.add_argument("--fixtures", help="directory of saved responses to serve instead of generated data")
+    parser.add_argument("--events", type=int, default=40, help="number of events to generate (default: %(default)s)")
+    parser.add_argument("--seed", type=int, help="seed used to generate data and choose faults")
+    defaults: FaultProfile = FaultProfile()
+    for name in ("latency", "jitter", "rate_limit_period", "throttle_rate", "disconnect_rate", "error_rate"):
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, default=getattr(defaults, name),
+                            help="see FaultProfile (default: %(default)s)")
+    parser.add_argument("--rate-limit", type=int, help="requests allowed per client per period (default: no limit)")
+    parser.add_argument("--no-retry-after", action="store_true", help="omit Retry-After from 429 responses")
+    options: argparse.Namespace = parser.parse_args(args)
+
+    faults: FaultProfile = FaultProfile(
+        latency=options.latency, jitter=options.jitter, rate_limit=options.rate_limit,
+        rate_limit_period=options.rate_limit_period, retry_after=not options.no_retry_after,
+        throttle_rate=options.throttle_rate, disconnect_rate=options.disconnect_rate, error_rate=options.error_rate
+    )
+    server: FakeEventServer = FakeEventServer(options.fixtures, faults=faults, host=options.host, port=options.port,
+                                              events=options.events, seed=options.seed)
+    print(f"Serving the MCC Event API at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from concurrent.futures import Future
+import asyncio
+import threading
+import typing as t
+
+_V = t.TypeVar("_V")
+
+
+class SingleFlight(t.Generic[_V]):
+    """Coalesces concurrent calls that share a key, so that only one of them is made while it is in flight.
+
+    The first caller for a key makes the call, and any callers for the same key that arrive before it has finished wait
+    for it instead of making their own, receiving the same result (or having the same exception raised). Once the call
+    has finished, the next caller for that key makes a new call.
+
+    Used by :mod:`mcc_api.event` and :mod:`mcc_api.event.aio` so that concurrent requests to the same endpoint share a
+    single request, and return the same response object.
+    """
+
+    coalesced: int
+    """Number of calls that waited for a call already in flight, rather than being made."""
+
+    _calls: dict[t.Hashable, Future[_V]]
+    _tasks: dict[t.Hashable, asyncio.Task[_V]]
+    _lock: threading.Lock
+
+    def __init__(self: "SingleFlight[_V]") -> None:
+        self.coalesced = 0
+
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def do(self: "SingleFlight[_V]", key: t.Hashable, function: t.Callable[[], _V]) -> _V:
+        """Call `function` and return its result, unless a call with the same key is already in flight, in which case
+        wait for and return its result instead."""
+        with self._lock:
+            in_flight: t.Optional[Future[_V]] = self._calls.get(key)
+            if in_flight is not None:
+                self.coalesced += 1
+            else:
+                future: Future[_V] = Future()
+                future.set_running_or_notify_cancel()
+                self._calls[key] = future
+
+        if in_flight is not None:
+            return in_flight.result()
+
+        try:
+            result: _V = function()
+        except BaseException as e:
+            # Caught as BaseException, as mcc_api's exceptions derive from it
+            self.__finish(key)
+            future.set_exception(e)
+            raise
+        self.__finish(key)
+        future.set_result(result)
+        return result
+
+    def __finish(self: "SingleFlight[_V]", key: t.Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+    async def do_async(self: "SingleFlight[_V]", key: t.Hashable, function: t.Callable[[], t.Awaitable[_V]]) -> _V:
+        """Await `function()` and return its result, unless a call with the same key is already in flight within the
+        running event loop, in which case wait for and return its result instead.
+
+        The call is made in a separate task, so cancelling one caller does not cancel the call for the others."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        with self._lock:
+            task: t.Optional[asyncio.Task[_V]] = self._tasks.get(key)
+            if task is not None and not task.done() and task.get_loop() is loop:
+                self.coalesced += 1
+            else:
+                task = self._tasks[key] = loop.create_task(function())
+                task.add_done_callback(lambda done: self.__finish_task(key, done))
+
+        return await asyncio.shield(task)
+
+    def __finish_task(self: "SingleFlight[_V]", key: t.Hashable, task: asyncio.Task[_V]) -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Retrieve the exception, so that it is not reported as unretrieved if every caller was cancelled
+            task.exception()
@@ -0,0 +1,19 @@
+from .exceptions import InvalidUUIDError
+import re
+import typing as t
+
+__uuid_pattern: t.Final[re.Pattern[str]] = re.compile(
+    r"[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE
+)
+
+
+def canonical_uuid(uuid: str) -> str:
+    """Return the canonical (un-dashed and lowercase) form of a Minecraft UUID, as used by the MCC API.
+
+    Accepts both dashed (e.g. 3e7a89ee-c4e2-4392-a317-444b861b0794) and un-dashed
+    (e.g. 3e7a89eec4e24392a317444b861b0794) UUIDs, in either case. Raises an
+    :class:`mcc_api.exceptions.InvalidUUIDError` exception if the UUID is malformed."""
+    if not isinstance(uuid, str) or not __uuid_pattern.fullmatch(uuid):
+        raise InvalidUUIDError(400, f"Malformed UUID: {uuid!r}")
+    return uuid.replace("-", "").lower()
@@ -0,0 +1,238 @@
+from . import get_default_client
+from .client import EventClient
+from .responses import BaseResponse, EventInformationResponse, ParticipantsResponse, RundownResponse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import asyncio
+import logging
+import threading
+import time
+import typing as t
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+_T = t.TypeVar("_T", bound=BaseResponse)
+Callback = t.Callable[[_T, t.Optional[_T]], None]
+"""Function called with the new response and the previous response (or None if there was no previous response)."""
+
+
+@dataclass(slots=True)
+class _Watch:
+    """State of a single endpoint being watched."""
+
+    name: str
+    fetch: t.Callable[[], BaseResponse]
+    callbacks: list[Callback[t.Any]]
+    interval: float
+    due: float = 0
+    last: t.Optional[BaseResponse] = None
+
+
+class EventWatcher:
+    """Polls endpoints of the MCC Event API in the background, calling callbacks only when their data changes.
+
+    Each watched endpoint is polled at its own interval, which starts at `min_interval` seconds and grows by a factor
+    of `backoff` each time the data has not changed, up to `max_interval` seconds. When the data changes, the interval
+    returns to `min_interval`. While the current event cycle's event has not yet started, endpoints are polled at
+    most every `max_interval` seconds, with a poll made as soon as the event starts. Requests made by the watcher
+    count towards the shared rate limit.
+
+    The watcher can be run in a background thread using :meth:`start` and :meth:`stop`, or as an asyncio task using
+    :meth:`run`. For example:
+
+    .. code-block:: python
+
+       def on_rundown(rundown, previous):
+           print(rundown.data.eventScores)
+
+       watcher = mcc_api.event.watcher.EventWatcher()
+       watcher.watch_rundown(on_rundown)
+       watcher.start()
+
+    Callbacks are called with the new response and the previous response, which is None the first time that an
+    endpoint is polled. Exceptions raised while polling are passed to `on_error` if given, or logged otherwise.
+    Requests are made using `client` if given, or the default client of :mod:`mcc_api.event` otherwise.
+
+    .. note::
+       If a response cache has been set using :func:`mcc_api.event.set_response_cache`, polls will return the cached
+       response until it expires, so changes will be noticed no sooner than the cache's TTL for that endpoint.
+    """
+
+    min_interval: float
+    """Minimum number of seconds between polls of an endpoint."""
+    max_interval: float
+    """Maximum number of seconds between polls of an endpoint."""
+    backoff: float
+    """Factor by which the interval between polls of an endpoint grows each time its data has not changed."""
+    timeout: t.Optional[int]
+    """Number of seconds before each request times out, or None to use the timeout of the client."""
+    on_error: t.Optional[t.Callable[[str, BaseException], None]]
+    """Function called with the name of the endpoint and the exception raised, if polling an endpoint fails."""
+    client: t.Optional[EventClient]
+    """Client used to make requests, or None to use the default client of :mod:`mcc_api.event`."""
+
+    _watches: dict[str, _Watch]
+    _event_start: t.Optional[datetime]
+    _lock: threading.Lock
+    _wakeup: threading.Event
+    _stopped: bool
+    _thread: t.Optional[threading.Thread]
+
+    def __init__(self: "EventWatcher", *, min_interval: float = 5, max_interval: float = 300, backoff: float = 1.5,
+                 timeout: t.Optional[int] = None, on_error: t.Optional[t.Callable[[str, BaseException], None]] = None,
+                 client: t.Optional[EventClient] = None) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.on_error = on_error
+        self.client = client
+
+        self._watches = {}
+        self._event_start = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = None
+
+        # The event is always watched, so that polling can slow down until the event starts
+        self.__watch("event", lambda: self.__client().get_event(timeout=self.timeout), None)
+
+    def __client(self: "EventWatcher") -> EventClient:
+        return self.client if self.client is not None else get_default_client()
+
+    def __watch(self: "EventWatcher", name: str, fetch: t.Callable[[], BaseResponse],
+                callback: t.Optional[Callback[t.Any]]) -> None:
+        with self._lock:
+            watch: t.Optional[_Watch] = self._watches.get(name)
+            if watch is None:
+                watch = self._watches[name] = _Watch(name, fetch, [], self.min_interval)
+            if callback is not None:
+                watch.callbacks.append(callback)
+        self._wakeup.set()
+
+    def watch_event(self: "EventWatcher", callback: Callback[EventInformationResponse]) -> None:
+        """Call `callback` whenever the current event cycle's event (as returned by :func:`mcc_api.event.get_event`)
+        changes."""
+        self.__watch("event", lambda: self.__client().get_event(timeout=self.timeout), callback)
+
+    def watch_participants(self: "EventWatcher", callback: Callback[ParticipantsResponse]) -> None:
+        """Call `callback` whenever the participants in the current event cycle (as returned by
+        :func:`mcc_api.event.get_participants`) change."""
+        self.__watch("participants", lambda: self.__client().get_participants(timeout=self.timeout), callback)
+
+    def watch_rundown(self: "EventWatcher", callback: Callback[RundownResponse], event: t.Optional[str] = None, *,
+                      lazy: bool = False) -> None:
+        """Call `callback` whenever the rundown of the given event, or the latest event if none is given (as returned
+        by :func:`mcc_api.event.get_rundown`), changes."""
+        self.__watch(
+            f"rundown/{event}" if event else "rundown",
+            lambda: self.__client().get_rundown(event, lazy=lazy, timeout=self.timeout),
+            callback
+        )
+
+    def _next_watch(self: "EventWatcher") -> tuple[_Watch, float]:
+        """Return the watch that is due to be polled next, and the number of seconds until it is due."""
+        with self._lock:
+            watch: _Watch = min(self._watches.values(), key=lambda w: w.due)
+        return watch, watch.due - time.monotonic()
+
+    def _interval(self: "EventWatcher", watch: _Watch) -> float:
+        """Return the number of seconds until the watch should next be polled."""
+        interval: float = watch.interval
+        if self._event_start is not None:
+            until_start: float = (self._event_start - datetime.now(tz=timezone.utc)).total_seconds()
+            if until_start > 0:
+                interval = max(interval, min(self.max_interval, until_start))
+        return interval
+
+    def _fetch(self: "EventWatcher", watch: _Watch) -> t.Optional[BaseResponse]:
+        """Poll the watch's endpoint, returning None if an exception was raised."""
+        try:
+            return watch.fetch()
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except BaseException as e:
+            # Caught as BaseException, as mcc_api's exceptions derive from it
+            self._report(watch.name, e)
+            return None
+
+    def _report(self: "EventWatcher", name: str, error: BaseException) -> None:
+        if self.on_error is not None:
+            self.on_error(name, error)
+        else:
+            _logger.warning("Polling %s failed", name, exc_info=error)
+
+    def _observe(self: "EventWatcher", watch: _Watch, response: t.Optional[BaseResponse]) -> None:
+        """Compare a newly polled response with the previous one, calling the watch's callbacks if it changed, and
+        schedule the next poll."""
+        previous: t.Optional[BaseResponse] = watch.last
+        changed: bool = response is not None and (
+            previous is None or (response is not previous and response.raw != previous.raw)
+        )
+
+        if changed:
+            watch.last = response
+            watch.interval = self.min_interval
+            if isinstance(response, EventInformationResponse):
+                self._event_start = response.data.date
+            for callback in list(watch.callbacks):
+                try:
+                    callback(response, previous)
+                except Exception as e:
+                    self._report(watch.name, e)
+        else:
+            watch.interval = min(self.max_interval, watch.interval * self.backoff)
+
+        watch.due = time.monotonic() + self._interval(watch)
+
+    def start(self: "EventWatcher") -> None:
+        """Start polling in a background (daemon) thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopped = False
+        self._thread = threading.Thread(target=self.__run_thread, name="mcc_api-event-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self: "EventWatcher", timeout: t.Optional[float] = None) -> None:
+        """Stop polling in the background thread, waiting up to `timeout` seconds for any poll in progress to finish."""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __run_thread(self: "EventWatcher") -> None:
+        while not self._stopped:
+            watch: _Watch
+            wait: float
+            watch, wait = self._next_watch()
+            if wait > 0:
+                self._wakeup.wait(wait)
+                self._wakeup.clear()
+                continue
+
+            self._observe(watch, self._fetch(watch))
+
+    async def run(self: "EventWatcher") -> None:
+        """Poll until cancelled, calling callbacks from within the running event loop.
+
+        Requests are made in a separate thread, so that they do not block the event loop. For example:
+
+        .. code-block:: python
+
+           task = asyncio.create_task(watcher.run())
+           ...
+           task.cancel()
+        """
+        while True:
+            watch: _Watch
+            wait: float
+            watch, wait = self._next_watch()
+            if wait > 0:
+                # Sleep in short steps, so that newly added watches are noticed
+                await asyncio.sleep(min(wait, 1))
+                continue
+
+            self._observe(watch, await asyncio.to_thread(self._fetch, watch))
@@ -0,0 +1,241 @@
+"""Hooks for measuring the requests made to the MCC Event and Island APIs.
+
+Each call made through :mod:`mcc_api.event` (and :mod:`mcc_api.event.aio`) or :data:`mcc_api.island.client` is
+described by a :class:`RequestMetrics` object, which is passed to every hook added using
+:func:`mcc_api.event.add_request_hook` or :func:`mcc_api.island.add_request_hook` once the call has finished. For
+example, to log the time spent waiting for the rate limiter:
+
+.. code-block:: python
+
+   def log_request(metrics):
+       print(f"{metrics.endpoint}: {metrics.total_time:.3f}s ({metrics.limiter_wait:.3f}s rate limited)")
+
+   mcc_api.event.add_request_hook(log_request)
+
+:class:`MetricsCollector` can be used as a hook to aggregate measurements by endpoint, and :class:`OpenTelemetryHook` to
+record each call as an `OpenTelemetry <https://opentelemetry.io>`_ span.
+"""
+
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+import typing as t
+
+__all__ = [
+    "Hook",
+    "MetricsCollector",
+    "OpenTelemetryHook",
+    "RequestMetrics"
+]
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """Measurements of a single call to one of the MC Championship APIs.
+
+    Times are in seconds. Phases that do not apply to a call (such as building a response that was cached) are zero.
+    """
+
+    api: str
+    """The API that was called, either ``"event"`` or ``"island"``."""
+    endpoint: str
+    """The endpoint that was requested (e.g. ``"rundown/MCC25"``), or the name of the GraphQL operation that was
+    executed (or ``"graphql"`` if it has no name)."""
+    started: float = field(default_factory=time.time)
+    """The time at which the call was made, as returned by :func:`time.time`."""
+    status: t.Optional[int] = None
+    """The status code of the last response received, or None if no response was received."""
+    attempts: int = 0
+    """The number of requests that were made, including retries."""
+    limiter_wait: float = 0
+    """Time spent waiting for the rate limiter."""
+    retry_wait: float = 0
+    """Time spent waiting between retries."""
+    server_time: float = 0
+    """Time between sending each request and receiving its response's headers, including connecting to the API."""
+    download_time: float = 0
+    """Time spent receiving the body of each response after its headers."""
+    decode_time: float = 0
+    """Time spent decoding the JSON data of the response."""
+    build_time: float = 0
+    """Time spent building the response object from the decoded data (or validating and parsing the result of a GraphQL
+    operation)."""
+    total_time: float = 0
+    """Time taken by the call as a whole."""
+    bytes: int = 0
+    """Number of bytes received in the bodies of responses."""
+    cache_hit: bool = False
+    """Whether the call was answered from a response cache, error cache, or rundown archive, without making a
+    request."""
+    coalesced: bool = False
+    """Whether the call waited for an identical request already in flight, rather than making its own."""
+    error: t.Optional[BaseException] = None
+    """The exception raised by the call, or None if it succeeded."""
+
+    @property
+    def retries(self: "RequestMetrics") -> int:
+        """The number of requests that were retries."""
+        return max(0, self.attempts - 1)
+
+
+Hook = t.Callable[[RequestMetrics], None]
+"""Function called with the measurements of each call once it has finished."""
+
+
+def _emit(hooks: t.Iterable[Hook], metrics: RequestMetrics) -> None:
+    """Call each hook with the given measurements, logging any exception raised rather than raising it."""
+    for hook in list(hooks):
+        try:
+            hook(metrics)
+        except Exception:
+            _logger.exception("Request hook %r failed", hook)
+
+
+@dataclass(slots=True)
+class _EndpointTotals:
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    bytes: int = 0
+    limiter_wait: float = 0
+    retry_wait: float = 0
+    server_time: float = 0
+    download_time: float = 0
+    decode_time: float = 0
+    build_time: float = 0
+    total_time: float = 0
+
+
+class MetricsCollector:
+    """Hook that aggregates the measurements of every call by API and endpoint.
+
+    Endpoints with parameters are grouped together (e.g. ``"rundown/MCC25"`` is counted as ``"rundown/{event}"``), so
+    that the number of endpoints collected stays small. For example:
+
+    .. code-block:: python
+
+       collector = mcc_api.instrumentation.MetricsCollector()
+       mcc_api.event.add_request_hook(collector)
+       ...
+       print(collector.summary())
+    """
+
+    __parameters: t.ClassVar[dict[str, str]] = {
+        "halloffame": "game",
+        "rundown": "event",
+        "participant": "uuid",
+        "participants": "team"
+    }
+
+    _totals: dict[tuple[str, str], _EndpointTotals]
+    _lock: threading.Lock
+
+    def __init__(self: "MetricsCollector") -> None:
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def __call__(self: "MetricsCollector", metrics: RequestMetrics) -> None:
+        endpoint: str = metrics.endpoint
+        if metrics.api == "event":
+            name: str
+            parameter: str
+            name, _, parameter = endpoint.partition("/")
+            if parameter:
+                endpoint = f"{name}/{{{self.__parameters.get(name, 'parameter')}}}"
+
+        with self._lock:
+            totals: _EndpointTotals = self._totals.setdefault((metrics.api, endpoint), _EndpointTotals())
+            totals.calls += 1
+            totals.errors += metrics.error is not None
+            totals.retries += metrics.retries
+            totals.cache_hits += metrics.cache_hit
+            totals.coalesced += metrics.coalesced
+            totals.bytes += metrics.bytes
+            totals.limiter_wait += metrics.limiter_wait
+            totals.retry_wait += metrics.retry_wait
+            totals.server_time += metrics.server_time
+            totals.download_time += metrics.download_time
+            totals.decode_time += metrics.decode_time
+            totals.build_time += metrics.build_time
+            totals.total_time += metrics.total_time
+
+    def summary(self: "MetricsCollector") -> dict[str, dict[str, float]]:
+        """Return the aggregated measurements, keyed by ``"<api> <endpoint>"``.
+
+        Each value contains the number of ``calls``, ``errors``, ``retries``, ``cache_hits``, ``coalesced`` calls, and
+        ``bytes`` received, along with the mean time spent in each phase (e.g. ``mean_server_time``)."""
+        summary: dict[str, dict[str, float]] = {}
+        with self._lock:
+            for (api, endpoint), totals in sorted(self._totals.items(), key=lambda item: item[0]):
+                summary[f"{api} {endpoint}"] = {
+                    "calls": totals.calls,
+                    "errors": totals.errors,
+                    "retries": totals.retries,
+                    "cache_hits": totals.cache_hits,
+                    "coalesced": totals.coalesced,
+                    "bytes": totals.bytes,
+                    **{
+                        f"mean_{phase}": getattr(totals, phase) / totals.calls
+                        for phase in ("limiter_wait", "retry_wait", "server_time", "download_time", "decode_time",
+                                      "build_time", "total_time")
+                    }
+                }
+        return summary
+
+    def reset(self: "MetricsCollector") -> None:
+        """Discard all aggregated measurements."""
+        with self._lock:
+            self._totals = {}
+
+
+class OpenTelemetryHook:
+    """Hook that records each call as a span using an OpenTelemetry tracer.
+
+    The tracer is not created by this hook, so mcc_api does not depend on OpenTelemetry. Spans are named
+    ``"<api> <endpoint>"`` (e.g. ``"event rundown"``), cover the whole call, and have the call's measurements as
+    attributes prefixed with ``mcc_api.``. For example:
+
+    .. code-block:: python
+
+       from opentelemetry import trace
+       mcc_api.event.add_request_hook(mcc_api.instrumentation.OpenTelemetryHook(trace.get_tracer("mcc_api")))
+
+    As spans are only recorded once each call has finished, they are not made the parent of any spans started while the
+    call is in progress.
+    """
+
+    tracer: t.Any
+    """Tracer used to record spans, such as one returned by ``opentelemetry.trace.get_tracer``."""
+
+    def __init__(self: "OpenTelemetryHook", tracer: t.Any) -> None:
+        self.tracer = tracer
+
+    def __call__(self: "OpenTelemetryHook", metrics: RequestMetrics) -> None:
+        start_time: int = int(metrics.started * 1e9)
+        attributes: dict[str, t.Any] = {
+            "mcc_api.api": metrics.api,
+            "mcc_api.endpoint": metrics.endpoint,
+            "mcc_api.attempts": metrics.attempts,
+            "mcc_api.limiter_wait": metrics.limiter_wait,
+            "mcc_api.retry_wait": metrics.retry_wait,
+            "mcc_api.server_time": metrics.server_time,
+            "mcc_api.download_time": metrics.download_time,
+            "mcc_api.decode_time": metrics.decode_time,
+            "mcc_api.build_time": metrics.build_time,
+            "mcc_api.bytes": metrics.bytes,
+            "mcc_api.cache_hit": metrics.cache_hit,
+            "mcc_api.coalesced": metrics.coalesced
+        }
+        if metrics.status is not None:
+            attributes["http.response.status_code"] = metrics.status
+
+        span: t.Any = self.tracer.start_span(f"{metrics.api} {metrics.endpoint}", start_time=start_time,
+                                             attributes=attributes)
+        if metrics.error is not None:
+            span.record_exception(metrics.error)
+        span.end(end_time=start_time + int(metrics.total_time * 1e9))
@@ -1,16 +1,21 @@
 from .. import __user_agent
+from ..instrumentation import _emit, Hook, RequestMetrics
 from .auth import APIKey
 from .directives import *
 from .enums import *
 from .interfaces import *
 from .types import *
+from contextvars import ContextVar
 from gql import Client
 from gql.transport.requests import RequestsHTTPTransport
-from graphql import GraphQLSchema, specified_directives
+from graphql import DocumentNode, get_operation_ast, GraphQLSchema, OperationDefinitionNode, specified_directives
+import json
+import requests
+import time
 import typing as t
 
 
-__all__ = ["client", "set_api_key"]
+__all__ = ["add_request_hook", "client", "remove_request_hook", "set_api_key"]
 
 __base_url: t.Final[str] = "https://api.mccisland.net/graphql"
 
@@ -77,12 +82,96 @@ schema = GraphQLSchema(
     ]
 )
 
+# Measurements of the operation being executed in the current context, if any hooks have been added
+_metrics: ContextVar[t.Optional[RequestMetrics]] = ContextVar("_metrics", default=None)
+
+
+def _record_response(response: requests.Response, *args: t.Any, **kwargs: t.Any) -> requests.Response:
+    """Record the status code, timings, and size of a response received from the MCC Island API."""
+    metrics: t.Optional[RequestMetrics] = _metrics.get()
+    if metrics is not None:
+        download_started: float = time.perf_counter()
+        # Response hooks are called once the headers have been received, so the body is downloaded here to time it
+        content: bytes = response.content
+        metrics.attempts += 1
+        metrics.status = response.status_code
+        metrics.server_time += response.elapsed.total_seconds()
+        metrics.download_time += time.perf_counter() - download_started
+        metrics.bytes += len(content)
+    return response
+
+
+def _decode_json(data: str | bytes) -> t.Any:
+    """Decode the JSON data of a response received from the MCC Island API, recording the time taken to do so."""
+    metrics: t.Optional[RequestMetrics] = _metrics.get()
+    if metrics is None:
+        return json.loads(data)
+
+    decode_started: float = time.perf_counter()
+    try:
+        return json.loads(data)
+    finally:
+        metrics.decode_time += time.perf_counter() - decode_started
+
+
+def _operation_name(args: tuple[t.Any, ...], kwargs: dict[str, t.Any]) -> str:
+    """Return the name of the GraphQL operation passed to :meth:`gql.Client.execute`, or ``"graphql"`` if it has no
+    name."""
+    if name := kwargs.get("operation_name"):
+        return name
+
+    request: t.Any = args[0] if args else kwargs.get("request", kwargs.get("document"))
+    if name := getattr(request, "operation_name", None):
+        return name
+
+    document: t.Any = getattr(request, "document", request)
+    if isinstance(document, DocumentNode):
+        operation: t.Optional[OperationDefinitionNode] = get_operation_ast(document)
+        if operation is not None and operation.name is not None:
+            return operation.name.value
+    return "graphql"
+
+
+class _InstrumentedClient(Client):
+    """GraphQL client that reports the measurements of each operation it executes to its request hooks."""
+
+    hooks: list[Hook]
+
+    def __init__(self: "_InstrumentedClient", *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.hooks = []
+
+    def execute(self: "_InstrumentedClient", *args: t.Any, **kwargs: t.Any) -> t.Any:
+        if not self.hooks:
+            return super().execute(*args, **kwargs)
+
+        metrics: RequestMetrics = RequestMetrics("island", _operation_name(args, kwargs))
+        started: float = time.perf_counter()
+        token = _metrics.set(metrics)
+        try:
+            return super().execute(*args, **kwargs)
+        except BaseException as e:
+            metrics.error = e
+            raise
+        finally:
+            _metrics.reset(token)
+            metrics.total_time = time.perf_counter() - started
+            # Whatever time was not spent on the request itself was spent validating the operation and parsing the
+            # result using the schema
+            metrics.build_time = max(
+                0.0, metrics.total_time - metrics.server_time - metrics.download_time - metrics.decode_time
+            )
+            _emit(self.hooks, metrics)
+
+
 _transport = RequestsHTTPTransport(
     url=__base_url,
-    headers={"User-Agent": __user_agent}
+    headers={"User-Agent": __user_agent},
+    json_deserialize=_decode_json,
+    hooks={"response": [_record_response]}
 )
 
-client = Client(transport=_transport, schema=schema, serialize_variables=True, parse_results=True)
+client = _InstrumentedClient(transport=_transport, schema=schema, serialize_variables=True, parse_results=True)
 """An instance of :external:class:`gql.Client` configured to make requests to the MCC Island API.
 
 Must be provided an API key using :py:func:`.set_api_key`,
@@ -144,3 +233,20 @@ def set_api_key(api_key: str) -> None:
     API keys can be minted using `Noxcrew Gateway <https://gateway.noxcrew.com>`_."""
 
     _transport.auth = APIKey(api_key)
+
+
+def add_request_hook(hook: Hook) -> None:
+    """Add a function to be called with the measurements of each operation executed using :data:`client`, once it
+    has finished.
+
+    The function is passed a :class:`~mcc_api.instrumentation.RequestMetrics` object describing the operation, whose
+    endpoint is the operation's name. Exceptions raised by the function are logged rather than raised. See
+    :mod:`mcc_api.instrumentation` for hooks that aggregate measurements or record them as OpenTelemetry spans."""
+    client.hooks.append(hook)
+
+
+def remove_request_hook(hook: Hook) -> None:
+    """Remove a function added using :func:`add_request_hook`.
+
+    - May raise :class:`ValueError` if the function has not been added."""
+    client.hooks.remove(hook)
@@ -0,0 +1,163 @@
+from mcc_api.event.archive import RundownArchive
+from mcc_api.event.cache import ResponseCache
+from mcc_api.event.client import EventClient
+from mcc_api.event.enums import Game, Team
+from mcc_api.event.exceptions import InvalidEventError, InvalidTeamError, UnexpectedStatusError
+from mcc_api.event.limiter import TokenBucket
+from mcc_api.event.responses import LazyHistory
+from mcc_api.event.retry import RetryPolicy
+from mcc_api.event.server import FakeEventServer, FaultProfile
+import asyncio
+import mcc_api.event as event_api
+import typing as t
+import unittest
+
+try:
+    import aiohttp
+    import mcc_api.event.aio as aio
+except ImportError:
+    aio = None
+
+
+@unittest.skipIf(aio is None, "aiohttp is not installed")
+class TestAio(unittest.TestCase):
+    previous_client: EventClient
+
+    def setUp(self: "TestAio") -> None:
+        self.previous_client = event_api.get_default_client()
+
+    def tearDown(self: "TestAio") -> None:
+        event_api.set_default_client(self.previous_client)
+
+    def use_server(self: "TestAio", server: FakeEventServer, retry: t.Optional[RetryPolicy] = None) -> None:
+        event_api.set_default_client(
+            EventClient(server.url, limiter=TokenBucket(calls=100_000, period=1, burst=1_000), retry=retry)
+        )
+
+    def test_errors_exhausted(self: "TestAio") -> None:
+        async def get_rundown() -> None:
+            try:
+                await aio.get_rundown("MCC1")
+            finally:
+                await aio.close()
+
+        with FakeEventServer(events=1, faults=FaultProfile(error_rate=1, error_statuses=(503,))) as server:
+            self.use_server(server, RetryPolicy(attempts=2, backoff=0))
+            with self.assertRaises(UnexpectedStatusError) as context:
+                asyncio.run(get_rundown())
+            self.assertEqual(context.exception.code, 503)
+            self.assertEqual(server.stats.errors, 2)
+
+    def test_close(self: "TestAio") -> None:
+        with FakeEventServer(events=1) as server:
+            self.use_server(server)
+
+            async def get_events_and_close() -> None:
+                await aio.get_events()
+                await aio.close()
+                # Closing the session closes its connections, so the next request opens a new one
+                await aio.get_event()
+                await aio.close()
+
+            asyncio.run(get_events_and_close())
+            self.assertEqual(server.stats.connections, 2)
+
+    def test_session_replaced_between_event_loops(self: "TestAio") -> None:
+        with FakeEventServer(events=1) as server:
+            client: aio.AsyncEventClient = aio.AsyncEventClient(
+                EventClient(server.url, limiter=TokenBucket(calls=100_000, period=1, burst=1_000))
+            )
+            asyncio.run(client.get_events())
+            first_session: t.Optional[aiohttp.ClientSession] = client._session
+
+            async def get_events_and_close() -> None:
+                await client.get_events()
+                await client.close()
+
+            asyncio.run(get_events_and_close())
+            self.assertTrue(first_session.closed)
+            self.assertIsNone(client._session)
+
+
+@unittest.skipIf(aio is None, "aiohttp is not installed")
+class TestAsyncEventClient(unittest.IsolatedAsyncioTestCase):
+    server: FakeEventServer
+    client: EventClient
+    async_client: "aio.AsyncEventClient"
+
+    def setUp(self: "TestAsyncEventClient") -> None:
+        self.server = FakeEventServer(events=3).start()
+        self.addCleanup(self.server.stop)
+        self.client = EventClient(self.server.url, limiter=TokenBucket(calls=100_000, period=1, burst=1_000))
+        self.async_client = aio.AsyncEventClient(self.client)
+
+    async def asyncTearDown(self: "TestAsyncEventClient") -> None:
+        await self.async_client.close()
+
+    async def test_responses(self: "TestAsyncEventClient") -> None:
+        self.assertEqual((await self.async_client.get_event()).raw, self.client.get_event().raw)
+        self.assertEqual((await self.async_client.get_events()).data, ["MCC1", "MCC2", "MCC3"])
+        self.assertEqual((await self.async_client.get_rundown()).raw, self.client.get_rundown("MCC3").raw)
+        self.assertIsInstance((await self.async_client.get_rundown("MCC1", lazy=True)).data.history, LazyHistory)
+
+        participants: event_api.ParticipantsResponse = await self.async_client.get_participants()
+        self.assertEqual((await self.async_client.get_participants(Team.RED)).data, participants.data[Team.RED])
+        uuid: str = participants.data[Team.RED][0].uuid
+        self.assertEqual((await self.async_client.get_participant(uuid)).data, participants.data[Team.RED][0])
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(len((await self.async_client.get_hall_of_fame(Game.MG_TGTTOSAWAF)).data), 2)
+
+    async def test_invalid_event(self: "TestAsyncEventClient") -> None:
+        with self.assertRaises(InvalidEventError):
+            await self.async_client.get_rundown("MCC0")
+        with self.assertRaises(InvalidTeamError):
+            await self.async_client.get_participants("UNKNOWN")
+
+        rundowns: dict[str, event_api.RundownResponse | InvalidEventError] = \
+            await self.async_client.get_rundowns(["MCC2", "MCC0", "MCC1", "MCC2"])
+        self.assertEqual(list(rundowns), ["MCC2", "MCC0", "MCC1"])
+        self.assertIsInstance(rundowns["MCC0"], InvalidEventError)
+        self.assertEqual(rundowns["MCC1"].raw, self.client.get_rundown("MCC1").raw)
+
+    async def test_max_concurrency(self: "TestAsyncEventClient") -> None:
+        self.server.faults = FaultProfile(latency=0.05)
+        await self.async_client.get_rundowns(["MCC1", "MCC2", "MCC3"], max_concurrency=1)
+        self.assertEqual(self.server.stats.connections, 1)
+
+        await self.async_client.close()
+        await self.async_client.get_rundowns(["MCC1", "MCC2", "MCC3"], max_concurrency=3)
+        self.assertEqual(self.server.stats.connections, 4)
+
+    async def test_errors_retried(self: "TestAsyncEventClient") -> None:
+        with FakeEventServer(events=5, faults=FaultProfile(error_rate=0.5), seed=3) as server:
+            self.client.base_url = server.url
+            self.client.retry = RetryPolicy(attempts=20, backoff=0)
+            for event in ["MCC1", "MCC2", "MCC3", "MCC4", "MCC5"]:
+                await self.async_client.get_rundown(event)
+            self.assertGreater(server.stats.errors, 0)
+            self.assertEqual(server.stats.requests, 5 + server.stats.errors)
+
+    async def test_response_cache_shared(self: "TestAsyncEventClient") -> None:
+        self.client.cache = ResponseCache()
+        response: event_api.EventsResponse = await self.async_client.get_events()
+        self.assertIs(self.client.get_events(), response)
+        self.assertIs(await self.async_client.get_events(), response)
+        self.assertEqual(self.server.stats.requests, 1)
+
+    async def test_not_modified(self: "TestAsyncEventClient") -> None:
+        response: event_api.RundownResponse = await self.async_client.get_rundown("MCC1")
+        self.assertIs(await self.async_client.get_rundown("MCC1"), response)
+        self.assertIs(self.client.get_rundown("MCC1"), response)
+        self.assertEqual(self.server.stats.not_modified, 2)
+
+    async def test_archive_used(self: "TestAsyncEventClient") -> None:
+        self.client.archive = RundownArchive(":memory:")
+        self.addCleanup(self.client.archive.close)
+        response: event_api.RundownResponse = await self.async_client.get_rundown("MCC1")
+        self.assertEqual(self.client.archive.events(), {"MCC1"})
+        self.assertEqual((await self.async_client.get_rundown("MCC1")).raw, response.raw)
+        self.assertEqual(self.server.stats.requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
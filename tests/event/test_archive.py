@@ -0,0 +1,43 @@
+import mcc_api.event as event_api
+from mcc_api.event.archive import RundownArchive
+import json
+import typing as t
+import unittest
+
+
+class TestRundownArchive(unittest.TestCase):
+    archive: RundownArchive
+    response_json: dict[str, t.Any]
+    response_object: event_api.RundownResponse
+
+    def setUp(self: "TestRundownArchive") -> None:
+        with open("event/mock_data/200_rundown.json") as f:
+            f: t.TextIO
+            self.response_json = json.loads(f.read())
+        self.response_object = event_api.RundownResponse(self.response_json)
+        self.archive = RundownArchive(":memory:")
+
+    def tearDown(self: "TestRundownArchive") -> None:
+        self.archive.close()
+
+    def test_missing_event(self: "TestRundownArchive") -> None:
+        self.assertIsNone(self.archive.get("MCC25"))
+        self.assertNotIn("MCC25", self.archive)
+
+    def test_round_trip(self: "TestRundownArchive") -> None:
+        self.archive.put("MCC25", self.response_object)
+        archived: t.Optional[event_api.RundownResponse] = self.archive.get("MCC25")
+
+        self.assertIsInstance(archived, event_api.RundownResponse)
+        self.assertEqual(archived.data, self.response_object.data)
+        self.assertEqual(self.archive.events(), {"MCC25"})
+
+    def test_is_complete(self: "TestRundownArchive") -> None:
+        self.assertTrue(RundownArchive.is_complete(self.response_object))
+
+        self.response_json["data"]["dodgeboltData"] = {}
+        self.assertFalse(RundownArchive.is_complete(event_api.RundownResponse(self.response_json)))
+
+
+if __name__ == "__main__":
+    unittest.main()
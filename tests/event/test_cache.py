@@ -0,0 +1,98 @@
+import mcc_api.event as event_api
+from mcc_api.event.cache import ErrorCache, ResponseCache
+import json
+import time
+import typing as t
+import unittest
+
+
+class TestResponseCache(unittest.TestCase):
+    response_object: event_api.EventsResponse
+
+    def setUp(self: "TestResponseCache") -> None:
+        with open("event/mock_data/200_events.json") as f:
+            f: t.TextIO
+            self.response_object = event_api.EventsResponse(json.loads(f.read()))
+
+    def test_hit_returns_same_object(self: "TestResponseCache") -> None:
+        cache: ResponseCache = ResponseCache()
+        self.assertIsNone(cache.get("events"))
+        cache.set("events", self.response_object)
+        self.assertIs(cache.get("events"), self.response_object)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_endpoint_ttls(self: "TestResponseCache") -> None:
+        cache: ResponseCache = ResponseCache(ttls={"rundown/{event}": 5, "participants": 0})
+        self.assertEqual(cache.ttl("rundown/MCC25"), 5)
+        self.assertEqual(cache.ttl("rundown"), ResponseCache.default_ttls["rundown"])
+        self.assertEqual(cache.ttl("participants/RED"), ResponseCache.default_ttls["participants/{team}"])
+        self.assertEqual(cache.ttl("unknown"), 0)
+        self.assertEqual(ResponseCache().ttl("rundown/MCC25"), ResponseCache.default_ttls["rundown"])
+
+        cache.set("participants", self.response_object)
+        self.assertIsNone(cache.get("participants"))
+
+    def test_expiry(self: "TestResponseCache") -> None:
+        cache: ResponseCache = ResponseCache(ttls={"events": 0.05})
+        cache.set("events", self.response_object)
+        self.assertIs(cache.get("events"), self.response_object)
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("events"))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self: "TestResponseCache") -> None:
+        cache: ResponseCache = ResponseCache(max_size=2)
+        cache.set("rundown/1", self.response_object)
+        cache.set("rundown/2", self.response_object)
+        cache.get("rundown/1")
+        cache.set("rundown/3", self.response_object)
+
+        self.assertIsNotNone(cache.get("rundown/1"))
+        self.assertIsNone(cache.get("rundown/2"))
+        self.assertIsNotNone(cache.get("rundown/3"))
+
+    def test_invalidate(self: "TestResponseCache") -> None:
+        cache: ResponseCache = ResponseCache()
+        cache.set("rundown/1", self.response_object)
+        cache.set("rundown/2", self.response_object)
+
+        cache.invalidate("rundown/1")
+        self.assertIsNone(cache.get("rundown/1"))
+        self.assertIsNotNone(cache.get("rundown/2"))
+
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+
+class TestErrorCache(unittest.TestCase):
+    def test_same_exception_type_raised(self: "TestErrorCache") -> None:
+        cache: ErrorCache = ErrorCache()
+        error: event_api.exceptions.InvalidEventError = event_api.exceptions.InvalidEventError(404, "Not Found")
+        self.assertIsNone(cache.get("rundown/MCC0"))
+        cache.set("rundown/MCC0", error)
+
+        cached_error: t.Optional[event_api.exceptions.MCCAPIError] = cache.get("rundown/MCC0")
+        self.assertIsInstance(cached_error, event_api.exceptions.InvalidEventError)
+        self.assertIsNot(cached_error, error)
+        self.assertEqual((cached_error.code, cached_error.reason), (error.code, error.reason))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_only_not_found_cached(self: "TestErrorCache") -> None:
+        cache: ErrorCache = ErrorCache()
+        cache.set("rundown", event_api.exceptions.RateLimitError(429, "Too many requests"))
+        self.assertIsNone(cache.get("rundown"))
+
+    def test_expiry_and_size(self: "TestErrorCache") -> None:
+        cache: ErrorCache = ErrorCache(max_size=1, ttl=0.05)
+        cache.set("participant/1", event_api.exceptions.InvalidParticipantError(404, None))
+        cache.set("participant/2", event_api.exceptions.InvalidParticipantError(404, None))
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("participant/1"))
+        self.assertIsNotNone(cache.get("participant/2"))
+
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("participant/2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
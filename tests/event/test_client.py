@@ -0,0 +1,64 @@
+from mcc_api.event.client import DEFAULT_BASE_URL, EventClient
+from mcc_api.event.limiter import TokenBucket
+from mcc_api.event.retry import RetryPolicy
+from mcc_api.event.server import FakeEventServer, FaultProfile
+import mcc_api.event as event_api
+import requests
+import unittest
+
+
+class TestEventClient(unittest.TestCase):
+    def test_defaults(self: "TestEventClient") -> None:
+        client: EventClient = EventClient()
+        self.assertEqual(client.base_url, DEFAULT_BASE_URL)
+        self.assertEqual(client.limiter.calls, 200)
+        self.assertEqual(client.retry, RetryPolicy())
+        self.assertIsNone(client.cache)
+        self.assertIsNone(client.error_cache)
+        self.assertIsNone(client.archive)
+        self.assertEqual(client.timeout, 5)
+
+    def test_clients_are_independent(self: "TestEventClient") -> None:
+        live: EventClient = EventClient(limiter=TokenBucket(calls=200, period=60))
+        backfill: EventClient = EventClient("http://localhost:8000/v1", limiter=TokenBucket(calls=20, period=60))
+        self.assertIsNot(live.limiter, backfill.limiter)
+        self.assertNotEqual(live.base_url, backfill.base_url)
+
+    def test_archive_rundowns_without_archive(self: "TestEventClient") -> None:
+        self.assertRaises(ValueError, EventClient().archive_rundowns)
+
+
+class TestDefaultClient(unittest.TestCase):
+    previous_client: EventClient
+
+    def setUp(self: "TestDefaultClient") -> None:
+        self.previous_client = event_api.get_default_client()
+
+    def tearDown(self: "TestDefaultClient") -> None:
+        event_api.set_default_client(self.previous_client)
+
+    def test_set_default_client(self: "TestDefaultClient") -> None:
+        client: EventClient = EventClient()
+        event_api.set_default_client(client)
+        self.assertIs(event_api.get_default_client(), client)
+        self.assertIs(event_api.get_rate_limiter(), client.limiter)
+        self.assertIs(event_api.get_retry_policy(), client.retry)
+
+    def test_setters_configure_default_client(self: "TestDefaultClient") -> None:
+        event_api.set_default_client(EventClient())
+        limiter: TokenBucket = TokenBucket(calls=20, period=60)
+        policy: RetryPolicy = RetryPolicy(attempts=1)
+        event_api.set_rate_limiter(limiter)
+        event_api.set_retry_policy(policy)
+        self.assertIs(event_api.get_default_client().limiter, limiter)
+        self.assertIs(event_api.get_default_client().retry, policy)
+
+    def test_default_client_timeout(self: "TestDefaultClient") -> None:
+        with FakeEventServer(events=1, faults=FaultProfile(latency=1.5)) as server:
+            event_api.set_default_client(EventClient(server.url, timeout=1, retry=RetryPolicy(attempts=1)))
+            with self.assertRaises(requests.Timeout):
+                event_api.get_events()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import mcc_api.event as event_api
+from mcc_api.event import codec
+import json
+import typing as t
+import unittest
+
+
+class TestJSONCodec(unittest.TestCase):
+    previous_codec: tuple[codec.Loads, codec.Dumps]
+    response_bytes: bytes
+
+    def setUp(self: "TestJSONCodec") -> None:
+        self.previous_codec = event_api.get_json_codec()
+        with open("event/mock_data/200_participants.json", "rb") as f:
+            f: t.BinaryIO
+            self.response_bytes = f.read()
+
+    def tearDown(self: "TestJSONCodec") -> None:
+        event_api.set_json_codec(*self.previous_codec)
+
+    def test_default_codec_matches_stdlib(self: "TestJSONCodec") -> None:
+        self.assertEqual(codec.loads(self.response_bytes), json.loads(self.response_bytes))
+        self.assertEqual(
+            json.loads(codec.dumps(json.loads(self.response_bytes))),
+            json.loads(self.response_bytes)
+        )
+
+    def test_custom_codec_used(self: "TestJSONCodec") -> None:
+        decoded: list[bytes] = []
+
+        def loads(data: bytes) -> t.Any:
+            decoded.append(data)
+            return json.loads(data)
+
+        event_api.set_json_codec(loads, json.dumps)
+        response_object: event_api.ParticipantsResponse = event_api.ParticipantsResponse(self.response_bytes)
+
+        self.assertEqual(decoded, [self.response_bytes])
+        self.assertIn(event_api.Team.RED, response_object.data)
+
+    def test_reset_to_stdlib(self: "TestJSONCodec") -> None:
+        event_api.set_json_codec()
+        self.assertEqual(event_api.get_json_codec(), (json.loads, json.dumps))
+
+
+if __name__ == "__main__":
+    unittest.main()
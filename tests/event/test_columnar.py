@@ -0,0 +1,51 @@
+import importlib.util
+import mcc_api.event as event_api
+import json
+import math
+import typing as t
+import unittest
+
+if t.TYPE_CHECKING:
+    from mcc_api.event.columnar import RundownArrays
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class TestRundownArrays(unittest.TestCase):
+    response_object: event_api.RundownResponse
+
+    def setUp(self: "TestRundownArrays") -> None:
+        with open("event/mock_data/200_rundown.json") as f:
+            f: t.TextIO
+            self.response_object = event_api.RundownResponse(json.loads(f.read()))
+
+    def test_shapes(self: "TestRundownArrays") -> None:
+        arrays: "RundownArrays" = self.response_object.to_arrays()
+        self.assertEqual(arrays.games, [str(game) for game in range(8)])
+        self.assertEqual(len(arrays.teams), 10)
+        self.assertEqual(arrays.multipliers.shape, (8,))
+        self.assertEqual(arrays.gameScores.shape, (8, 10))
+        self.assertEqual(arrays.eventPlacements.shape, (8, 10))
+        self.assertEqual(arrays.individualScores.shape, (len(arrays.players), 8))
+
+    def test_values_match_history(self: "TestRundownArrays") -> None:
+        arrays: "RundownArrays" = self.response_object.to_arrays()
+        for row, game_num in enumerate(arrays.games):
+            game: event_api.responses.RundownHistoryGame = self.response_object.data.history[game_num]
+            with self.subTest(game=game_num):
+                self.assertEqual(arrays.gameTypes[row], game.game)
+                self.assertEqual(arrays.multipliers[row], game.multiplier)
+                for column, team in enumerate(arrays.teams):
+                    self.assertEqual(arrays.eventScores[row, column], game.eventScores[team])
+                for player, score in (game.individualScores or {}).items():
+                    self.assertEqual(arrays.individualScores[arrays.players.index(player), row], score)
+
+    def test_final_scores(self: "TestRundownArrays") -> None:
+        arrays: "RundownArrays" = self.response_object.to_arrays()
+        final_scores: dict[event_api.Team, float] = dict(zip(arrays.teams, arrays.eventScores[-1]))
+        for team, score in self.response_object.data.eventScores.items():
+            with self.subTest(team=str(team)):
+                self.assertTrue(math.isclose(final_scores[team], score))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+from mcc_api.event.diff import (CreatorsChanged, EventPlacementChanged, EventScoreChanged, GameAdded, GameChanged,
+                                IndividualScoreChanged, RundownDelta, diff_rundowns)
+import mcc_api.event as event_api
+import copy
+import json
+import typing as t
+import unittest
+
+
+class TestRundownDiff(unittest.TestCase):
+    data: dict[str, t.Any]
+    previous_data: dict[str, t.Any]
+
+    def setUp(self: "TestRundownDiff") -> None:
+        with open("event/mock_data/200_rundown.json") as f:
+            f: t.TextIO
+            self.data = json.loads(f.read())
+
+        # The rundown as it was before the last game finished
+        self.previous_data = copy.deepcopy(self.data)
+        previous: dict[str, t.Any] = self.previous_data["data"]
+        last_game: dict[str, t.Any] = previous["history"].pop("7")
+        previous["dodgeboltData"] = {}
+        previous["eventScores"]["RED"] -= last_game["gameScores"]["RED"]
+        previous["eventPlacements"]["RED"], previous["eventPlacements"]["ORANGE"] = \
+            previous["eventPlacements"]["ORANGE"], previous["eventPlacements"]["RED"]
+        previous["individualScores"]["Sapnap"] -= 100
+        del previous["individualScores"]["The_Eret"]
+
+    def test_identical(self: "TestRundownDiff") -> None:
+        rundown: event_api.RundownResponse = event_api.RundownResponse(self.data)
+        self.assertEqual(diff_rundowns(rundown.data, event_api.RundownResponse(self.data).data), [])
+        self.assertEqual(rundown.diff(rundown), [])
+
+    def test_game_added(self: "TestRundownDiff") -> None:
+        previous: event_api.RundownResponse = event_api.RundownResponse(self.previous_data)
+        rundown: event_api.RundownResponse = event_api.RundownResponse(self.data)
+        added: list[GameAdded] = [delta for delta in rundown.diff(previous) if isinstance(delta, GameAdded)]
+        self.assertEqual(added, [GameAdded("7", rundown.data.history["7"])])
+
+    def test_team_changes(self: "TestRundownDiff") -> None:
+        deltas: list[RundownDelta] = event_api.RundownResponse(self.data).diff(
+            event_api.RundownResponse(self.previous_data)
+        )
+        red_score: int = self.data["data"]["eventScores"]["RED"]
+        red_game_score: int = self.data["data"]["history"]["7"]["gameScores"]["RED"]
+        self.assertIn(EventScoreChanged(event_api.Team.RED, red_score - red_game_score, red_score), deltas)
+        self.assertEqual(
+            {delta.team for delta in deltas if isinstance(delta, EventPlacementChanged)},
+            {event_api.Team.RED, event_api.Team.ORANGE}
+        )
+        self.assertFalse(any(isinstance(delta, CreatorsChanged) for delta in deltas))
+
+    def test_individual_scores(self: "TestRundownDiff") -> None:
+        deltas: list[RundownDelta] = event_api.RundownResponse(self.data).diff(
+            event_api.RundownResponse(self.previous_data)
+        )
+        individual: list[IndividualScoreChanged] = [
+            delta for delta in deltas if isinstance(delta, IndividualScoreChanged)
+        ]
+        sapnap: int = self.data["data"]["individualScores"]["Sapnap"]
+        eret: int = self.data["data"]["individualScores"]["The_Eret"]
+        self.assertEqual(individual, [
+            IndividualScoreChanged("Sapnap", sapnap - 100, sapnap),
+            IndividualScoreChanged("The_Eret", None, eret)
+        ])
+
+    def test_latest_game_changed(self: "TestRundownDiff") -> None:
+        changed_data: dict[str, t.Any] = copy.deepcopy(self.data)
+        changed_data["data"]["history"]["7"]["multiplier"] = 1.5
+        deltas: list[RundownDelta] = event_api.RundownResponse(changed_data).diff(event_api.RundownResponse(self.data))
+        self.assertEqual([type(delta) for delta in deltas], [GameChanged])
+        self.assertEqual(deltas[0].new.multiplier, 1.5)
+
+    def test_lazy_only_builds_changed_games(self: "TestRundownDiff") -> None:
+        previous: event_api.RundownResponse = event_api.RundownResponse(self.previous_data, lazy=True)
+        rundown: event_api.RundownResponse = event_api.RundownResponse(self.data, lazy=True)
+        rundown.diff(previous)
+        self.assertEqual(set(previous.data.history._games), {"6"})
+        self.assertEqual(set(rundown.data.history._games), {"6", "7"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import mcc_api.event as event_api
+from mcc_api.event.archive import RundownArchive
+from mcc_api.event.cache import ResponseCache
+from mcc_api.event.client import EventClient
+from mcc_api.instrumentation import _emit, MetricsCollector, OpenTelemetryHook, RequestMetrics
+import typing as t
+import unittest
+
+
+class FakeSpan:
+    exceptions: list[BaseException]
+    end_time: t.Optional[int]
+
+    def __init__(self: "FakeSpan") -> None:
+        self.exceptions = []
+        self.end_time = None
+
+    def record_exception(self: "FakeSpan", exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+    def end(self: "FakeSpan", end_time: t.Optional[int] = None) -> None:
+        self.end_time = end_time
+
+
+class FakeTracer:
+    spans: list[tuple[str, int, dict[str, t.Any], FakeSpan]]
+
+    def __init__(self: "FakeTracer") -> None:
+        self.spans = []
+
+    def start_span(self: "FakeTracer", name: str, start_time: int, attributes: dict[str, t.Any]) -> FakeSpan:
+        span: FakeSpan = FakeSpan()
+        self.spans.append((name, start_time, attributes, span))
+        return span
+
+
+class TestRequestMetrics(unittest.TestCase):
+    def test_retries(self: "TestRequestMetrics") -> None:
+        self.assertEqual(RequestMetrics("event", "rundown").retries, 0)
+        self.assertEqual(RequestMetrics("event", "rundown", attempts=1).retries, 0)
+        self.assertEqual(RequestMetrics("event", "rundown", attempts=3).retries, 2)
+
+    def test_failing_hook_does_not_raise(self: "TestRequestMetrics") -> None:
+        received: list[RequestMetrics] = []
+        metrics: RequestMetrics = RequestMetrics("event", "rundown")
+
+        with self.assertLogs("mcc_api.instrumentation", "ERROR"):
+            _emit([lambda _: 1 / 0, received.append], metrics)
+        self.assertEqual(received, [metrics])
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_endpoints_grouped(self: "TestMetricsCollector") -> None:
+        collector: MetricsCollector = MetricsCollector()
+        collector(RequestMetrics("event", "rundown/MCC25", attempts=3, bytes=100, total_time=1))
+        collector(RequestMetrics("event", "rundown/MCC24", attempts=1, bytes=50, total_time=3))
+        collector(RequestMetrics("event", "rundown", attempts=1))
+        collector(RequestMetrics("island", "pkwStats", error=ValueError()))
+
+        summary: dict[str, dict[str, float]] = collector.summary()
+        self.assertEqual(list(summary), ["event rundown", "event rundown/{event}", "island pkwStats"])
+        self.assertEqual(summary["event rundown/{event}"]["calls"], 2)
+        self.assertEqual(summary["event rundown/{event}"]["retries"], 2)
+        self.assertEqual(summary["event rundown/{event}"]["bytes"], 150)
+        self.assertEqual(summary["event rundown/{event}"]["mean_total_time"], 2)
+        self.assertEqual(summary["island pkwStats"]["errors"], 1)
+
+        collector.reset()
+        self.assertEqual(collector.summary(), {})
+
+
+class TestOpenTelemetryHook(unittest.TestCase):
+    def test_span(self: "TestOpenTelemetryHook") -> None:
+        tracer: FakeTracer = FakeTracer()
+        error: ValueError = ValueError()
+        OpenTelemetryHook(tracer)(RequestMetrics("event", "rundown", started=10, status=503, attempts=2,
+                                                 total_time=1.5, error=error))
+
+        name: str
+        start_time: int
+        attributes: dict[str, t.Any]
+        span: FakeSpan
+        name, start_time, attributes, span = tracer.spans[0]
+        self.assertEqual(name, "event rundown")
+        self.assertEqual(start_time, 10_000_000_000)
+        self.assertEqual(attributes["mcc_api.attempts"], 2)
+        self.assertEqual(attributes["http.response.status_code"], 503)
+        self.assertEqual(span.exceptions, [error])
+        self.assertEqual(span.end_time, 11_500_000_000)
+
+
+class TestClientHooks(unittest.TestCase):
+    def test_decode_time_recorded(self: "TestClientHooks") -> None:
+        with open("event/mock_data/200_events.json", "rb") as f:
+            f: t.BinaryIO
+            response: event_api.EventsResponse = event_api.EventsResponse(f.read())
+        self.assertGreater(response._decode_time, 0)
+
+    def test_cache_hit_reported(self: "TestClientHooks") -> None:
+        with open("event/mock_data/200_events.json", "rb") as f:
+            f: t.BinaryIO
+            response: event_api.EventsResponse = event_api.EventsResponse(f.read())
+
+        received: list[RequestMetrics] = []
+        client: EventClient = EventClient(cache=ResponseCache(), hooks=[received.append])
+        client.cache.set("events", response)
+
+        self.assertIs(client.get_events(), response)
+        self.assertEqual(len(received), 1)
+        self.assertEqual((received[0].api, received[0].endpoint), ("event", "events"))
+        self.assertTrue(received[0].cache_hit)
+        self.assertFalse(received[0].coalesced)
+        self.assertEqual(received[0].attempts, 0)
+
+        client.remove_request_hook(received.append)
+        client.get_events()
+        self.assertEqual(len(received), 1)
+
+    def test_archive_hit_reported(self: "TestClientHooks") -> None:
+        with open("event/mock_data/200_rundown.json", "rb") as f:
+            f: t.BinaryIO
+            response: event_api.RundownResponse = event_api.RundownResponse(f.read())
+
+        received: list[RequestMetrics] = []
+        client: EventClient = EventClient(archive=RundownArchive(":memory:"), hooks=[received.append])
+        client.archive.put("MCC25", response)
+
+        self.assertEqual(client.get_rundown("MCC25").raw, response.raw)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].endpoint, "rundown/MCC25")
+        self.assertTrue(received[0].cache_hit)
+        self.assertEqual(received[0].attempts, 0)
+        self.assertGreater(received[0].total_time, 0)
+        client.archive.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+from mcc_api.event.limiter import FileTokenBucket, TokenBucket
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_available_immediately(self: "TestTokenBucket") -> None:
+        limiter: TokenBucket = TokenBucket(calls=100, period=60, burst=5)
+        for _ in range(5):
+            self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+
+    def test_wait_time_after_burst(self: "TestTokenBucket") -> None:
+        limiter: TokenBucket = TokenBucket(calls=100, period=60, burst=10)
+        self.assertEqual(limiter.wait_time(), 0)
+        for _ in range(10):
+            limiter.try_acquire()
+        # 90 tokens are added every 60 seconds, so the next token is 2/3 of a second away
+        self.assertAlmostEqual(limiter.wait_time(), 60 / 90, places=2)
+
+    def test_acquire_timeout(self: "TestTokenBucket") -> None:
+        limiter: TokenBucket = TokenBucket(calls=2, period=60, burst=1)
+        self.assertTrue(limiter.acquire(timeout=0))
+        self.assertFalse(limiter.acquire(timeout=1))
+
+    def test_backoff(self: "TestTokenBucket") -> None:
+        limiter: TokenBucket = TokenBucket(calls=100, period=60, burst=10)
+        limiter.backoff(5)
+        self.assertFalse(limiter.try_acquire())
+        # The bucket is emptied, then no tokens are added for 5 seconds
+        self.assertAlmostEqual(limiter.wait_time(), 5 + 60 / 90, places=2)
+
+    def test_waiters_are_spaced_out(self: "TestTokenBucket") -> None:
+        limiter: TokenBucket = TokenBucket(calls=21, period=1, burst=1)
+        limiter.try_acquire()
+        start: float = time.monotonic()
+        limiter.acquire()
+        limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_acquire_async(self: "TestTokenBucket") -> None:
+        limiter: TokenBucket = TokenBucket(calls=11, period=1, burst=1)
+
+        async def acquire_three() -> list[bool]:
+            return list(await asyncio.gather(*(limiter.acquire_async(timeout=1) for _ in range(3))))
+
+        start: float = time.monotonic()
+        self.assertEqual(asyncio.run(acquire_three()), [True, True, True])
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_invalid_burst(self: "TestTokenBucket") -> None:
+        self.assertRaises(ValueError, TokenBucket, calls=10, period=60, burst=11)
+        self.assertRaises(ValueError, TokenBucket, calls=10, period=60, burst=0)
+        self.assertRaises(ValueError, TokenBucket, calls=0, period=60)
+
+    def test_default_burst(self: "TestTokenBucket") -> None:
+        self.assertEqual(TokenBucket().burst, 10)
+        self.assertEqual(TokenBucket(calls=20, period=60).burst, 1)
+        self.assertEqual(TokenBucket(calls=5, period=1).burst, 1)
+
+    def test_small_limits(self: "TestTokenBucket") -> None:
+        # Only the burst is taken out of the sustained rate, so small limits keep most of their budget
+        limiter: TokenBucket = TokenBucket(calls=20, period=60)
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+        self.assertAlmostEqual(limiter.wait_time(), 60 / 19, places=2)
+
+        limiter = TokenBucket(calls=5, period=1)
+        self.assertTrue(limiter.try_acquire())
+        self.assertAlmostEqual(limiter.wait_time(), 1 / 4, places=2)
+
+    def test_single_call_per_period(self: "TestTokenBucket") -> None:
+        limiter: TokenBucket = TokenBucket(calls=1, period=60)
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+        self.assertAlmostEqual(limiter.wait_time(), 60, places=2)
+
+
+def _try_acquire_from_file(path: str) -> bool:
+    return FileTokenBucket(path, calls=100, period=60, burst=3).try_acquire()
+
+
+class TestFileTokenBucket(unittest.TestCase):
+    path: str
+
+    def setUp(self: "TestFileTokenBucket") -> None:
+        fd: int
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self: "TestFileTokenBucket") -> None:
+        os.remove(self.path)
+
+    def test_budget_shared_between_instances(self: "TestFileTokenBucket") -> None:
+        first: FileTokenBucket = FileTokenBucket(self.path, calls=100, period=60, burst=3)
+        second: FileTokenBucket = FileTokenBucket(self.path, calls=100, period=60, burst=3)
+
+        self.assertTrue(first.try_acquire())
+        self.assertTrue(second.try_acquire())
+        self.assertTrue(first.try_acquire())
+        self.assertFalse(second.try_acquire())
+        self.assertGreater(first.wait_time(), 0)
+
+    def test_budget_shared_between_processes(self: "TestFileTokenBucket") -> None:
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            results: list[bool] = pool.map(_try_acquire_from_file, [self.path] * 5)
+        self.assertEqual(results.count(True), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -67,6 +67,45 @@ class TestEventParticipants200(unittest.TestCase):
         self.assertEqual(participants_count, len(uuids))
 
 
+class TestEventParticipantsLookups(unittest.TestCase):
+    response_object: event_api.ParticipantsResponse
+
+    def setUp(self: "TestEventParticipantsLookups") -> None:
+        with open("event/mock_data/200_participants.json") as f:
+            f: t.TextIO
+            self.response_object = event_api.ParticipantsResponse(json.loads(f.read()))
+
+    def test_by_uuid(self: "TestEventParticipantsLookups") -> None:
+        for uuid in [
+            "e6b20ce1baf94891b0b201af0a14ccc6",
+            "e6b20ce1-baf9-4891-b0b2-01af0a14ccc6",
+            "E6B20CE1-BAF9-4891-B0B2-01AF0A14CCC6"
+        ]:
+            with self.subTest(uuid=uuid):
+                self.assertEqual(self.response_object.by_uuid(uuid).username, "DarkEyebrows")
+        self.assertIsNone(self.response_object.by_uuid("00000000000000000000000000000000"))
+
+    def test_by_username(self: "TestEventParticipantsLookups") -> None:
+        self.assertEqual(self.response_object.by_username("darkeyebrows").uuid, "e6b20ce1baf94891b0b201af0a14ccc6")
+        self.assertIsNone(self.response_object.by_username("MCChampionship"))
+
+    def test_by_platform(self: "TestEventParticipantsLookups") -> None:
+        participants: list[event_api.responses.Creator] = [
+            participant for participants in self.response_object.data.values() for participant in participants
+        ]
+        for platform in {participant.platform for participant in participants}:
+            with self.subTest(platform=platform):
+                self.assertCountEqual(
+                    self.response_object.by_platform(platform.upper()),
+                    [participant for participant in participants if participant.platform == platform]
+                )
+
+    def test_by_team(self: "TestEventParticipantsLookups") -> None:
+        for team in event_api.Team:
+            with self.subTest(team=str(team)):
+                self.assertEqual(self.response_object.by_team(team), self.response_object.data[team])
+
+
 class TestParticipantsEndpoint429(unittest.TestCase):
     def test_participants_ratelimit_exception(self: "TestParticipantsEndpoint429") -> None:
         with open("event/mock_data/429_ratelimit.json") as f:
@@ -101,6 +140,23 @@ class TestEventParticipantsTeam200(unittest.TestCase):
         self.assertEqual(participants_count, len(uuids))
 
 
+class TestEventParticipantsTeamLookups(unittest.TestCase):
+    response_object: event_api.ParticipantsTeamResponse
+
+    def setUp(self: "TestEventParticipantsTeamLookups") -> None:
+        with open("event/mock_data/200_participants_team.json") as f:
+            f: t.TextIO
+            self.response_object = event_api.ParticipantsTeamResponse(json.loads(f.read()))
+
+    def test_lookups_find_every_participant(self: "TestEventParticipantsTeamLookups") -> None:
+        for participant in self.response_object.data:
+            with self.subTest(username=participant.username):
+                self.assertIs(self.response_object.by_uuid(participant.uuid), participant)
+                self.assertIs(self.response_object.by_username(participant.username.upper()), participant)
+                self.assertIn(participant, self.response_object.by_platform(participant.platform))
+                self.assertIn(participant, self.response_object.by_team(participant.team))
+
+
 class TestParticipantsTeamEndpoint404(unittest.TestCase):
     def test_participants_team_invalid_team_exception(self: "TestParticipantsTeamEndpoint404") -> None:
         with open("event/mock_data/404_participants_team.json") as f:
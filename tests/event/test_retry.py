@@ -0,0 +1,78 @@
+from mcc_api.event.limiter import TokenBucket
+from mcc_api.event.retry import _next_delay, _retry_after, parse_retry_after, RetryPolicy
+from datetime import datetime, timedelta, timezone
+import email.utils
+import time
+import unittest
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_delay_bounds(self: "TestRetryPolicy") -> None:
+        policy: RetryPolicy = RetryPolicy(backoff=0.5, max_delay=1.5)
+        for attempt, bound in [(1, 0.5), (2, 1), (3, 1.5), (10, 1.5)]:
+            with self.subTest(attempt=attempt):
+                for _ in range(50):
+                    self.assertTrue(0 <= policy.delay(attempt) <= bound)
+
+    def test_delay_honors_retry_after(self: "TestRetryPolicy") -> None:
+        policy: RetryPolicy = RetryPolicy(backoff=0.5, max_delay=1)
+        for _ in range(50):
+            self.assertTrue(20 <= policy.delay(1, retry_after=20) <= 20.5)
+
+    def test_attempts(self: "TestRetryPolicy") -> None:
+        policy: RetryPolicy = RetryPolicy(attempts=3)
+        started: float = time.monotonic()
+        self.assertIsNotNone(_next_delay(policy, "rundown", 1, started, 503))
+        self.assertIsNotNone(_next_delay(policy, "rundown", 2, started, 503))
+        self.assertIsNone(_next_delay(policy, "rundown", 3, started, 503))
+
+    def test_deadline(self: "TestRetryPolicy") -> None:
+        policy: RetryPolicy = RetryPolicy(attempts=10, deadline=10)
+        self.assertIsNotNone(_next_delay(policy, "rundown", 1, time.monotonic(), 429, retry_after=5))
+        self.assertIsNone(_next_delay(policy, "rundown", 1, time.monotonic(), 429, retry_after=15))
+        self.assertIsNone(_next_delay(policy, "rundown", 1, time.monotonic() - 11, 503))
+
+    def test_on_retry(self: "TestRetryPolicy") -> None:
+        retries: list[tuple[str, int, float, int | BaseException]] = []
+        policy: RetryPolicy = RetryPolicy(attempts=2, on_retry=lambda *args: retries.append(args))
+        delay: float = _next_delay(policy, "rundown", 1, time.monotonic(), 503)
+        _next_delay(policy, "rundown", 2, time.monotonic(), 503)
+        self.assertEqual(retries, [("rundown", 1, delay, 503)])
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_seconds(self: "TestParseRetryAfter") -> None:
+        self.assertEqual(parse_retry_after("120"), 120)
+
+    def test_date(self: "TestParseRetryAfter") -> None:
+        date: str = email.utils.format_datetime(datetime.now(tz=timezone.utc) + timedelta(seconds=30), usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(date), 30, delta=2)
+
+    def test_past_date(self: "TestParseRetryAfter") -> None:
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+
+    def test_invalid(self: "TestParseRetryAfter") -> None:
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_non_finite(self: "TestParseRetryAfter") -> None:
+        self.assertIsNone(parse_retry_after("inf"))
+        self.assertIsNone(parse_retry_after("-inf"))
+        self.assertIsNone(parse_retry_after("nan"))
+        self.assertIsNone(parse_retry_after("1e400"))
+
+    def test_capped_at_max_delay(self: "TestParseRetryAfter") -> None:
+        policy: RetryPolicy = RetryPolicy(max_delay=10)
+        self.assertEqual(_retry_after(policy, "5"), 5)
+        self.assertEqual(_retry_after(policy, "86400"), 10)
+        self.assertIsNone(_retry_after(policy, "inf"))
+        self.assertIsNone(_retry_after(policy, None))
+
+        # Backing off by the capped value leaves the limiter waiting about max_delay, plus the time for a token
+        limiter: TokenBucket = TokenBucket(calls=60, period=60, burst=1)
+        limiter.backoff(_retry_after(policy, "86400"))
+        self.assertLess(limiter.wait_time(), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -71,6 +71,62 @@ class TestRundownEndpoint200(unittest.TestCase):
                 self.assertEqual(self.response_object.data.history[str(game)].multiplier, multiplier)
 
 
+class TestRundownEndpointLazy(unittest.TestCase):
+    response_json: dict[str, t.Any]
+    response_object: event_api.RundownResponse
+
+    def setUp(self: "TestRundownEndpointLazy") -> None:
+        with open("event/mock_data/200_rundown.json") as f:
+            f: t.TextIO
+            self.response_json = json.loads(f.read())
+        self.response_object = event_api.RundownResponse(self.response_json, lazy=True)
+
+    def test_history_is_lazy(self: "TestRundownEndpointLazy") -> None:
+        self.assertIsInstance(self.response_object.data.history, event_api.responses.LazyHistory)
+        self.assertEqual(len(self.response_object.data.history), 8)
+        self.assertEqual(self.response_object.data.history._games, {})
+
+    def test_history_game_built_once(self: "TestRundownEndpointLazy") -> None:
+        game: event_api.responses.RundownHistoryGame = self.response_object.data.history["3"]
+        self.assertIsInstance(game, event_api.responses.RundownHistoryGame)
+        self.assertIs(self.response_object.data.history["3"], game)
+        self.assertEqual(list(self.response_object.data.history._games), ["3"])
+
+    def test_matches_eager_history(self: "TestRundownEndpointLazy") -> None:
+        eager_object: event_api.RundownResponse = event_api.RundownResponse(self.response_json)
+        self.assertEqual(self.response_object.data.history, eager_object.data.history)
+        self.assertEqual(self.response_object.data, eager_object.data)
+
+    def test_missing_game(self: "TestRundownEndpointLazy") -> None:
+        self.assertNotIn("8", self.response_object.data.history)
+        self.assertIsNone(self.response_object.data.history.get("8"))
+
+
+class TestRundownEndpointBytes(unittest.TestCase):
+    response_bytes: bytes
+    response_object: event_api.RundownResponse
+
+    def setUp(self: "TestRundownEndpointBytes") -> None:
+        with open("event/mock_data/200_rundown.json", "rb") as f:
+            f: t.BinaryIO
+            self.response_bytes = f.read()
+        self.response_object = event_api.RundownResponse(self.response_bytes)
+
+    def test_raw_is_original_bytes(self: "TestRundownEndpointBytes") -> None:
+        self.assertIs(self.response_object.raw, self.response_bytes)
+
+    def test_json_matches_raw(self: "TestRundownEndpointBytes") -> None:
+        self.assertEqual(self.response_object.json, self.response_bytes.decode("utf-8"))
+
+    def test_matches_response_from_dict(self: "TestRundownEndpointBytes") -> None:
+        response_json: dict[str, t.Any] = json.loads(self.response_bytes)
+        response_object: event_api.RundownResponse = event_api.RundownResponse(response_json)
+
+        self.assertEqual(response_object.data, self.response_object.data)
+        self.assertEqual(json.loads(response_object.json), response_json)
+        self.assertEqual(json.loads(response_object.raw), response_json)
+
+
 class TestRundownEndpoint404(unittest.TestCase):
     def test_rundown_invalid_event_exception(self: "TestRundownEndpoint404") -> None:
         with open("event/mock_data/404_rundown.json") as f:
@@ -0,0 +1,214 @@
+from mcc_api.event.archive import RundownArchive
+from mcc_api.event.cache import ResponseCache
+from mcc_api.event.client import EventClient
+from mcc_api.event.enums import Team
+from mcc_api.event.exceptions import (
+    InvalidEventError,
+    InvalidParticipantError,
+    InvalidTeamError,
+    InvalidUUIDError,
+    RateLimitError,
+    UnexpectedStatusError
+)
+from mcc_api.event.limiter import TokenBucket
+from mcc_api.event.responses import LazyHistory
+from mcc_api.event.retry import RetryPolicy
+from mcc_api.event.server import FakeEventServer, FaultProfile, synthetic_rundown
+from mcc_api.event.uuids import canonical_uuid
+import json
+import mcc_api.event as event_api
+import os
+import tempfile
+import time
+import typing as t
+import unittest
+import weakref
+
+
+def unlimited_client(server: FakeEventServer, retry: t.Optional[RetryPolicy] = None) -> EventClient:
+    return EventClient(server.url, limiter=TokenBucket(calls=100_000, period=1, burst=1_000), retry=retry)
+
+
+class TestSyntheticData(unittest.TestCase):
+    def test_rundown_scales(self: "TestSyntheticData") -> None:
+        response: event_api.RundownResponse = event_api.RundownResponse(
+            synthetic_rundown(games=40, players_per_team=8, seed=1)
+        )
+        self.assertEqual(len(response.data.history), 40)
+        self.assertEqual(len(response.data.individualScores), 80)
+        self.assertEqual(len(response.data.creators[Team.RED]), 8)
+        self.assertEqual(synthetic_rundown(seed=1), synthetic_rundown(seed=1))
+
+    def test_rundown_history_totals(self: "TestSyntheticData") -> None:
+        rundown: dict[str, t.Any] = synthetic_rundown(games=5, seed=1)["data"]
+        last_game: dict[str, t.Any] = rundown["history"]["4"]
+        self.assertEqual(last_game["individualScores"], rundown["individualScores"])
+        self.assertEqual(last_game["eventScores"], rundown["eventScores"])
+
+
+class TestFakeEventServer(unittest.TestCase):
+    def test_fixtures_served(self: "TestFakeEventServer") -> None:
+        with FakeEventServer("event/mock_data") as server:
+            client: EventClient = unlimited_client(server)
+            event: event_api.EventInformationResponse = client.get_event()
+            self.assertEqual(event.data.event, "22")
+            self.assertEqual(client.get_rundown().raw, client.get_rundown(event.data.event).raw)
+            self.assertEqual(len(client.get_participants(Team.RED).data), 4)
+            self.assertRaises(InvalidEventError, client.get_rundown, "0")
+
+    def test_synthetic_data_served(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=3, seed=1) as server:
+            client: EventClient = unlimited_client(server)
+            self.assertEqual(client.get_events().data, ["MCC1", "MCC2", "MCC3"])
+            self.assertEqual(client.get_event().data.event, "MCC3")
+            self.assertEqual(len(client.get_rundown("MCC1").data.history), 8)
+
+            participants: event_api.ParticipantsResponse = client.get_participants()
+            uuid: str = participants.data[Team.RED][0].uuid
+            self.assertEqual(client.get_participant(uuid).data, participants.data[Team.RED][0])
+
+    def test_not_modified(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=1) as server:
+            client: EventClient = unlimited_client(server)
+            response: event_api.RundownResponse = client.get_rundown("MCC1")
+            self.assertIs(client.get_rundown("MCC1"), response)
+            self.assertEqual(server.stats.not_modified, 1)
+            self.assertEqual(server.stats.connections, 1)
+
+    def test_get_rundowns(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=3, faults=FaultProfile(latency=0.02, jitter=0.05), seed=1) as server:
+            client: EventClient = unlimited_client(server)
+            rundowns: dict[str, event_api.RundownResponse | InvalidEventError] = \
+                client.get_rundowns(["MCC3", "MCC1", "MCC0", "MCC3", "MCC2", "MCC1"], max_workers=4)
+
+            self.assertEqual(list(rundowns), ["MCC3", "MCC1", "MCC0", "MCC2"])
+            self.assertIsInstance(rundowns["MCC0"], InvalidEventError)
+            self.assertEqual(rundowns["MCC0"].code, 404)
+            for event in ["MCC1", "MCC2", "MCC3"]:
+                self.assertEqual(rundowns[event].raw, client.get_rundown(event).raw)
+            self.assertEqual({event: server.stats.endpoints[f"rundown/{event}"] for event in rundowns},
+                             {"MCC3": 2, "MCC1": 2, "MCC0": 1, "MCC2": 2})
+
+    def test_get_participants_by_uuid(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=1) as server:
+            participants: event_api.ParticipantsResponse = unlimited_client(server).get_participants()
+            red: event_api.Creator = participants.data[Team.RED][0]
+            blue: event_api.Creator = participants.data[Team.BLUE][0]
+            undashed: str = blue.uuid.replace("-", "").upper()
+            missing: str = "00000000-0000-4000-8000-000000000000"
+
+            client: EventClient = unlimited_client(server)
+            results: dict[str, event_api.Creator | InvalidParticipantError] = \
+                client.get_participants_by_uuid([red.uuid, missing, "not a uuid", undashed, red.uuid])
+            self.assertEqual(list(results), [red.uuid, missing, "not a uuid", undashed])
+            self.assertEqual(results[red.uuid], red)
+            self.assertEqual(results[undashed], blue)
+            self.assertIsInstance(results[missing], InvalidParticipantError)
+            self.assertEqual(results[missing].code, 404)
+            self.assertIsInstance(results["not a uuid"], InvalidUUIDError)
+
+            # Only the participant missing from /participants is requested individually
+            self.assertEqual(server.stats.endpoints["participants"], 2)
+            self.assertEqual([endpoint for endpoint in server.stats.endpoints if endpoint.startswith("participant/")],
+                             [f"participant/{canonical_uuid(missing)}"])
+
+            # Participants are reused for up to max_age seconds
+            self.assertEqual(client.get_participants_by_uuid([blue.uuid]), {blue.uuid: blue})
+            self.assertEqual(server.stats.endpoints["participants"], 2)
+            time.sleep(0.02)
+            self.assertEqual(client.get_participants_by_uuid([blue.uuid], max_age=0.01), {blue.uuid: blue})
+            self.assertEqual(server.stats.endpoints["participants"], 3)
+
+    def test_scanned_rundowns_freed(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=5) as server:
+            client: EventClient = unlimited_client(server)
+            references: list[weakref.ref[event_api.RundownResponse]] = []
+            for event, rundown in client.iter_rundowns():
+                self.assertEqual([reference() for reference in references], [None] * len(references))
+                references.append(weakref.ref(rundown))
+            self.assertEqual(len(references), 5)
+
+            # Rundowns that are no longer referenced are requested again in full
+            del rundown
+            client.get_rundown("MCC5")
+            self.assertEqual(server.stats.not_modified, 0)
+
+    def test_lazy_rundown_not_returned_eagerly(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=1) as server:
+            for cache in (None, ResponseCache()):
+                client: EventClient = unlimited_client(server)
+                client.cache = cache
+                lazy: event_api.RundownResponse = client.get_rundown("MCC1", lazy=True)
+                self.assertIsInstance(lazy.data.history, LazyHistory)
+
+                eager: event_api.RundownResponse = client.get_rundown("MCC1")
+                self.assertIsInstance(eager.data.history, dict)
+                self.assertEqual(eager.data.history, dict(lazy.data.history))
+                self.assertIs(client.get_rundown("MCC1", lazy=True), eager)
+            self.assertEqual(server.stats.not_modified, 1)
+
+    def test_archive_rundowns(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=3) as server:
+            client: EventClient = unlimited_client(server)
+            client.archive = RundownArchive(":memory:")
+            self.assertEqual(client.archive_rundowns(["MCC1", "MCC0", "MCC2", "MCC3"]), ["MCC1", "MCC2"])
+            self.assertEqual(client.archive.events(), {"MCC1", "MCC2"})
+            self.assertEqual(client.archive_rundowns(), [])
+
+    def test_archive_rundowns_incomplete(self: "TestFakeEventServer") -> None:
+        with open("event/mock_data/200_rundown.json") as f:
+            f: t.TextIO
+            rundown: dict[str, t.Any] = json.load(f)
+        rundown["data"]["dodgeboltData"] = {}
+
+        with tempfile.TemporaryDirectory() as fixtures:
+            with open(os.path.join(fixtures, "200_rundown.json"), "w") as f:
+                f: t.TextIO
+                json.dump(rundown, f)
+
+            with FakeEventServer(fixtures, events=3) as server:
+                client: EventClient = unlimited_client(server)
+                client.archive = RundownArchive(":memory:")
+                self.assertEqual(client.archive_rundowns(), [])
+                self.assertEqual(client.archive.events(), set())
+
+    def test_rate_limit(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=1, faults=FaultProfile(rate_limit=2, rate_limit_period=1)) as server:
+            client: EventClient = unlimited_client(server, RetryPolicy(attempts=1))
+            client.get_events()
+            client.get_events()
+            self.assertRaises(RateLimitError, client.get_events)
+            self.assertEqual(server.stats.rate_limited, 1)
+
+            # Waits for the window to end, as given by the Retry-After header
+            started: float = time.monotonic()
+            client.get_events(retry=RetryPolicy(backoff=0.01))
+            self.assertGreaterEqual(time.monotonic() - started, 0.5)
+
+    def test_errors_retried(self: "TestFakeEventServer") -> None:
+        faults: FaultProfile = FaultProfile(error_rate=0.5, disconnect_rate=0.2)
+        with FakeEventServer(events=5, faults=faults, seed=3) as server:
+            client: EventClient = unlimited_client(server, RetryPolicy(attempts=20, backoff=0))
+            for event in ["MCC1", "MCC2", "MCC3", "MCC4", "MCC5"]:
+                client.get_rundown(event)
+            self.assertGreater(server.stats.errors + server.stats.disconnects, 0)
+            self.assertEqual(server.stats.requests, 5 + server.stats.errors + server.stats.disconnects)
+
+    def test_errors_exhausted(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=1, faults=FaultProfile(error_rate=1, error_statuses=(503,))) as server:
+            client: EventClient = unlimited_client(server, RetryPolicy(attempts=2, backoff=0))
+            with self.assertRaises(UnexpectedStatusError) as context:
+                client.get_rundown("MCC1")
+            self.assertEqual(context.exception.code, 503)
+            self.assertEqual(context.exception.reason, "Service Unavailable")
+            self.assertEqual(server.stats.errors, 2)
+
+    def test_latency(self: "TestFakeEventServer") -> None:
+        with FakeEventServer(events=1, faults=FaultProfile(latency=0.05)) as server:
+            started: float = time.monotonic()
+            self.assertRaises(InvalidTeamError, unlimited_client(server).get_participants, "UNKNOWN")
+            self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
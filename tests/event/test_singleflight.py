@@ -0,0 +1,96 @@
+from mcc_api.event.singleflight import SingleFlight
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import threading
+import unittest
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_result(self: "TestSingleFlight") -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        release: threading.Event = threading.Event()
+        calls: list[object] = []
+
+        def call() -> object:
+            release.wait(5)
+            result: object = object()
+            calls.append(result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures: list[Future[object]] = [executor.submit(flight.do, "rundown", call) for _ in range(4)]
+            while flight.coalesced < 3:
+                pass
+            release.set()
+            results: list[object] = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is calls[0] for result in results))
+
+    def test_different_keys_not_shared(self: "TestSingleFlight") -> None:
+        flight: SingleFlight[str] = SingleFlight()
+        self.assertEqual(flight.do("event", lambda: "event"), "event")
+        self.assertEqual(flight.do("events", lambda: "events"), "events")
+        self.assertEqual(flight.coalesced, 0)
+
+    def test_sequential_calls_not_shared(self: "TestSingleFlight") -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        self.assertIsNot(flight.do("rundown", object), flight.do("rundown", object))
+        self.assertEqual(flight.coalesced, 0)
+
+    def test_exception_shared(self: "TestSingleFlight") -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        release: threading.Event = threading.Event()
+
+        def call() -> object:
+            release.wait(5)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures: list[Future[object]] = [executor.submit(flight.do, "rundown", call) for _ in range(2)]
+            while flight.coalesced < 1:
+                pass
+            release.set()
+            for future in futures:
+                self.assertRaises(ValueError, future.result)
+        self.assertEqual(flight.do("rundown", lambda: "recovered"), "recovered")
+
+
+class TestSingleFlightAsync(unittest.TestCase):
+    def test_concurrent_calls_share_result(self: "TestSingleFlightAsync") -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        calls: list[object] = []
+
+        async def call() -> object:
+            await asyncio.sleep(0.01)
+            result: object = object()
+            calls.append(result)
+            return result
+
+        async def main() -> list[object]:
+            return await asyncio.gather(*(flight.do_async("rundown", call) for _ in range(4)))
+
+        results: list[object] = asyncio.run(main())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.coalesced, 3)
+        self.assertTrue(all(result is calls[0] for result in results))
+
+    def test_cancelled_caller_does_not_cancel_others(self: "TestSingleFlightAsync") -> None:
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def call() -> str:
+            await asyncio.sleep(0.01)
+            return "rundown"
+
+        async def main() -> str:
+            cancelled: asyncio.Task[str] = asyncio.ensure_future(flight.do_async("rundown", call))
+            waiting: asyncio.Task[str] = asyncio.ensure_future(flight.do_async("rundown", call))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await waiting
+
+        self.assertEqual(asyncio.run(main()), "rundown")
+
+
+if __name__ == "__main__":
+    unittest.main()
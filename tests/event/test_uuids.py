@@ -0,0 +1,37 @@
+import mcc_api.event as event_api
+from mcc_api.event.uuids import canonical_uuid
+import unittest
+
+
+class TestCanonicalUUID(unittest.TestCase):
+    def test_dashed_and_undashed_match(self: "TestCanonicalUUID") -> None:
+        for uuid in [
+            "3e7a89eec4e24392a317444b861b0794",
+            "3e7a89ee-c4e2-4392-a317-444b861b0794",
+            "3E7A89EE-C4E2-4392-A317-444B861B0794"
+        ]:
+            with self.subTest(uuid=uuid):
+                self.assertEqual(canonical_uuid(uuid), "3e7a89eec4e24392a317444b861b0794")
+
+    def test_malformed_uuids_rejected(self: "TestCanonicalUUID") -> None:
+        for uuid in [
+            "",
+            "Jammy4312",
+            "3e7a89eec4e24392a317444b861b079",
+            "3e7a89eec4e24392a317444b861b0794a",
+            "3e7a89ee-c4e24392-a317-444b861b0794",
+            "3e7a89eg-c4e2-4392-a317-444b861b0794",
+            " 3e7a89eec4e24392a317444b861b0794"
+        ]:
+            with self.subTest(uuid=uuid):
+                self.assertRaises(event_api.exceptions.InvalidUUIDError, canonical_uuid, uuid)
+
+    def test_malformed_uuid_error_types(self: "TestCanonicalUUID") -> None:
+        with self.assertRaises(event_api.exceptions.InvalidParticipantError):
+            event_api.get_participant("Jammy4312")
+        with self.assertRaises(ValueError):
+            event_api.get_participant("Jammy4312")
+
+
+if __name__ == "__main__":
+    unittest.main()
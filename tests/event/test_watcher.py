@@ -0,0 +1,143 @@
+from mcc_api.event.client import EventClient
+from mcc_api.event.limiter import TokenBucket
+from mcc_api.event.server import FakeEventServer
+from mcc_api.event.watcher import _Watch, EventWatcher
+from datetime import datetime, timedelta, timezone
+import asyncio
+import mcc_api.event as event_api
+import threading
+import time
+import typing as t
+import unittest
+
+
+def events_response(*events: str) -> event_api.EventsResponse:
+    return event_api.EventsResponse({"code": 200, "data": list(events)})
+
+
+def event_response(date: datetime) -> event_api.EventInformationResponse:
+    return event_api.EventInformationResponse({
+        "code": 200,
+        "data": {"date": date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z", "event": "MCC1"}
+    })
+
+
+class TestEventWatcherScheduling(unittest.TestCase):
+    watcher: EventWatcher
+    watch: _Watch
+    calls: list[tuple[event_api.EventsResponse, t.Optional[event_api.EventsResponse]]]
+
+    def setUp(self: "TestEventWatcherScheduling") -> None:
+        self.calls = []
+        self.watcher = EventWatcher(min_interval=1, max_interval=10, backoff=2)
+        self.watch = _Watch("events", events_response, [lambda *args: self.calls.append(args)], 1)
+
+    def test_backoff(self: "TestEventWatcherScheduling") -> None:
+        response: event_api.EventsResponse = events_response("MCC1")
+        self.watcher._observe(self.watch, response)
+        self.assertEqual(self.calls, [(response, None)])
+        self.assertEqual(self.watch.interval, 1)
+
+        intervals: list[float] = []
+        for _ in range(5):
+            # An identical response, or a failed poll, counts as no change
+            self.watcher._observe(self.watch, events_response("MCC1"))
+            self.watcher._observe(self.watch, None)
+            intervals.append(self.watch.interval)
+        self.assertEqual(intervals, [4, 10, 10, 10, 10])
+        self.assertEqual(len(self.calls), 1)
+        self.assertAlmostEqual(self.watch.due - time.monotonic(), 10, places=1)
+
+    def test_reset_on_change(self: "TestEventWatcherScheduling") -> None:
+        first: event_api.EventsResponse = events_response("MCC1")
+        self.watcher._observe(self.watch, first)
+        self.watcher._observe(self.watch, first)
+        self.watcher._observe(self.watch, first)
+        self.assertEqual(self.watch.interval, 4)
+
+        second: event_api.EventsResponse = events_response("MCC1", "MCC2")
+        self.watcher._observe(self.watch, second)
+        self.assertEqual(self.calls[-1], (second, first))
+        self.assertEqual(self.watch.interval, 1)
+        self.assertIs(self.watch.last, second)
+
+    def test_countdown_to_event_start(self: "TestEventWatcherScheduling") -> None:
+        event_watch: _Watch = self.watcher._watches["event"]
+        self.watcher._observe(event_watch, event_response(datetime.now(tz=timezone.utc) + timedelta(seconds=5)))
+        self.assertAlmostEqual(self.watcher._interval(self.watch), 5, places=0)
+        self.assertAlmostEqual(event_watch.due - time.monotonic(), 5, places=0)
+
+        # Polls are still made at least every max_interval seconds
+        self.watcher._observe(event_watch, event_response(datetime.now(tz=timezone.utc) + timedelta(days=1)))
+        self.assertEqual(self.watcher._interval(self.watch), 10)
+
+        self.watcher._observe(event_watch, event_response(datetime.now(tz=timezone.utc) - timedelta(seconds=5)))
+        self.assertEqual(self.watcher._interval(self.watch), 1)
+
+    def test_callback_errors_reported(self: "TestEventWatcherScheduling") -> None:
+        errors: list[tuple[str, BaseException]] = []
+        error: ValueError = ValueError()
+
+        def failing_callback(*args: t.Any) -> None:
+            raise error
+
+        self.watcher.on_error = lambda name, e: errors.append((name, e))
+        self.watch.callbacks.insert(0, failing_callback)
+
+        self.watcher._observe(self.watch, events_response("MCC1"))
+        self.assertEqual(errors, [("events", error)])
+        self.assertEqual(len(self.calls), 1)
+
+
+class TestEventWatcherPolling(unittest.TestCase):
+    server: FakeEventServer
+    client: EventClient
+
+    def setUp(self: "TestEventWatcherPolling") -> None:
+        self.server = FakeEventServer(events=2).start()
+        self.addCleanup(self.server.stop)
+        self.client = EventClient(self.server.url, limiter=TokenBucket(calls=100_000, period=1, burst=1_000))
+
+    def test_start_stop(self: "TestEventWatcherPolling") -> None:
+        received: list[tuple[event_api.RundownResponse, t.Optional[event_api.RundownResponse]]] = []
+        polled: threading.Event = threading.Event()
+
+        def on_rundown(rundown: event_api.RundownResponse, previous: t.Optional[event_api.RundownResponse]) -> None:
+            received.append((rundown, previous))
+            polled.set()
+
+        watcher: EventWatcher = EventWatcher(min_interval=0.05, client=self.client)
+        watcher.watch_rundown(on_rundown, "MCC1")
+        watcher.start()
+        try:
+            self.assertTrue(polled.wait(5))
+        finally:
+            watcher.stop(timeout=5)
+        self.assertIsNone(watcher._thread)
+
+        requests: int = self.server.stats.endpoints["rundown/MCC1"]
+        time.sleep(0.2)
+        self.assertEqual(self.server.stats.endpoints["rundown/MCC1"], requests)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][0].raw, self.client.get_rundown("MCC1").raw)
+        self.assertIsNone(received[0][1])
+
+    def test_run(self: "TestEventWatcherPolling") -> None:
+        async def watch_participants() -> event_api.ParticipantsResponse:
+            polled: asyncio.Future[event_api.ParticipantsResponse] = asyncio.get_running_loop().create_future()
+            watcher: EventWatcher = EventWatcher(min_interval=0.05, client=self.client)
+            watcher.watch_participants(lambda participants, previous: polled.done() or polled.set_result(participants))
+
+            task: asyncio.Task[None] = asyncio.create_task(watcher.run())
+            try:
+                return await asyncio.wait_for(polled, 5)
+            finally:
+                task.cancel()
+
+        participants: event_api.ParticipantsResponse = asyncio.run(watch_participants())
+        self.assertEqual(participants.raw, self.client.get_participants().raw)
+        self.assertGreaterEqual(self.server.stats.endpoints["event"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
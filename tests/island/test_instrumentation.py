@@ -0,0 +1,102 @@
+from mcc_api.instrumentation import RequestMetrics
+from gql import gql, GraphQLRequest
+from gql.transport.exceptions import TransportServerError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import mcc_api.island as island_api
+import threading
+import typing as t
+import unittest
+
+
+class FakeIslandHandler(BaseHTTPRequestHandler):
+    status: t.ClassVar[int] = 200
+    body: t.ClassVar[bytes] = b""
+
+    def do_POST(self: "FakeIslandHandler") -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self: "FakeIslandHandler", format: str, *args: t.Any) -> None:
+        pass
+
+
+class TestIslandInstrumentation(unittest.TestCase):
+    query: GraphQLRequest = gql("""
+        query playerName($username: String!) {
+            playerByUsername(username: $username) {
+                username
+            }
+        }
+    """)
+
+    server: ThreadingHTTPServer
+    metrics: list[RequestMetrics]
+
+    def setUp(self: "TestIslandInstrumentation") -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeIslandHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        previous_url: str = island_api._transport.url
+        island_api._transport.url = f"http://127.0.0.1:{self.server.server_address[1]}/graphql"
+        self.addCleanup(setattr, island_api._transport, "url", previous_url)
+
+        self.metrics = []
+        island_api.add_request_hook(self.metrics.append)
+        self.addCleanup(island_api.remove_request_hook, self.metrics.append)
+
+    def request(self: "TestIslandInstrumentation") -> GraphQLRequest:
+        return GraphQLRequest(self.query, variable_values={"username": "Jammy4312"})
+
+    def respond(self: "TestIslandInstrumentation", status: int, body: t.Any) -> bytes:
+        FakeIslandHandler.status = status
+        FakeIslandHandler.body = json.dumps(body).encode()
+        return FakeIslandHandler.body
+
+    def test_metrics_recorded(self: "TestIslandInstrumentation") -> None:
+        body: bytes = self.respond(200, {"data": {"playerByUsername": {"username": "Jammy4312"}}})
+        data: dict[str, t.Any] = island_api.client.execute(self.request())
+        self.assertEqual(data, {"playerByUsername": {"username": "Jammy4312"}})
+
+        self.assertEqual(len(self.metrics), 1)
+        metrics: RequestMetrics = self.metrics[0]
+        self.assertEqual(metrics.api, "island")
+        self.assertEqual(metrics.endpoint, "playerName")
+        self.assertEqual(metrics.attempts, 1)
+        self.assertEqual(metrics.status, 200)
+        self.assertEqual(metrics.bytes, len(body))
+        self.assertGreater(metrics.decode_time, 0)
+        self.assertGreater(metrics.total_time, 0)
+        self.assertIsNone(metrics.error)
+
+    def test_error_recorded(self: "TestIslandInstrumentation") -> None:
+        body: bytes = self.respond(503, {"message": "Service Unavailable"})
+        with self.assertRaises(TransportServerError) as context:
+            island_api.client.execute(self.request())
+
+        self.assertEqual(len(self.metrics), 1)
+        metrics: RequestMetrics = self.metrics[0]
+        self.assertEqual(metrics.attempts, 1)
+        self.assertEqual(metrics.status, 503)
+        self.assertEqual(metrics.bytes, len(body))
+        self.assertIs(metrics.error, context.exception)
+
+    def test_not_measured_without_hooks(self: "TestIslandInstrumentation") -> None:
+        island_api.remove_request_hook(self.metrics.append)
+        self.addCleanup(island_api.add_request_hook, self.metrics.append)
+
+        self.respond(200, {"data": {"playerByUsername": None}})
+        data: dict[str, t.Any] = island_api.client.execute(self.request())
+        self.assertEqual(data, {"playerByUsername": None})
+        self.assertIsNone(island_api._metrics.get())
+        self.assertEqual(self.metrics, [])
+
+
+if __name__ == "__main__":
+    unittest.main()